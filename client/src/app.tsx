@@ -7,8 +7,12 @@ import { AnonymizedText } from './components/presenters/AnonymizedText';
 import { ReplacementsView } from './components/presenters/ReplacementsView';
 import { RiskAssessment } from './components/presenters/RiskAssessment';
 import { InsightsView } from './components/presenters/InsightsView';
-import { originalText, isLoading, error, result } from './store/anonymization';
-import { anonymizeText } from './services/api';
+import { originalText, isLoading, error, result, progress, current } from './store/anonymization';
+import {
+  anonymizeTextStream,
+  type AnonymizeProgressEvent,
+  type AnonymizeResponse
+} from './services/api';
 import './style.css';
 
 export function App() {
@@ -22,9 +26,41 @@ export function App() {
 
     isLoading.value = true;
     error.value = null;
+    result.value = null;
+    progress.value = {};
+
+    const handleProgress = (event: AnonymizeProgressEvent) => {
+      switch (event.stage) {
+        case 'entities':
+          progress.value = {
+            ...progress.value,
+            mappings: event.data.mappings as Record<string, string>,
+            iterations: event.iteration
+          };
+          break;
+        case 'anonymized_text':
+          progress.value = {
+            ...progress.value,
+            anonymized_text: event.data.anonymized_text as string
+          };
+          break;
+        case 'validation':
+          progress.value = {
+            ...progress.value,
+            validation: event.data as unknown as AnonymizeResponse['validation']
+          };
+          break;
+        case 'risk_assessment':
+          progress.value = {
+            ...progress.value,
+            risk_assessment: event.data as unknown as AnonymizeResponse['risk_assessment']
+          };
+          break;
+      }
+    };
 
     try {
-      const response = await anonymizeText(originalText.value);
+      const response = await anonymizeTextStream(originalText.value, handleProgress);
       result.value = response;
       // Optionally switch to anonymized tab on success
       setActiveTab('anonymized');
@@ -33,6 +69,7 @@ export function App() {
       console.error('Anonymization error:', err);
     } finally {
       isLoading.value = false;
+      progress.value = null;
     }
   };
 
@@ -42,26 +79,26 @@ export function App() {
         return <OriginalText text={originalText.value} />;
 
       case 'anonymized':
-        return <AnonymizedText text={result.value?.anonymized_text ?? null} />;
+        return <AnonymizedText text={current.value?.anonymized_text ?? null} />;
 
       case 'replacements':
         return (
           <ReplacementsView
-            mappings={result.value?.mappings ?? null}
-            validationIssues={result.value?.validation.issues ?? []}
-            validationPassed={result.value?.validation.passed ?? true}
+            mappings={current.value?.mappings ?? null}
+            validationIssues={current.value?.validation?.issues ?? []}
+            validationPassed={current.value?.validation?.passed ?? true}
           />
         );
 
       case 'risk':
-        return <RiskAssessment assessment={result.value?.risk_assessment ?? null} />;
+        return <RiskAssessment assessment={current.value?.risk_assessment ?? null} />;
 
       case 'insights':
         return (
           <InsightsView
             llmProvider={result.value?.llm_provider ?? null}
             llmModel={result.value?.llm_model ?? null}
-            iterations={result.value?.iterations ?? null}
+            iterations={current.value?.iterations ?? null}
             success={result.value?.success ?? null}
             validationConfidence={result.value?.validation.confidence ?? null}
             riskConfidence={result.value?.risk_assessment.confidence ?? null}
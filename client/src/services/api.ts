@@ -60,3 +60,86 @@ export async function anonymizeText(
 
   return response.json();
 }
+
+export type AnonymizeStage =
+  | 'entities'
+  | 'anonymized_text'
+  | 'validation'
+  | 'risk_assessment';
+
+export interface AnonymizeProgressEvent {
+  stage: AnonymizeStage;
+  iteration: number;
+  data: Record<string, unknown>;
+}
+
+/**
+ * Anonymize text via the server-sent events endpoint.
+ *
+ * onProgress is called as each agent finishes, so partial results can be
+ * rendered before the whole workflow completes. Resolves with the final
+ * response.
+ */
+export async function anonymizeTextStream(
+  text: string,
+  onProgress: (event: AnonymizeProgressEvent) => void,
+  documentId?: string
+): Promise<AnonymizeResponse> {
+  const response = await fetch('/api/v1/anonymize/stream', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'text/event-stream'
+    },
+    body: JSON.stringify({
+      text,
+      document_id: documentId
+    })
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(
+      error.detail || `API error: ${response.status}`
+    );
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += value;
+
+    let boundary: number;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const frame = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = 'message';
+      let data = '';
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) {
+          event = line.slice('event: '.length);
+        } else if (line.startsWith('data: ')) {
+          data += line.slice('data: '.length);
+        }
+      }
+      const payload = JSON.parse(data);
+
+      if (event === 'result') {
+        return payload as AnonymizeResponse;
+      }
+      if (event === 'error') {
+        throw new Error(payload.detail || `API error: ${payload.status_code}`);
+      }
+      const { iteration, ...rest } = payload;
+      onProgress({ stage: event as AnonymizeStage, iteration, data: rest });
+    }
+  }
+
+  throw new Error('Stream ended before the result was received');
+}
@@ -6,6 +6,14 @@ export const isLoading = signal(false);
 export const error = signal<string | null>(null);
 export const result = signal<AnonymizeResponse | null>(null);
 
+// Partial result built from streamed progress events while loading
+export const progress = signal<Partial<AnonymizeResponse> | null>(null);
+
+// Final result if available, otherwise the partial one
+export const current = computed<Partial<AnonymizeResponse> | null>(() =>
+  result.value ?? progress.value
+);
+
 // Helper computed signals
 export const hasValidationIssues = computed(() =>
   (result.value?.validation.issues.length ?? 0) > 0
@@ -48,6 +48,20 @@ app.kubernetes.io/name: {{ include "gdpr-anonymizer.name" . }}
 app.kubernetes.io/instance: {{ .Release.Name }}
 {{- end }}
 
+{{/*
+Name and selector labels of the job StatefulSet (distinct from the
+Deployment's, so the main Service does not select the job pod)
+*/}}
+{{- define "gdpr-anonymizer.jobsFullname" -}}
+{{- printf "%s-jobs" (include "gdpr-anonymizer.fullname" .) | trunc 63 | trimSuffix "-" }}
+{{- end }}
+
+{{- define "gdpr-anonymizer.jobsSelectorLabels" -}}
+app.kubernetes.io/name: {{ printf "%s-jobs" (include "gdpr-anonymizer.name" .) | trunc 63 | trimSuffix "-" }}
+app.kubernetes.io/instance: {{ .Release.Name }}
+app.kubernetes.io/component: jobs
+{{- end }}
+
 {{/*
 Create the name of the service account to use
 */}}
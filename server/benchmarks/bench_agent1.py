@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""Microbenchmarks of Agent 1 response post-processing.
+
+Times the CPU-side steps that run after every Agent 1 LLM call:
+_clean_json_response, _parse_entities, _build_mappings and
+_apply_replacements. Cases cover documents from 1 KB to 10 MB and
+responses from 1 to 10,000 entities, as well-formed, truncated (repaired
+by closing the array) and malformed responses (unescaped quotes, repaired
+by the regular expression fallback). Logging is disabled while timing, so
+only the code itself is measured.
+
+Every case reports the best CPU time per call over several rounds, and
+the time of a fixed pure-Python reference workload measured right before
+it. --check compares case times with a stored baseline, re-measures cases
+that look slower than --threshold, and exits with status 1 if they still
+are. Baselines are meant to be recorded on the machine that runs the
+check; with --normalize, times relative to the reference workload are
+compared instead, which makes a baseline from another machine usable at
+the cost of more noise.
+
+Usage:
+    python benchmarks/bench_agent1.py [--quick] [--output results.json]
+    python benchmarks/bench_agent1.py --save-baseline [--quick]
+    python benchmarks/bench_agent1.py --check [--threshold 0.25] [--quick] [--normalize]
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+sys.path.insert(0, 'src')
+
+from anonymization.infrastructure.agents import Agent1Implementation
+
+from workload import FILLER, git_commit
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "agent1_postprocessing.json"
+
+KB = 1024
+MB = 1024 * KB
+SIZES = [1 * KB, 100 * KB, 1 * MB, 10 * MB]
+ENTITY_COUNTS = [1, 100, 1000, 10000]
+QUICK_SIZES = [1 * KB, 100 * KB, 1 * MB]
+QUICK_ENTITY_COUNTS = [1, 100, 1000]
+VARIANTS = ["clean", "truncated", "malformed"]
+
+# Document characters needed per embedded entity (value plus filler)
+CHARS_PER_ENTITY = 100
+
+# Time budget per measurement round
+ROUND_SECONDS = 0.1
+ROUNDS = 7
+
+
+def make_entities(count: int) -> List[Dict[str, str]]:
+    """Unique entities of the types Agent 1 assigns placeholders to."""
+    entities = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            entities.append({"type": "NAME", "value": f"Alex{i} Meyer"})
+        elif kind == 1:
+            entities.append({"type": "EMAIL", "value": f"user{i}@example.com"})
+        elif kind == 2:
+            entities.append({"type": "PHONE", "value": f"+49 30 {i:07d}"})
+        else:
+            entities.append({"type": "ADDRESS", "value": f"{i} Baker Street"})
+    return entities
+
+
+def make_document(size: int, entities: List[Dict[str, str]]) -> str:
+    """Text of ``size`` characters mentioning every entity once."""
+    parts: List[str] = []
+    length = 0
+    filler = " ".join(FILLER) + " "
+    for entity in entities:
+        mention = f"Contact {entity['value']}. "
+        parts.append(mention)
+        length += len(mention)
+    while length < size:
+        chunk = filler[:size - length]
+        parts.append(chunk)
+        length += len(chunk)
+    # Spread the mentions through the filler
+    step = max(1, len(parts) // max(1, len(entities)))
+    mentions, padding = parts[:len(entities)], parts[len(entities):]
+    text: List[str] = []
+    for index, mention in enumerate(mentions):
+        text.append(mention)
+        text.extend(padding[index * step:(index + 1) * step])
+    text.extend(padding[len(mentions) * step:])
+    return "".join(text)[:size]
+
+
+def make_response(entities: List[Dict[str, str]], variant: str) -> str:
+    """LLM answer listing the entities.
+
+    Args:
+        entities: Entities to list
+        variant: clean (fenced JSON), truncated (cut in the last third) or
+            malformed (every tenth value contains unescaped quotes)
+
+    Returns:
+        Raw response text
+    """
+    if variant == "malformed":
+        items = []
+        for index, entity in enumerate(entities):
+            value = entity["value"]
+            if index % 10 == 0:
+                value = value.replace(" ", ' "the" ', 1)
+            items.append(f'  {{"type": "{entity["type"]}", "value": "{value}"}}')
+        body = "[\n" + ",\n".join(items) + "\n]"
+    else:
+        body = json.dumps(entities, indent=2)
+    if variant == "truncated":
+        body = body[:max(2, len(body) * 5 // 6)]
+    return f"Here are the entities:\n```json\n{body}\n```"
+
+
+def time_call(function: Callable[[], Any]) -> Tuple[float, int]:
+    """Best CPU time per call over several rounds.
+
+    Args:
+        function: Call to time
+
+    Returns:
+        (seconds per call, calls per round)
+    """
+    timer = timeit.Timer(function, timer=time.process_time)
+    start = time.process_time()
+    function()
+    single = time.process_time() - start
+    number = max(1, int(ROUND_SECONDS / single)) if single > 0 else 1000
+    rounds = ROUNDS if single * number * ROUNDS < 30 else 1
+    return min(timer.repeat(repeat=rounds, number=number)) / number, number
+
+
+def _reference_workload() -> None:
+    """Fixed mix of string, JSON and sorting work."""
+    text = "".join(f"Contact user{i}@example.com about ticket {i}. " for i in range(2000))
+    json.loads(json.dumps([{"type": "EMAIL", "value": f"user{i}@example.com"} for i in range(500)]))
+    text.replace("example.com", "[EMAIL]")
+    sorted(range(5000), key=lambda x: -x)
+
+
+def calibrate() -> float:
+    """Seconds taken by the reference workload (current machine speed)."""
+    return time_call(_reference_workload)[0]
+
+
+def cases(sizes: List[int], counts: List[int]) -> Iterator[Tuple[int, int]]:
+    """Document size and entity count pairs that fit together."""
+    for size in sizes:
+        for count in counts:
+            if count * CHARS_PER_ENTITY <= size:
+                yield size, count
+
+
+def run(
+    sizes: List[int],
+    counts: List[int],
+    only: Optional[Set[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Time every step for every case.
+
+    Args:
+        sizes: Document sizes
+        counts: Entity counts
+        only: Case names to time (default all)
+
+    Returns:
+        Case name ("step/variant/size/entities") to timing record
+    """
+    agent = Agent1Implementation(llm_provider=None)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def record(name: str, function: Callable[[], Any]) -> None:
+        if only is not None and name not in only:
+            return
+        reference = calibrate()
+        seconds, number = time_call(function)
+        results[name] = {
+            "seconds_per_call": seconds,
+            "calls_per_round": number,
+            "reference_seconds": reference,
+        }
+        print(f"{name:<48} {seconds * 1000:12.4f} ms  ({seconds / reference:10.3f} x reference)")
+
+    for size, count in cases(sizes, counts):
+        entities = make_entities(count)
+        text = make_document(size, entities)
+        label = f"{_size_label(size)}/{count}"
+
+        for variant in VARIANTS:
+            response = make_response(entities, variant)
+            record(f"clean_json/{variant}/{label}", lambda: agent._clean_json_response(response))
+            record(f"parse_entities/{variant}/{label}", lambda: _parse(agent, response))
+
+        parsed, _ = agent._parse_entities(make_response(entities, "clean"))
+        mappings = agent._build_mappings(parsed)
+        record(f"build_mappings/clean/{label}", lambda: agent._build_mappings(parsed))
+        record(f"apply_replacements/clean/{label}", lambda: agent._apply_replacements(text, mappings))
+
+    return results
+
+
+def check(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+    min_seconds: float,
+    normalize: bool = False
+) -> Dict[str, float]:
+    """Cases slower than the baseline by more than the threshold.
+
+    Args:
+        current: Case results of this run
+        baseline: Case results of the stored baseline
+        threshold: Allowed relative slowdown
+        min_seconds: Cases faster than this are reported but never fail
+            (timer noise dominates them)
+        normalize: Compare times relative to the reference workload
+
+    Returns:
+        Regressed case names and their slowdown
+    """
+    regressions = {}
+    print()
+    for name, record in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        change = _cost(record, normalize) / _cost(before, normalize) - 1
+        regressed = change > threshold and record["seconds_per_call"] >= min_seconds
+        print(f"{name:<48} {change:+8.1%} {'REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions[name] = change
+    return regressions
+
+
+def _cost(record: Dict[str, Any], normalize: bool) -> float:
+    """Case time, relative to its reference workload if normalizing."""
+    if normalize:
+        return record["seconds_per_call"] / record["reference_seconds"]
+    return record["seconds_per_call"]
+
+
+def _parse(agent: Agent1Implementation, response: str) -> Any:
+    """Parse a response; unrepairable responses count with their failure path."""
+    try:
+        return agent._parse_entities(response)
+    except ValueError:
+        return None
+
+
+def _size_label(size: int) -> str:
+    """Human-readable document size."""
+    return f"{size // MB}MB" if size >= MB else f"{size // KB}KB"
+
+
+def main() -> int:
+    """Run the benchmark; returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true",
+                        help="Skip 10 MB documents and 10,000-entity responses")
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as baseline")
+    parser.add_argument("--check", action="store_true", help="Fail on regressions against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before a case counts as regression")
+    parser.add_argument("--min-ms", type=float, default=0.05,
+                        help="Cases faster than this never count as regression")
+    parser.add_argument("--normalize", action="store_true",
+                        help="Compare times relative to the reference workload")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="Times a regressed case is re-measured before failing")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sizes = QUICK_SIZES if args.quick else SIZES
+    counts = QUICK_ENTITY_COUNTS if args.quick else ENTITY_COUNTS
+
+    results = {
+        "meta": {
+            "benchmark": "agent1_postprocessing",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": run(sizes, counts),
+    }
+
+    regressions: Dict[str, float] = {}
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = check(
+            results["results"], baseline, args.threshold, args.min_ms / 1000, args.normalize)
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            # Keep the better measurement of each suspected case
+            print(f"\nRe-measuring {len(regressions)} case(s)")
+            for name, record in run(sizes, counts, only=set(regressions)).items():
+                if _cost(record, args.normalize) < _cost(results["results"][name], args.normalize):
+                    results["results"][name] = record
+            regressions = check(
+                {name: results["results"][name] for name in regressions},
+                baseline, args.threshold, args.min_ms / 1000, args.normalize)
+
+    for path in filter(None, [args.output, args.baseline if args.save_baseline else None]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {path}")
+
+    if args.check:
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}:")
+            for name, change in regressions.items():
+                print(f"  {name}: {change:+.1%}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
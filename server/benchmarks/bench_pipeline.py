@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of the anonymization pipeline on the fake LLM provider.
+
+Measures throughput and latency of AnonymizationOrchestrator and of the
+FastAPI app (POST /api/v1/anonymize through an in-process ASGI client)
+across document sizes and concurrency levels. The fake provider (see
+FakeLLMAdapter) answers the agent prompts with realistic entity JSON and
+validation verdicts, with configurable latency and failure rates, so runs
+need no model and are reproducible.
+
+With --record, the LLM calls of the run are written to a cassette; with
+--replay, they are answered from one instead (see ReplayLLMProvider). A
+cassette recorded against a live model (llm.cassette in config.yaml)
+over a production-like --corpus replays the same answers through new
+agent and orchestrator versions, so their CPU time and latency can be
+compared exactly.
+
+Results, including process CPU time per scenario, are written as JSON.
+Pass an earlier result file with --compare to print the change of every
+scenario.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 500 2000 8000] [--concurrency 1 4 16]
+        [--documents 32] [--latency-mean 0.05] [--malformed-rate 0.02]
+        [--corpus documents.jsonl] [--record cassette.jsonl.gz | --replay cassette.jsonl.gz]
+        [--output benchmarks/results/pipeline.json] [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, 'src')
+
+import httpx
+
+from anonymization.application.config import (
+    AgentConfig,
+    AppConfig,
+    CassetteConfig,
+    FakeLLMConfig,
+    LLMConfig,
+    OrchestrationConfig
+)
+from anonymization.application.orchestrator import AnonymizationOrchestrator
+from anonymization.domain.models import Document
+from anonymization.infrastructure.adapters.llm import create_llm_provider
+from anonymization.infrastructure.agents import (
+    Agent1Implementation,
+    Agent2Implementation,
+    Agent3Implementation
+)
+from anonymization.interfaces.rest.dependencies import get_config, get_orchestrator
+from anonymization.interfaces.rest.main import app
+from workload import git_commit, latency_summary, make_document
+
+
+def make_config(args: argparse.Namespace) -> AppConfig:
+    """Application configuration using the fake provider."""
+    return AppConfig(
+        llm=LLMConfig(
+            provider="fake",
+            model="fake",
+            max_concurrency=args.llm_concurrency,
+            fake=FakeLLMConfig(
+                latency_distribution=args.latency_distribution,
+                latency_mean_seconds=args.latency_mean,
+                latency_stddev_seconds=args.latency_stddev,
+                latency_per_1k_chars_seconds=args.latency_per_1k_chars,
+                truncation_rate=args.truncation_rate,
+                malformed_rate=args.malformed_rate,
+                miss_rate=args.miss_rate,
+                seed=args.seed
+            ),
+            cassette=CassetteConfig(
+                mode="replay" if args.replay else "record" if args.record else None,
+                path=str(args.replay or args.record or CassetteConfig().path),
+                replay_latency=args.replay_latency
+            )
+        ),
+        agent1=AgentConfig(name="ANON-EXEC"),
+        agent2=AgentConfig(name="DIRECT-CHECK"),
+        agent3=AgentConfig(name="RISK-ASSESS"),
+        orchestration=OrchestrationConfig()
+    )
+
+
+def make_provider(config: AppConfig) -> Any:
+    """Fake (or cassette) LLM provider shared by all scenarios."""
+    llm_config: Dict[str, Any] = {
+        "model": config.llm.model,
+        "max_concurrency": config.llm.max_concurrency,
+        "fake": config.llm.fake.model_dump(),
+    }
+    if config.llm.cassette.mode:
+        llm_config["cassette"] = config.llm.cassette.model_dump()
+    return create_llm_provider(config.llm.provider, llm_config)
+
+
+def make_orchestrator(config: AppConfig, provider: Any) -> AnonymizationOrchestrator:
+    """Orchestrator on the given provider (no result cache)."""
+    return AnonymizationOrchestrator(
+        agent1=Agent1Implementation(provider),
+        agent2=Agent2Implementation(provider),
+        agent3=Agent3Implementation(),
+        max_iterations=config.orchestration.max_iterations
+    )
+
+
+async def run_scenario(
+    call: Callable[[str], Awaitable[Optional[int]]],
+    documents: List[str],
+    concurrency: int
+) -> Dict[str, Any]:
+    """Process documents with a fixed number of concurrent callers.
+
+    Args:
+        call: Processes one document; returns its iteration count, or None on failure
+        documents: Documents to process
+        concurrency: Concurrent callers
+
+    Returns:
+        Throughput, latency percentiles, CPU time, iterations and failures
+    """
+    queue = list(reversed(documents))
+    latencies: List[float] = []
+    iterations: List[int] = []
+    failures = 0
+
+    async def caller() -> None:
+        nonlocal failures
+        while queue:
+            text = queue.pop()
+            start = time.perf_counter()
+            try:
+                result = await call(text)
+            except Exception:
+                result = None
+            latencies.append(time.perf_counter() - start)
+            if result is None:
+                failures += 1
+            else:
+                iterations.append(result)
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    cpu = time.process_time() - cpu_start
+    elapsed = time.perf_counter() - start
+
+    return {
+        "documents": len(documents),
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_docs_per_second": round(len(documents) / elapsed, 3),
+        "latency_ms": latency_summary(latencies),
+        "cpu_seconds": round(cpu, 4),
+        "cpu_ms_per_doc": round(cpu * 1000 / len(documents), 3),
+        "avg_iterations": round(statistics.fmean(iterations), 3) if iterations else None,
+        "failures": failures,
+    }
+
+
+async def bench_orchestrator(
+    config: AppConfig,
+    provider: Any,
+    documents: List[str],
+    concurrency: int
+) -> Dict[str, Any]:
+    """Benchmark the orchestrator directly."""
+    orchestrator = make_orchestrator(config, provider)
+
+    async def call(text: str) -> Optional[int]:
+        result = await orchestrator.anonymize_document(Document(content=text))
+        return result.iterations
+
+    return await run_scenario(call, documents, concurrency)
+
+
+async def bench_api(
+    config: AppConfig,
+    provider: Any,
+    documents: List[str],
+    concurrency: int
+) -> Dict[str, Any]:
+    """Benchmark POST /api/v1/anonymize through an in-process ASGI client."""
+    orchestrator = make_orchestrator(config, provider)
+    app.dependency_overrides[get_config] = lambda: config
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+            async def call(text: str) -> Optional[int]:
+                response = await client.post("/api/v1/anonymize", json={"text": text})
+                if response.status_code != 200 or not response.json()["iterations"]:
+                    return None
+                return response.json()["iterations"]
+
+            return await run_scenario(call, documents, concurrency)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def compare(current: Dict[str, Any], previous_path: Path) -> None:
+    """Print throughput and p95 changes against an earlier result file."""
+    previous = json.loads(previous_path.read_text())
+    baseline = {
+        (row["target"], row["doc_chars"], row["concurrency"]): row
+        for row in previous["results"]
+    }
+    print(f"\nCompared with {previous_path} (commit {previous['meta'].get('git_commit')}):")
+    for row in current["results"]:
+        before = baseline.get((row["target"], row["doc_chars"], row["concurrency"]))
+        if before is None:
+            continue
+        throughput = row["throughput_docs_per_second"] / before["throughput_docs_per_second"] - 1
+        p95 = row["latency_ms"]["p95"] / before["latency_ms"]["p95"] - 1
+        line = (f"{row['target']:>12} {row['doc_chars']:>6} chars x{row['concurrency']:<3} "
+                f"throughput {throughput:+7.1%}  p95 {p95:+7.1%}")
+        if before.get("cpu_ms_per_doc"):
+            line += f"  cpu/doc {row['cpu_ms_per_doc'] / before['cpu_ms_per_doc'] - 1:+7.1%}"
+        print(line)
+
+
+def load_corpus(path: Path) -> List[str]:
+    """Documents of a corpus: a directory of .txt files or a JSONL file of {"text": ...}."""
+    if path.is_dir():
+        return [file.read_text() for file in sorted(path.glob("*.txt"))]
+    with open(path) as f:
+        return [json.loads(line)["text"] for line in f if line.strip()]
+
+
+async def main() -> None:
+    """Run every scenario and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000],
+                        help="Document sizes in characters")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="Concurrent callers")
+    parser.add_argument("--documents", type=int, default=32, help="Documents per scenario")
+    parser.add_argument("--targets", nargs="+", choices=["orchestrator", "api"],
+                        default=["orchestrator", "api"], help="What to benchmark")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="llm.max_concurrency")
+    parser.add_argument("--latency-distribution", default="lognormal",
+                        choices=["fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--latency-mean", type=float, default=0.05, help="Mean LLM latency (s)")
+    parser.add_argument("--latency-stddev", type=float, default=0.02, help="LLM latency stddev (s)")
+    parser.add_argument("--latency-per-1k-chars", type=float, default=0.01,
+                        help="Extra LLM latency per 1000 prompt characters (s)")
+    parser.add_argument("--truncation-rate", type=float, default=0.02)
+    parser.add_argument("--malformed-rate", type=float, default=0.02)
+    parser.add_argument("--miss-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus", type=Path, default=None,
+                        help="Benchmark these documents instead of generated ones")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", type=Path, default=None, help="Record LLM calls to a cassette")
+    cassette.add_argument("--replay", type=Path, default=None, help="Answer LLM calls from a cassette")
+    parser.add_argument("--replay-latency", action="store_true",
+                        help="Wait the recorded latencies when replaying")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Result file (default benchmarks/results/pipeline-<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier result file")
+    args = parser.parse_args()
+
+    config = make_config(args)
+    provider = make_provider(config)
+    benches = {"orchestrator": bench_orchestrator, "api": bench_api}
+    if args.corpus is not None:
+        workloads = [("corpus", load_corpus(args.corpus))]
+    else:
+        workloads = []
+        for size in args.sizes:
+            rng = random.Random(f"{args.seed}:{size}")
+            workloads.append((size, [make_document(size, rng) for _ in range(args.documents)]))
+
+    rows = []
+    for size, documents in workloads:
+        for concurrency in args.concurrency:
+            for target in args.targets:
+                row = await benches[target](config, provider, documents, concurrency)
+                row = {"target": target, "doc_chars": size, "concurrency": concurrency, **row}
+                rows.append(row)
+                print(f"{target:>12} {size:>6} chars x{concurrency:<3} "
+                      f"{row['throughput_docs_per_second']:8.2f} docs/s  "
+                      f"p50 {row['latency_ms']['p50']:8.1f} ms  "
+                      f"p95 {row['latency_ms']['p95']:8.1f} ms  "
+                      f"cpu/doc {row['cpu_ms_per_doc']:7.1f} ms  "
+                      f"iterations {row['avg_iterations']}  failures {row['failures']}")
+    await provider.close()
+
+    now = datetime.now(UTC)
+    results = {
+        "meta": {
+            "benchmark": "pipeline",
+            "timestamp": now.isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fake_llm": config.llm.fake.model_dump(),
+            "cassette": config.llm.cassette.model_dump() if config.llm.cassette.mode else None,
+            "corpus": str(args.corpus) if args.corpus else None,
+            "llm_max_concurrency": config.llm.max_concurrency,
+            "documents_per_scenario": args.documents,
+        },
+        "results": rows,
+    }
+
+    output = args.output or Path("benchmarks/results") / f"pipeline-{now:%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
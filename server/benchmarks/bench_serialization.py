@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Benchmark of REST response construction and serialization.
+
+Compares the per-request CPU time of the previous path (validated
+construction of every response model, FastAPI response_model validation
+and jsonable_encoder + json.dumps) with the current one
+(model_construct and a single pydantic serialization pass).
+
+Usage:
+    python benchmarks/bench_serialization.py [--mappings 2000] [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, UTC
+
+sys.path.insert(0, 'src')
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from anonymization.application.config import AppConfig, LLMConfig, AgentConfig, OrchestrationConfig
+from anonymization.application.orchestrator import AnonymizationResult
+from anonymization.domain.models import (
+    AnonymizationMapping,
+    Document,
+    RiskAssessment,
+    ValidationIssue,
+    ValidationResult
+)
+from anonymization.interfaces.rest.routers.anonymization import build_response
+from anonymization.interfaces.rest.schemas import (
+    AnonymizeRequest,
+    AnonymizeResponse,
+    RiskAssessmentResponse,
+    ValidationIssueResponse,
+    ValidationResponse
+)
+from anonymization.interfaces.rest.serialization import ModelJSONResponse
+
+
+def make_result(mappings: int) -> AnonymizationResult:
+    """Build a large orchestrator result."""
+    mapping = {f"Person Number {i}": f"[NAME_{i}]" for i in range(mappings)}
+    text = " ".join(f"Contact [NAME_{i}] about the case." for i in range(mappings))
+    issues = [
+        ValidationIssue(
+            identifier_type="NAME",
+            value=f"Residual {i}",
+            context=f"... Residual {i} ...",
+            location_hint="paragraph"
+        )
+        for i in range(50)
+    ]
+    return AnonymizationResult(
+        document=Document(content=text),
+        anonymizationMapping=AnonymizationMapping(
+            original_text=text,
+            anonymized_text=text,
+            mappings=mapping
+        ),
+        validation=ValidationResult(
+            passed=False,
+            issues=issues,
+            reasoning="Residual names found",
+            confidence=0.8
+        ),
+        risk_assessment=RiskAssessment(
+            overall_score=12,
+            risk_level="MEDIUM",
+            gdpr_compliant=False,
+            confidence=0.7,
+            reasoning="Quasi-identifiers remain",
+            assessment_date=datetime.now(UTC),
+            dimension_scores={"direct_identifier": 3, "quasi_identifier": 3}
+        ),
+        iterations=2,
+        success=False
+    )
+
+
+def legacy_build(request: AnonymizeRequest, result: AnonymizationResult, config: AppConfig) -> AnonymizeResponse:
+    """Previous response construction: every model validated."""
+    return AnonymizeResponse(
+        document_id=request.document_id,
+        anonymized_text=result.anonymizationMapping.anonymized_text,
+        mappings=result.anonymizationMapping.mappings,
+        validation=ValidationResponse(
+            passed=result.validation.passed,
+            issues=[
+                ValidationIssueResponse(
+                    identifier_type=issue.identifier_type,
+                    value=issue.value,
+                    context=issue.context,
+                    location_hint=issue.location_hint
+                )
+                for issue in result.validation.issues
+            ],
+            reasoning=result.validation.reasoning,
+            confidence=result.validation.confidence
+        ),
+        risk_assessment=RiskAssessmentResponse(
+            overall_score=result.risk_assessment.overall_score,
+            risk_level=result.risk_assessment.risk_level,
+            gdpr_compliant=result.risk_assessment.gdpr_compliant,
+            confidence=result.risk_assessment.confidence,
+            reasoning=result.risk_assessment.reasoning,
+            assessment_date=result.risk_assessment.assessment_date,
+            dimension_scores=result.risk_assessment.dimension_scores
+        ),
+        iterations=result.iterations,
+        success=result.success,
+        llm_provider=config.llm.provider,
+        llm_model=config.llm.model,
+        error="[]"
+    )
+
+
+async def legacy_path(request, result, config, field) -> bytes:
+    """Validated construction, response_model validation, stdlib encoder."""
+    response = legacy_build(request, result, config)
+    content = await serialize_response(field=field, response_content=response)
+    return JSONResponse(content).body
+
+
+async def fast_path(request, result, config, field) -> bytes:
+    """model_construct and a single pydantic serialization pass."""
+    return ModelJSONResponse(build_response(request, result, config)).body
+
+
+async def measure(path, iterations: int, *args) -> float:
+    """Average CPU milliseconds per call."""
+    await path(*args)
+    start = time.process_time()
+    for _ in range(iterations):
+        await path(*args)
+    return (time.process_time() - start) / iterations * 1000
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=2000, help="Entries in the mapping dict")
+    parser.add_argument("--iterations", type=int, default=200, help="Requests per path")
+    args = parser.parse_args()
+
+    config = AppConfig(
+        llm=LLMConfig(provider="ollama", model="bench"),
+        agent1=AgentConfig(name="ANON-EXEC"),
+        agent2=AgentConfig(name="DIRECT-CHECK"),
+        agent3=AgentConfig(name="RISK-ASSESS"),
+        orchestration=OrchestrationConfig()
+    )
+    request = AnonymizeRequest(text="benchmark", document_id="bench-1")
+    result = make_result(args.mappings)
+    field = create_response_field(name="response", type_=AnonymizeResponse)
+
+    legacy_body = await legacy_path(request, result, config, field)
+    fast_body = await fast_path(request, result, config, field)
+
+    legacy_ms = await measure(legacy_path, args.iterations, request, result, config, field)
+    fast_ms = await measure(fast_path, args.iterations, request, result, config, field)
+
+    print(f"Mappings: {args.mappings}, response size: {len(fast_body) / 1024:.0f} KiB "
+          f"(legacy {len(legacy_body) / 1024:.0f} KiB)")
+    print(f"legacy: {legacy_ms:8.3f} ms CPU/request")
+    print(f"fast:   {fast_ms:8.3f} ms CPU/request")
+    print(f"speed-up: {legacy_ms / fast_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
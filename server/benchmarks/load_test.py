@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Load generator for a running anonymization server.
+
+Drives POST /api/v1/anonymize and POST /api/v1/anonymize/batch over HTTP
+and reports latency percentiles, throughput and status codes per endpoint.
+Two load models are supported:
+    - closed loop (default): --concurrency callers, each sending its next
+      request when the previous one returns
+    - open loop (--rate): requests arrive as a Poisson process at the given
+      rate regardless of how fast the server answers; latency is measured
+      from the scheduled arrival, so queueing is not hidden
+
+Runs against a server whose LLM is the Ollama stub (benchmarks/ollama_stub.py)
+need no GPU or network. Configure llm.provider: ollama,
+llm.ollama.base_url: http://127.0.0.1:11434 and pass llm.model (e.g. the
+example's "qwen3:14b") to the stub as --model, so the readiness probe finds
+it in /api/tags and /health/ready reports 200 during the test:
+    python benchmarks/ollama_stub.py --port 11434 --model qwen3:14b &
+    python run_api.py
+    python benchmarks/load_test.py --duration 60 --concurrency 16
+
+Usage:
+    python benchmarks/load_test.py [--base-url http://127.0.0.1:8000]
+        [--endpoints anonymize batch] [--concurrency 8 | --rate 5]
+        [--duration 30 | --requests 200] [--doc-chars 1500] [--batch-size 5]
+        [--header X-API-Key:secret] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import time
+from collections import Counter
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from workload import git_commit, latency_summary, make_document
+
+PATHS = {
+    "anonymize": "/api/v1/anonymize",
+    "batch": "/api/v1/anonymize/batch",
+}
+
+
+class LoadStats:
+    """Outcomes of the requests sent to one endpoint."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.documents = 0
+
+    def record(self, latency: float, status: str, documents: int) -> None:
+        """Record one request."""
+        self.latencies.append(latency)
+        self.statuses[status] += 1
+        if status == "200":
+            self.documents += documents
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """Latency percentiles, throughput and status codes."""
+        return {
+            "requests": len(self.latencies),
+            "throughput_requests_per_second": round(len(self.latencies) / elapsed, 3),
+            "throughput_docs_per_second": round(self.documents / elapsed, 3),
+            "latency_ms": latency_summary(self.latencies),
+            "statuses": dict(self.statuses),
+        }
+
+
+class LoadGenerator:
+    """Sends a request mix to the server and collects the outcomes."""
+
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace) -> None:
+        """Initialize the generator.
+
+        Args:
+            client: HTTP client bound to the server
+            args: Command line options
+        """
+        self.client = client
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.stats = {endpoint: LoadStats() for endpoint in args.endpoints}
+        self.sent = 0
+        self.deadline = time.perf_counter() + args.duration if args.duration else None
+
+    def more(self) -> bool:
+        """Whether another request should be sent."""
+        if self.args.requests is not None and self.sent >= self.args.requests:
+            return False
+        return self.deadline is None or time.perf_counter() < self.deadline
+
+    async def send(self, scheduled: Optional[float] = None) -> None:
+        """Send one request of the mix.
+
+        Args:
+            scheduled: Arrival time in open-loop mode; latency is measured from it
+        """
+        self.sent += 1
+        endpoint = self.rng.choice(self.args.endpoints)
+        documents = self.args.batch_size if endpoint == "batch" else 1
+        texts = [make_document(self.args.doc_chars, self.rng) for _ in range(documents)]
+        body: Dict[str, Any] = (
+            {"documents": [{"text": text} for text in texts]} if endpoint == "batch"
+            else {"text": texts[0]}
+        )
+
+        start = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            response = await self.client.post(PATHS[endpoint], json=body)
+            status = str(response.status_code)
+        except httpx.TimeoutException:
+            status = "timeout"
+        except httpx.TransportError as e:
+            status = type(e).__name__
+        self.stats[endpoint].record(time.perf_counter() - start, status, documents)
+
+    async def closed_loop(self) -> None:
+        """Keep --concurrency requests in flight."""
+        async def caller() -> None:
+            while self.more():
+                await self.send()
+
+        await asyncio.gather(*(caller() for _ in range(self.args.concurrency)))
+
+    async def open_loop(self) -> None:
+        """Send requests at Poisson arrival times."""
+        tasks = set()
+        next_arrival = time.perf_counter()
+        while self.more():
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(self.send(scheduled=next_arrival))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_arrival += self.rng.expovariate(self.args.rate)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+def parse_headers(values: List[str]) -> Dict[str, str]:
+    """Parse repeated NAME:VALUE options."""
+    headers = {}
+    for value in values:
+        name, _, content = value.partition(":")
+        headers[name.strip()] = content.strip()
+    return headers
+
+
+async def main() -> None:
+    """Run the load test and report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoints", nargs="+", choices=sorted(PATHS), default=["anonymize"],
+                        help="Endpoints, picked uniformly per request")
+    parser.add_argument("--concurrency", type=int, default=8, help="Closed-loop callers")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Open-loop arrival rate (requests per second)")
+    parser.add_argument("--duration", type=float, default=None, help="Test duration (s)")
+    parser.add_argument("--requests", type=int, default=None, help="Number of requests")
+    parser.add_argument("--doc-chars", type=int, default=1500, help="Document size")
+    parser.add_argument("--batch-size", type=int, default=5, help="Documents per batch request")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Request timeout (s)")
+    parser.add_argument("--header", action="append", default=[],
+                        help="Extra header NAME:VALUE (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results here")
+    args = parser.parse_args()
+    if args.duration is None and args.requests is None:
+        args.duration = 30.0
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        timeout=args.timeout,
+        limits=limits,
+        headers=parse_headers(args.header)
+    ) as client:
+        generator = LoadGenerator(client, args)
+        start = time.perf_counter()
+        if args.rate:
+            await generator.open_loop()
+        else:
+            await generator.closed_loop()
+        elapsed = time.perf_counter() - start
+
+    results = {
+        "meta": {
+            "benchmark": "load_test",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "endpoints": {
+            endpoint: stats.summary(elapsed) for endpoint, stats in generator.stats.items()
+        },
+    }
+
+    for endpoint, summary in results["endpoints"].items():
+        latency = summary["latency_ms"]
+        print(f"{endpoint:>10}: {summary['requests']} requests, "
+              f"{summary['throughput_requests_per_second']:.2f} req/s, "
+              f"{summary['throughput_docs_per_second']:.2f} docs/s")
+        if latency:
+            print(f"{'':>12}latency ms  p50 {latency['p50']:.1f}  p90 {latency['p90']:.1f}  "
+                  f"p95 {latency['p95']:.1f}  p99 {latency['p99']:.1f}  max {latency['max']:.1f}")
+        print(f"{'':>12}statuses    {summary['statuses']}")
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
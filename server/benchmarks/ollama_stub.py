@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""Ollama-compatible stub server for load testing without a GPU.
+
+Speaks the parts of the Ollama HTTP API the server uses (POST /api/generate,
+streaming and non-streaming, plus GET /api/tags and /api/version), so the
+real OllamaAdapter, its HTTP client and connection handling can be driven
+at load. Point llm.base_url (or OLLAMA_HOST) at the stub.
+
+Answers are generated by the fake LLM provider (entity JSON for Agent 1,
+validation verdicts for Agent 2, with optional malformed, truncated and
+missed-entity answers) or taken in rotation from a script file. The stub
+simulates:
+    - prompt processing latency (--latency-mean/--latency-stddev/--latency-per-1k-chars)
+    - token generation speed (--tokens-per-second), with a share of slow
+      streams (--slow-stream-rate/--slow-tokens-per-second)
+    - Ollama's parallel slots and request queue (--num-parallel/--max-queue):
+      requests beyond the queue get 503 "server busy" like OLLAMA_MAX_QUEUE
+    - server errors (--error-rate), answered with 500 and an Ollama error body
+
+GET /stub/stats reports request, throttle and error counts.
+
+The stub serves any model name it is asked for and lists it in /api/tags
+once requested (the server's warm-up requests the configured llm.model), so
+the readiness probe finds it. With --model, only that model is listed and
+served; other names get 404 like a model that was not pulled.
+
+Usage:
+    python benchmarks/ollama_stub.py [--port 11434] [--model qwen3:14b]
+        [--num-parallel 4] [--max-queue 64] [--latency-mean 0.3]
+        [--tokens-per-second 40] [--error-rate 0.01] [--script responses.json]
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+sys.path.insert(0, 'src')
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from anonymization.infrastructure.adapters.llm import FakeLLMAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Characters per simulated token
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class StubSettings:
+    """Behaviour of the stub server.
+
+    Attributes:
+        latency_distribution: Prompt processing latency distribution
+            (fixed, uniform, normal, lognormal)
+        latency_mean_seconds: Mean prompt processing latency
+        latency_stddev_seconds: Standard deviation of that latency
+        latency_per_1k_chars_seconds: Extra latency per 1000 prompt characters
+        tokens_per_second: Token generation speed
+        slow_stream_rate: Share of responses generated at slow_tokens_per_second
+        slow_tokens_per_second: Token speed of slow responses
+        num_parallel: Requests processed at the same time (OLLAMA_NUM_PARALLEL)
+        max_queue: Requests waiting for a slot before 503 (OLLAMA_MAX_QUEUE)
+        error_rate: Share of requests answered with 500
+        truncation_rate: Share of truncated answers
+        malformed_rate: Share of answers that are not valid JSON
+        miss_rate: Share of Agent 1 answers missing one entity
+        seed: Random seed
+        script: Answers returned in rotation instead of generated ones
+        model: Only model served and listed (None: any requested model)
+    """
+    latency_distribution: str = "lognormal"
+    latency_mean_seconds: float = 0.0
+    latency_stddev_seconds: float = 0.0
+    latency_per_1k_chars_seconds: float = 0.0
+    tokens_per_second: float = 0.0
+    slow_stream_rate: float = 0.0
+    slow_tokens_per_second: float = 2.0
+    num_parallel: int = 4
+    max_queue: int = 512
+    error_rate: float = 0.0
+    truncation_rate: float = 0.0
+    malformed_rate: float = 0.0
+    miss_rate: float = 0.0
+    seed: int = 0
+    script: Optional[List[str]] = None
+    model: Optional[str] = None
+
+
+class OllamaStub:
+    """State of the stub: answer generation, slots and counters."""
+
+    def __init__(self, settings: StubSettings) -> None:
+        """Initialize the stub.
+
+        Args:
+            settings: Stub behaviour
+        """
+        self.settings = settings
+        # Latency is simulated by the stub, so the fake answers come back at once
+        self.answers = FakeLLMAdapter(
+            model="stub",
+            truncation_rate=settings.truncation_rate,
+            malformed_rate=settings.malformed_rate,
+            miss_rate=settings.miss_rate,
+            seed=settings.seed
+        )
+        self.timing = FakeLLMAdapter(
+            latency_distribution=settings.latency_distribution,
+            latency_mean_seconds=settings.latency_mean_seconds,
+            latency_stddev_seconds=settings.latency_stddev_seconds,
+            latency_per_1k_chars_seconds=settings.latency_per_1k_chars_seconds
+        )
+        self.rng = random.Random(settings.seed)
+        self.slots = asyncio.Semaphore(settings.num_parallel)
+        self.waiting = 0
+        self.in_flight = 0
+        self.script_index = 0
+        # Models listed by /api/tags
+        self.models = {settings.model or "stub"}
+        self.counters: Dict[str, int] = {
+            "requests": 0,
+            "completed": 0,
+            "throttled": 0,
+            "errors": 0,
+            "slow_streams": 0,
+            "disconnects": 0,
+        }
+
+    async def answer(self, prompt: str) -> str:
+        """Text answer to a prompt."""
+        script = self.settings.script
+        if script:
+            text = script[self.script_index % len(script)]
+            self.script_index += 1
+            return text
+        # A fresh context keeps the fake call out of an in-process caller's
+        # LLM usage scope (when served over ASGITransport in tests)
+        return await asyncio.create_task(
+            self.answers.generate(prompt), context=contextvars.Context())
+
+    def prompt_latency(self, prompt: str) -> float:
+        """Simulated prompt processing time."""
+        return self.timing.sample_latency(self.rng, len(prompt))
+
+    def token_delay(self) -> float:
+        """Delay between tokens of a response (0 for instant generation)."""
+        if self.rng.random() < self.settings.slow_stream_rate:
+            self.counters["slow_streams"] += 1
+            return 1.0 / self.settings.slow_tokens_per_second
+        if self.settings.tokens_per_second <= 0:
+            return 0.0
+        return 1.0 / self.settings.tokens_per_second
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current load."""
+        return {
+            **self.counters,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "settings": {k: v for k, v in asdict(self.settings).items() if k != "script"},
+            "scripted": bool(self.settings.script),
+        }
+
+
+def create_app(settings: Optional[StubSettings] = None) -> FastAPI:
+    """Build the stub application.
+
+    Args:
+        settings: Stub behaviour (defaults: instant, error-free answers)
+
+    Returns:
+        FastAPI application; ``app.state.stub`` holds the OllamaStub
+    """
+    stub = OllamaStub(settings or StubSettings())
+    app = FastAPI(title="Ollama stub")
+    app.state.stub = stub
+
+    @app.get("/")
+    async def root() -> Any:
+        return JSONResponse("Ollama is running")
+
+    @app.get("/api/version")
+    async def version() -> Dict[str, str]:
+        return {"version": "0.0.0-stub"}
+
+    @app.get("/api/tags")
+    async def tags() -> Dict[str, Any]:
+        return {"models": [
+            {"name": name, "model": name, "size": 0} for name in sorted(stub.models)]}
+
+    @app.get("/stub/stats")
+    async def stats() -> Dict[str, Any]:
+        return stub.stats()
+
+    @app.post("/api/generate")
+    async def generate(request: Request) -> Any:
+        body = await request.json()
+        model = body.get("model") or ""
+        prompt = body.get("prompt") or ""
+        # Ollama streams unless told otherwise
+        stream = body.get("stream", True)
+        stub.counters["requests"] += 1
+
+        if not model:
+            return JSONResponse({"error": "model is required"}, status_code=400)
+        if stub.settings.model is not None and model not in (
+                stub.settings.model, f"{stub.settings.model}:latest"):
+            return JSONResponse(
+                {"error": f"model '{model}' not found, try pulling it first"}, status_code=404)
+        stub.models.add(model)
+        if stub.waiting >= stub.settings.max_queue:
+            stub.counters["throttled"] += 1
+            return JSONResponse(
+                {"error": "server busy, please try again.  maximum pending requests exceeded"},
+                status_code=503
+            )
+
+        stub.waiting += 1
+        try:
+            await stub.slots.acquire()
+        finally:
+            stub.waiting -= 1
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                stub.in_flight -= 1
+                stub.slots.release()
+
+        stub.in_flight += 1
+        try:
+            start = time.perf_counter_ns()
+            if stub.rng.random() < stub.settings.error_rate:
+                stub.counters["errors"] += 1
+                release()
+                return JSONResponse({"error": "llama runner process has terminated"}, status_code=500)
+
+            if not prompt:
+                # Model load request (warm-up)
+                release()
+                stub.counters["completed"] += 1
+                return _final_chunk(model, "", start, 0, 0, done_reason="load")
+
+            await asyncio.sleep(stub.prompt_latency(prompt))
+            text = await stub.answer(prompt)
+            prompt_eval_ns = time.perf_counter_ns() - start
+            tokens = [text[i:i + CHARS_PER_TOKEN] for i in range(0, len(text), CHARS_PER_TOKEN)]
+            delay = stub.token_delay()
+        except BaseException:
+            release()
+            raise
+
+        if not stream:
+            try:
+                await asyncio.sleep(delay * len(tokens))
+            finally:
+                release()
+            stub.counters["completed"] += 1
+            return _final_chunk(model, text, start, len(prompt) // CHARS_PER_TOKEN, len(tokens),
+                                prompt_eval_ns=prompt_eval_ns)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                for token in tokens:
+                    if delay:
+                        await asyncio.sleep(delay)
+                    yield _line({"model": model, "created_at": _now(), "response": token, "done": False})
+                yield _line(_final_chunk(model, "", start, len(prompt) // CHARS_PER_TOKEN, len(tokens),
+                                         prompt_eval_ns=prompt_eval_ns))
+                stub.counters["completed"] += 1
+            except asyncio.CancelledError:
+                stub.counters["disconnects"] += 1
+                raise
+            finally:
+                release()
+
+        return StreamingResponse(chunks(), media_type=NDJSON_MEDIA_TYPE)
+
+    return app
+
+
+def _final_chunk(
+    model: str,
+    text: str,
+    start_ns: int,
+    prompt_tokens: int,
+    output_tokens: int,
+    prompt_eval_ns: int = 0,
+    done_reason: str = "stop"
+) -> Dict[str, Any]:
+    """Last (or only) response object of a generate call."""
+    total_ns = time.perf_counter_ns() - start_ns
+    return {
+        "model": model,
+        "created_at": _now(),
+        "response": text,
+        "done": True,
+        "done_reason": done_reason,
+        "context": [],
+        "total_duration": total_ns,
+        "load_duration": 0,
+        "prompt_eval_count": prompt_tokens,
+        "prompt_eval_duration": prompt_eval_ns,
+        "eval_count": output_tokens,
+        "eval_duration": max(0, total_ns - prompt_eval_ns),
+    }
+
+
+def _line(obj: Dict[str, Any]) -> bytes:
+    """Encode one NDJSON line."""
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def _now() -> str:
+    """Timestamp in Ollama's format."""
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+def main() -> None:
+    """Run the stub server."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--model", default=None,
+                        help="Only model served and listed (default: any requested model)")
+    parser.add_argument("--latency-distribution", default="lognormal",
+                        choices=["fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--latency-mean", type=float, default=0.3, help="Mean prompt latency (s)")
+    parser.add_argument("--latency-stddev", type=float, default=0.1, help="Prompt latency stddev (s)")
+    parser.add_argument("--latency-per-1k-chars", type=float, default=0.05,
+                        help="Extra prompt latency per 1000 characters (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=40.0)
+    parser.add_argument("--slow-stream-rate", type=float, default=0.0)
+    parser.add_argument("--slow-tokens-per-second", type=float, default=2.0)
+    parser.add_argument("--num-parallel", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=512)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--truncation-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--miss-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", type=Path, default=None,
+                        help="JSON list of answers returned in rotation")
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        latency_distribution=args.latency_distribution,
+        latency_mean_seconds=args.latency_mean,
+        latency_stddev_seconds=args.latency_stddev,
+        latency_per_1k_chars_seconds=args.latency_per_1k_chars,
+        tokens_per_second=args.tokens_per_second,
+        slow_stream_rate=args.slow_stream_rate,
+        slow_tokens_per_second=args.slow_tokens_per_second,
+        num_parallel=args.num_parallel,
+        max_queue=args.max_queue,
+        error_rate=args.error_rate,
+        truncation_rate=args.truncation_rate,
+        malformed_rate=args.malformed_rate,
+        miss_rate=args.miss_rate,
+        seed=args.seed,
+        script=json.loads(args.script.read_text()) if args.script else None,
+        model=args.model
+    )
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Shared helpers of the benchmark and load-test scripts."""
+
+import random
+import statistics
+import subprocess
+from typing import Dict, List, Optional
+
+FIRST_NAMES = ["John", "Maria", "Ahmed", "Li", "Sofia", "Lukas", "Aisha", "Pedro", "Emma", "Noah"]
+LAST_NAMES = ["Smith", "Garcia", "Khan", "Wang", "Rossi", "Schmidt", "Okafor", "Silva", "Brown", "Meyer"]
+STREETS = ["Baker Street", "Main Street", "Oak Avenue", "Elm Road", "Park Lane"]
+FILLER = [
+    "The customer reported an issue with the invoice of last month.",
+    "Our support team reviewed the account history and escalated the case.",
+    "A replacement device was shipped after the warranty check.",
+    "The complaint concerns a delayed delivery and a missing refund.",
+    "Follow-up is scheduled once the billing department responds.",
+]
+
+
+def make_document(size: int, rng: random.Random) -> str:
+    """Build a support-ticket style document of about ``size`` characters."""
+    sentences: List[str] = []
+    length = 0
+    while length < size:
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        kind = rng.randrange(4)
+        if kind == 0:
+            sentence = f"{first} {last} called from {rng.randint(200, 999)}-555-{rng.randint(1000, 9999)}."
+        elif kind == 1:
+            sentence = f"Please reply to {first.lower()}.{last.lower()}@example.com about the ticket."
+        elif kind == 2:
+            sentence = f"{first} {last} lives at {rng.randint(1, 999)} {rng.choice(STREETS)}."
+        else:
+            sentence = rng.choice(FILLER)
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def latency_summary(latencies_seconds: List[float]) -> Dict[str, float]:
+    """Mean, percentiles and maximum of latencies, in milliseconds."""
+    latencies_ms = sorted(latency * 1000 for latency in latencies_seconds)
+    if not latencies_ms:
+        return {}
+    return {
+        "mean": round(statistics.fmean(latencies_ms), 3),
+        "p50": round(percentile(latencies_ms, 0.50), 3),
+        "p90": round(percentile(latencies_ms, 0.90), 3),
+        "p95": round(percentile(latencies_ms, 0.95), 3),
+        "p99": round(percentile(latencies_ms, 0.99), 3),
+        "max": round(latencies_ms[-1], 3),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit, if run inside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 """Run the GDPR Anonymizer API server."""
 
-import logging.config
-import logging
 import uvicorn
-import yaml
 
-with open('logging.yaml', 'r') as f:
-    config = yaml.safe_load(f)
-    logging.config.dictConfig(config)
-    
-if __name__ == "__main__":
-    # Load your config first
+from anonymization.infrastructure.telemetry import configure_logging
+
+# Also runs in the reloader's worker process, which re-imports this module
+configure_logging('logging.yaml')
 
+if __name__ == "__main__":
     # Start uvicorn with log_config=None to prevent it from overriding
     uvicorn.run(
         "anonymization.interfaces.rest.main:app",
@@ -1,12 +1,49 @@
 """Application layer - Orchestration and use cases."""
 
-from .orchestrator import AnonymizationOrchestrator
-from .config import AppConfig, LLMConfig, AgentConfig, OrchestrationConfig
+from .orchestrator import AnonymizationOrchestrator, OrchestratorEvent
+from .config import (
+    AppConfig,
+    LLMConfig,
+    AgentConfig,
+    OrchestrationConfig,
+    CacheConfig,
+    JobsConfig,
+    AdmissionConfig,
+    TenancyConfig,
+    MetricsConfig,
+    TracingConfig,
+    ProfilingConfig,
+    ReadinessConfig,
+    EventLoopConfig
+)
+from .result_cache import ResultCache, compute_config_fingerprint
+from .job_runner import JobRunner
+from .priority import Priority, current_priority, priority_scope
+from .tenancy import DEFAULT_TENANT, current_tenant, tenant_scope
 
 __all__ = [
     "AnonymizationOrchestrator",
+    "OrchestratorEvent",
     "AppConfig",
     "LLMConfig",
     "AgentConfig",
     "OrchestrationConfig",
+    "CacheConfig",
+    "JobsConfig",
+    "AdmissionConfig",
+    "TenancyConfig",
+    "MetricsConfig",
+    "TracingConfig",
+    "ProfilingConfig",
+    "ReadinessConfig",
+    "EventLoopConfig",
+    "ResultCache",
+    "compute_config_fingerprint",
+    "JobRunner",
+    "Priority",
+    "current_priority",
+    "priority_scope",
+    "DEFAULT_TENANT",
+    "current_tenant",
+    "tenant_scope",
 ]
@@ -1,6 +1,6 @@
 """Application configuration models."""
 
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -15,15 +15,169 @@ class OllamaConfig(BaseModel):
         default=None,
         description="Optional authentication token for Ollama"
     )
+    keep_alive: Optional[str] = Field(
+        default="30m",
+        description="How long Ollama keeps the model loaded between calls"
+    )
+
+
+class FakeLLMConfig(BaseModel):
+    """Fake provider configuration (benchmarks and load tests, no model needed)."""
+
+    latency_distribution: str = Field(
+        default="lognormal",
+        description="Latency distribution: fixed, uniform, normal or lognormal"
+    )
+    latency_mean_seconds: float = Field(default=0.0, ge=0.0, description="Mean latency per call")
+    latency_stddev_seconds: float = Field(default=0.0, ge=0.0, description="Latency standard deviation")
+    latency_per_1k_chars_seconds: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Extra latency per 1000 prompt characters"
+    )
+    truncation_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Share of cut-off responses")
+    malformed_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Share of non-JSON responses")
+    miss_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Share of Agent 1 answers missing an entity"
+    )
+    seed: int = Field(default=0, description="Random seed")
+
+
+class CassetteConfig(BaseModel):
+    """Recording or replay of LLM calls (reproducible benchmark runs)."""
+
+    mode: Optional[str] = Field(
+        default=None,
+        pattern="^(record|replay)$",
+        description="record: write calls to the cassette; replay: answer from it; null: off"
+    )
+    path: str = Field(default="cassettes/llm.jsonl.gz", description="Cassette file")
+    store_prompts: bool = Field(default=False, description="Also record prompt texts")
+    replay_latency: bool = Field(default=False, description="Wait the recorded latencies on replay")
+    latency_scale: float = Field(default=1.0, ge=0.0, description="Factor applied to recorded latencies")
+    fallback_to_live: bool = Field(
+        default=False,
+        description="Send prompts missing from the cassette to the configured backends"
+    )
+
+
+class LLMBackendConfig(BaseModel):
+    """An additional LLM backend (e.g. a secondary endpoint for hedging)."""
+
+    provider: str = Field(description="LLM provider (ollama, claude, openai, fake)")
+    model: str = Field(description="Model identifier")
+    temperature: float = Field(default=0.1, ge=0.0, le=1.0)
+    max_tokens: int = Field(default=4096, gt=0)
+    ollama: Optional[OllamaConfig] = Field(
+        default=None,
+        description="Ollama-specific configuration"
+    )
+    fake: Optional[FakeLLMConfig] = Field(
+        default=None,
+        description="Fake provider configuration"
+    )
+
+
+class HedgingConfig(BaseModel):
+    """Request hedging configuration for tail-latency reduction."""
+
+    enabled: bool = Field(default=False, description="Whether hedging is enabled")
+    percentile: float = Field(
+        default=0.95,
+        gt=0.0,
+        lt=1.0,
+        description="Latency percentile after which a hedge request is sent"
+    )
+    min_delay_seconds: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Lower bound for the hedge delay"
+    )
+    budget_ratio: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Maximum fraction of extra calls caused by hedging"
+    )
+    window_size: int = Field(
+        default=200,
+        gt=0,
+        description="Number of recent latencies used for the percentile"
+    )
+    min_samples: int = Field(
+        default=20,
+        gt=0,
+        description="Samples required before hedging starts"
+    )
+    secondary: Optional[LLMBackendConfig] = Field(
+        default=None,
+        description="Backend receiving hedge requests (defaults to the primary)"
+    )
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Circuit breaker settings for each backend of the fallback chain."""
+
+    failure_rate_threshold: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Failure rate in the window that opens the circuit"
+    )
+    slow_call_threshold_seconds: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="Latency SLO; slower calls count as violations"
+    )
+    slow_call_rate_threshold: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Rate of SLO violations that opens the circuit"
+    )
+    window_size: int = Field(default=20, gt=0, description="Calls kept in the window")
+    min_calls: int = Field(
+        default=5,
+        gt=0,
+        description="Calls required before the circuit can open"
+    )
+    cooldown_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Time an open circuit waits before half-opening"
+    )
+    half_open_max_calls: int = Field(
+        default=1,
+        gt=0,
+        description="Trial calls allowed while half-open"
+    )
+    timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="Per-call timeout; timeouts count as failures"
+    )
 
 
 class LLMConfig(BaseModel):
     """LLM provider configuration."""
 
-    provider: str = Field(description="LLM provider (ollama, claude, openai)")
+    provider: str = Field(description="LLM provider (ollama, claude, openai, fake)")
     model: str = Field(description="Model identifier")
     temperature: float = Field(default=0.1, ge=0.0, le=1.0)
     max_tokens: int = Field(default=4096, gt=0)
+    max_concurrency: Optional[int] = Field(
+        default=4,
+        gt=0,
+        description="Maximum concurrent LLM calls (None for unlimited)"
+    )
+    priority_aging_seconds: float = Field(
+        default=10.0,
+        gt=0.0,
+        description="Queue time that promotes a waiting LLM call by one priority class"
+    )
     api_key_env: Optional[str] = Field(
         default=None,
         description="Environment variable name for API key"
@@ -32,6 +186,26 @@ class LLMConfig(BaseModel):
         default=None,
         description="Ollama-specific configuration"
     )
+    fake: Optional[FakeLLMConfig] = Field(
+        default=None,
+        description="Fake provider configuration"
+    )
+    hedging: HedgingConfig = Field(
+        default_factory=HedgingConfig,
+        description="Request hedging configuration"
+    )
+    fallbacks: List[LLMBackendConfig] = Field(
+        default_factory=list,
+        description="Backends tried in order when the primary is unavailable"
+    )
+    circuit_breaker: CircuitBreakerConfig = Field(
+        default_factory=CircuitBreakerConfig,
+        description="Circuit breaker settings for the fallback chain"
+    )
+    cassette: CassetteConfig = Field(
+        default_factory=CassetteConfig,
+        description="Recording or replay of LLM calls"
+    )
 
 
 class AgentConfig(BaseModel):
@@ -56,6 +230,247 @@ class OrchestrationConfig(BaseModel):
         gt=0,
         description="Overall timeout for anonymization process"
     )
+    batch_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Documents of a batch processed concurrently"
+    )
+
+
+class CacheConfig(BaseModel):
+    """Whole-result cache configuration."""
+
+    enabled: bool = Field(default=True, description="Whether result caching is enabled")
+    max_memory_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        gt=0,
+        description="Upper bound for the in-memory LRU tier (serialized bytes)"
+    )
+    disk_path: Optional[str] = Field(
+        default=None,
+        description="Directory for the optional on-disk tier (disabled if not set)"
+    )
+
+
+class JobsConfig(BaseModel):
+    """Asynchronous job API configuration."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether this instance serves the job API and runs its workers"
+    )
+    database_path: str = Field(
+        default="data/jobs.db",
+        description="SQLite file holding the durable job queue"
+    )
+    workers: int = Field(
+        default=2,
+        ge=1,
+        description="Documents processed concurrently by the job workers"
+    )
+    poll_interval_seconds: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Maximum idle time between queue polls"
+    )
+    retention_seconds: Optional[float] = Field(
+        default=86400.0,
+        gt=0.0,
+        description="Finished jobs and their results are deleted this long after "
+                    "their last update (None keeps them until deleted)"
+    )
+    purge_interval_seconds: float = Field(
+        default=300.0,
+        gt=0.0,
+        description="Time between purges of expired jobs"
+    )
+    lease_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Time a claimed document stays owned by its worker without a lease "
+                    "renewal; documents of a dead process are requeued after it"
+    )
+
+
+class AdmissionConfig(BaseModel):
+    """Admission control (load shedding) configuration."""
+
+    enabled: bool = Field(default=True, description="Whether admission control is enabled")
+    max_in_flight_requests: int = Field(
+        default=32,
+        ge=1,
+        description="Concurrent LLM-bound requests admitted before rejecting with 429"
+    )
+    max_queue_depth: Optional[int] = Field(
+        default=64,
+        ge=0,
+        description="LLM calls waiting for a slot before rejecting with 429 (null disables)"
+    )
+    retry_after_min_seconds: int = Field(default=1, ge=0, description="Lower bound of Retry-After")
+    retry_after_max_seconds: int = Field(default=60, ge=1, description="Upper bound of Retry-After")
+
+
+class TenantConfig(BaseModel):
+    """LLM capacity share of a tenant."""
+
+    weight: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Fair-share weight relative to other tenants"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum concurrent LLM calls of the tenant (None for no cap)"
+    )
+
+
+class TenancyConfig(BaseModel):
+    """Tenant identification and capacity sharing configuration."""
+
+    header: str = Field(default="X-Tenant-ID", description="Header naming the tenant")
+    api_key_header: str = Field(
+        default="X-API-Key",
+        description="Header carrying an API key mapped to a tenant"
+    )
+    api_keys: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Map from API key to tenant; a known key takes precedence over the header, "
+                    "and tenants listed here are only accepted with their key"
+    )
+    allow_unknown_tenants: bool = Field(
+        default=True,
+        description="Accept tenant names not listed under tenants"
+    )
+    default: TenantConfig = Field(
+        default_factory=TenantConfig,
+        description="Share of tenants not listed under tenants"
+    )
+    tenants: Dict[str, TenantConfig] = Field(
+        default_factory=dict,
+        description="Share per known tenant"
+    )
+
+
+class MetricsConfig(BaseModel):
+    """Prometheus metrics endpoint configuration."""
+
+    enabled: bool = Field(default=True, description="Whether GET /metrics is served")
+
+
+class TracingConfig(BaseModel):
+    """Per-request tracing configuration."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Trace API requests and send a Server-Timing header"
+    )
+    export_path: Optional[str] = Field(
+        default=None,
+        description="File receiving traces as OTLP JSON lines (None disables export)"
+    )
+    max_spans: int = Field(
+        default=256,
+        ge=1,
+        description="Spans kept per trace for export; stage timings still cover every span"
+    )
+    service_name: str = Field(
+        default="gdpr-anonymizer",
+        description="service.name resource attribute of exported traces"
+    )
+
+
+class ProfilingConfig(BaseModel):
+    """On-demand profiling configuration."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Serve the debug profiling endpoints and the profile request header"
+    )
+    admin_token_env: str = Field(
+        default="ANONYMIZER_ADMIN_TOKEN",
+        description="Environment variable holding the admin token"
+    )
+    admin_token_header: str = Field(
+        default="X-Admin-Token",
+        description="Header carrying the admin token"
+    )
+    max_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Longest sampling profile"
+    )
+    interval_ms: float = Field(
+        default=10.0,
+        gt=0,
+        description="Default time between stack samples"
+    )
+    request_header: str = Field(
+        default="X-Profile",
+        description="Header requesting a cProfile summary of one request"
+    )
+    stored_request_profiles: int = Field(
+        default=20,
+        gt=0,
+        description="Request profile summaries kept for retrieval"
+    )
+    summary_limit: int = Field(
+        default=40,
+        gt=0,
+        description="Functions listed in a request profile summary"
+    )
+
+
+class EventLoopConfig(BaseModel):
+    """Event loop lag monitoring configuration."""
+
+    monitor_enabled: bool = Field(
+        default=True,
+        description="Measure event loop lag and log the stack of code blocking the loop"
+    )
+    interval_ms: float = Field(
+        default=100.0,
+        gt=0,
+        description="Time between lag measurements"
+    )
+    stall_threshold_ms: float = Field(
+        default=250.0,
+        gt=0,
+        description="Blocking longer than this is logged with the blocking stack"
+    )
+    debug: bool = Field(
+        default=False,
+        description="Enable asyncio debug mode and log blocking I/O made in coroutines"
+    )
+
+
+class ReadinessConfig(BaseModel):
+    """Readiness probe configuration."""
+
+    llm_probe_enabled: bool = Field(
+        default=True,
+        description="Probe the LLM provider in the background and report unready while it fails"
+    )
+    probe_interval_seconds: float = Field(
+        default=15.0,
+        gt=0,
+        description="Time between LLM probes"
+    )
+    billed_probe_interval_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Time between LLM probes when a configured backend bills them (Claude)"
+    )
+    probe_timeout_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="LLM probes taking longer count as failed"
+    )
+    failure_threshold: int = Field(
+        default=2,
+        ge=1,
+        description="Consecutive failed probes marking the LLM provider unhealthy"
+    )
 
 
 class AppConfig(BaseModel):
@@ -66,3 +481,39 @@ class AppConfig(BaseModel):
     agent2: AgentConfig = Field(description="Agent 2 configuration")
     agent3: AgentConfig = Field(description="Agent 3 configuration")
     orchestration: OrchestrationConfig = Field(description="Orchestration configuration")
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig,
+        description="Result cache configuration"
+    )
+    jobs: JobsConfig = Field(
+        default_factory=JobsConfig,
+        description="Asynchronous job configuration"
+    )
+    admission: AdmissionConfig = Field(
+        default_factory=AdmissionConfig,
+        description="Admission control configuration"
+    )
+    tenancy: TenancyConfig = Field(
+        default_factory=TenancyConfig,
+        description="Tenant configuration"
+    )
+    metrics: MetricsConfig = Field(
+        default_factory=MetricsConfig,
+        description="Metrics endpoint configuration"
+    )
+    tracing: TracingConfig = Field(
+        default_factory=TracingConfig,
+        description="Tracing configuration"
+    )
+    profiling: ProfilingConfig = Field(
+        default_factory=ProfilingConfig,
+        description="Profiling configuration"
+    )
+    readiness: ReadinessConfig = Field(
+        default_factory=ReadinessConfig,
+        description="Readiness probe configuration"
+    )
+    event_loop: EventLoopConfig = Field(
+        default_factory=EventLoopConfig,
+        description="Event loop monitoring configuration"
+    )
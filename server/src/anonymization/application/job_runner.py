@@ -0,0 +1,204 @@
+"""Background workers processing documents of asynchronous jobs."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..domain.models import JobItem
+from ..domain.ports import IJobStore
+from .priority import Priority, priority_scope
+from .tenancy import tenant_scope
+
+logger = logging.getLogger(__name__)
+
+JobItemHandler = Callable[[JobItem], Awaitable[Tuple[Dict[str, Any], bool]]]
+"""Processes one document, returning (JSON-serializable result, success)."""
+
+JobItemErrorHandler = Callable[[JobItem, Exception], Dict[str, Any]]
+"""Builds the result stored for a document whose handler raised."""
+
+
+class JobRunner:
+    """Pool of workers draining the job store queue.
+
+    Each worker claims one document at a time, processes it with the
+    handler and writes the result back. Claims are leases, renewed in
+    the background while documents are processed; documents whose lease
+    expired (their process died) are requeued on start and periodically,
+    so jobs resume after a restart without taking over documents another
+    live process is working on. Idle workers sleep until notified of a new job or until the
+    poll interval elapses. Workers run at background priority, so their
+    LLM calls yield to interactive and batch traffic. With a retention
+    period, finished jobs and their results are purged periodically.
+
+    Example:
+        >>> runner = JobRunner(store, handler, workers=2)
+        >>> await runner.start()
+        >>> runner.notify()
+    """
+
+    def __init__(
+        self,
+        store: IJobStore,
+        handler: JobItemHandler,
+        workers: int = 2,
+        poll_interval_seconds: float = 1.0,
+        error_handler: Optional[JobItemErrorHandler] = None,
+        retention_seconds: Optional[float] = None,
+        purge_interval_seconds: float = 300.0,
+        lease_renew_interval_seconds: float = 20.0
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            store: Job store used as the work queue
+            handler: Coroutine processing a single document
+            workers: Number of concurrent workers
+            poll_interval_seconds: Maximum idle sleep between queue polls
+            error_handler: Builds the result stored when the handler raises
+                (default: ``{"error": message}``)
+            retention_seconds: Age after which finished jobs are purged
+                (None keeps them)
+            purge_interval_seconds: Time between purges
+            lease_renew_interval_seconds: Time between lease renewals and
+                requeues of expired leases (well below the store's lease)
+        """
+        self.store = store
+        self.handler = handler
+        self.error_handler = error_handler
+        self.retention_seconds = retention_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self.lease_renew_interval_seconds = lease_renew_interval_seconds
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+
+        self._tasks: List[asyncio.Task] = []
+        self._purge_task: Optional[asyncio.Task] = None
+        self._lease_task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+        self.processed = 0
+        self.failed = 0
+        self.requeued = 0
+        self.purged = 0
+
+    async def start(self) -> None:
+        """Requeue documents with expired leases and start the workers."""
+        self.requeued = await self.store.requeue_expired()
+        if self.requeued:
+            logger.info(f"Requeued {self.requeued} interrupted job documents")
+        with priority_scope(Priority.BACKGROUND):
+            self._tasks = [
+                asyncio.create_task(self._work(), name=f"job-worker-{n}")
+                for n in range(self.workers)
+            ]
+        self._lease_task = asyncio.create_task(self._renew_leases(), name="job-leases")
+        if self.retention_seconds is not None:
+            self._purge_task = asyncio.create_task(self._purge(), name="job-purge")
+
+    async def stop(self) -> None:
+        """Stop the workers and release the documents they were processing."""
+        tasks = self._tasks + [
+            task for task in (self._lease_task, self._purge_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._lease_task = None
+        self._purge_task = None
+        try:
+            released = await self.store.release_claims()
+        except Exception as e:
+            # The leases expire and the documents are requeued later
+            logger.error(f"Failed to release job documents: {e}")
+        else:
+            if released:
+                logger.info(f"Released {released} job documents in progress")
+
+    def notify(self) -> None:
+        """Wake idle workers (call after creating a job)."""
+        self._wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get runner statistics.
+
+        Returns:
+            Dictionary with worker count and processed/failed/requeued counters
+        """
+        return {
+            "workers": len(self._tasks),
+            "processed": self.processed,
+            "failed": self.failed,
+            "requeued": self.requeued,
+            "purged": self.purged,
+        }
+
+    async def _work(self) -> None:
+        """Worker loop: claim, process and complete documents."""
+        while True:
+            try:
+                item = await self.store.claim_next()
+            except Exception as e:
+                logger.error(f"Failed to claim job document: {e}")
+                item = None
+
+            if item is None:
+                await self._idle()
+                continue
+
+            try:
+                with tenant_scope(item.tenant_id):
+                    result, success = await self.handler(item)
+            except Exception as e:
+                logger.error(f"Job document {item.job_id}[{item.index}] failed: {e}")
+                if self.error_handler is not None:
+                    result, success = self.error_handler(item, e), False
+                else:
+                    result, success = {"error": str(e)}, False
+
+            try:
+                await self.store.complete_item(item, result, success)
+            except Exception as e:
+                # The document stays running and is requeued once its lease expires
+                logger.error(f"Failed to store result of job {item.job_id}[{item.index}]: {e}")
+                continue
+            self.processed += 1
+            if not success:
+                self.failed += 1
+
+    async def _renew_leases(self) -> None:
+        """Renew this worker's leases and requeue expired ones until cancelled."""
+        while True:
+            await asyncio.sleep(self.lease_renew_interval_seconds)
+            try:
+                await self.store.renew_leases()
+                requeued = await self.store.requeue_expired()
+            except Exception as e:
+                logger.error(f"Failed to renew job leases: {e}")
+                continue
+            if requeued:
+                logger.info(f"Requeued {requeued} job documents with expired leases")
+                self.requeued += requeued
+                self.notify()
+
+    async def _purge(self) -> None:
+        """Delete expired finished jobs until cancelled."""
+        assert self.retention_seconds is not None
+        while True:
+            try:
+                purged = await self.store.purge_finished(self.retention_seconds)
+            except Exception as e:
+                logger.error(f"Failed to purge expired jobs: {e}")
+            else:
+                if purged:
+                    logger.info(f"Purged {purged} expired jobs")
+                self.purged += purged
+            await asyncio.sleep(self.purge_interval_seconds)
+
+    async def _idle(self) -> None:
+        """Sleep until notified or until the poll interval elapses."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
@@ -0,0 +1,136 @@
+"""Background health probing of the LLM provider for the readiness check."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .metrics import LLM_HEALTHY, LLM_PROBE_DURATION
+
+logger = logging.getLogger(__name__)
+
+LLMProbe = Callable[[], Awaitable[None]]
+"""Cheap provider call that raises if the backend cannot serve requests."""
+
+
+class LLMHealthMonitor:
+    """Probes the LLM provider on an interval and caches the outcome.
+
+    The readiness endpoint reads the cached status, so it answers
+    instantly and never waits on (or piles up calls to) a slow backend.
+    A single successful probe marks the provider healthy; it is marked
+    unhealthy only after ``failure_threshold`` consecutive failures, so
+    one slow probe does not take the pod out of rotation.
+
+    Example:
+        >>> monitor = LLMHealthMonitor(provider.probe, interval_seconds=15)
+        >>> monitor.start()
+        >>> monitor.healthy
+    """
+
+    def __init__(
+        self,
+        probe: LLMProbe,
+        interval_seconds: float = 15.0,
+        timeout_seconds: float = 5.0,
+        failure_threshold: int = 2
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            probe: Coroutine function probing the provider
+            interval_seconds: Time between probes
+            timeout_seconds: Probes taking longer count as failed
+            failure_threshold: Consecutive failures marking the provider unhealthy
+        """
+        self.probe = probe
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.failure_threshold = failure_threshold
+
+        self.healthy: Optional[bool] = None
+        self.last_probe_at: Optional[float] = None
+        self.last_latency_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self.probes = 0
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self) -> bool:
+        """Run one probe and update the cached status.
+
+        Returns:
+            Whether the provider is considered healthy after this probe
+        """
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.probe(), self.timeout_seconds)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._record(start, error=f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)
+        else:
+            self._record(start, error=None)
+        return bool(self.healthy)
+
+    def _record(self, start: float, error: Optional[str]) -> None:
+        """Update the status after a probe."""
+        self.last_latency_seconds = time.perf_counter() - start
+        self.last_probe_at = time.time()
+        self.last_error = error
+        self.probes += 1
+        LLM_PROBE_DURATION.observe(
+            self.last_latency_seconds, outcome="success" if error is None else "failure")
+
+        if error is None:
+            if self.healthy is False:
+                logger.info("LLM provider is healthy again")
+            self.consecutive_failures = 0
+            self.healthy = True
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+            logger.warning("LLM readiness probe failed (%d in a row): %s",
+                           self.consecutive_failures, error)
+            if self.consecutive_failures >= self.failure_threshold or self.healthy is None:
+                if self.healthy is not False:
+                    logger.error("LLM provider marked unhealthy")
+                self.healthy = False
+        LLM_HEALTHY.set(1.0 if self.healthy else 0.0)
+
+    async def _run(self) -> None:
+        """Probe until cancelled."""
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start probing in the background (the first probe runs immediately)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="llm-health-monitor")
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cached probe status."""
+        if self.healthy is None:
+            status = "unknown"
+        else:
+            status = "healthy" if self.healthy else "unhealthy"
+        return {
+            "status": status,
+            "last_probe_at": self.last_probe_at,
+            "latency_ms": (
+                round(self.last_latency_seconds * 1000, 3)
+                if self.last_latency_seconds is not None else None),
+            "error": self.last_error,
+            "consecutive_failures": self.consecutive_failures,
+            "probes": self.probes,
+            "failures": self.failures,
+        }
@@ -0,0 +1,411 @@
+"""Process-wide metrics in the Prometheus text exposition format.
+
+Components record into the module-level metrics below; ``REGISTRY.render()``
+produces the ``/metrics`` payload. Gauges that mirror component state
+(scheduler queue depth, in-flight calls) are refreshed at scrape time by
+callbacks registered with ``REGISTRY.add_refresh_hook``.
+"""
+
+import logging
+import math
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+# Latency buckets (seconds) spanning fast cache hits to slow generations
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0
+)
+
+
+class _Metric:
+    """Base class of a metric family with optional labels."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the metric family.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Order label values by label name.
+
+        Raises:
+            ValueError: If the labels do not match the declared label names
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        """Format a label set as ``{name="value",...}``."""
+        pairs = list(zip(self.labelnames, values)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> List[str]:
+        """Exposition lines of the samples (without HELP/TYPE)."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric family."""
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+
+        Raises:
+            ValueError: If amount is negative or labels do not match
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value of a labelled counter."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{self._format_labels(key)} {_number(value)}" for key, value in values]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        """Current value of a labelled gauge."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{self._format_labels(key)} {_number(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+            buckets: Upper bounds of the buckets, ascending (+Inf is implied)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: bucket counts (last one is +Inf), sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        """Number of observations of a label set."""
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = [(key, list(counts), self._sums[key]) for key, counts in sorted(self._counts.items())]
+        lines = []
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else _number(bound)
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, (('le', le),))} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._refresh_hooks: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric family.
+
+        Raises:
+            ValueError: If a metric with the same name exists
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def add_refresh_hook(self, hook: Callable[[], None]) -> None:
+        """Register a callback that updates gauges before each render."""
+        self._refresh_hooks.append(hook)
+
+    def remove_refresh_hook(self, hook: Callable[[], None]) -> None:
+        """Unregister a refresh callback."""
+        if hook in self._refresh_hooks:
+            self._refresh_hooks.remove(hook)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format (version 0.0.4).
+
+        Returns:
+            Exposition text ending with a newline
+        """
+        for hook in list(self._refresh_hooks):
+            try:
+                hook()
+            except Exception as e:
+                # A broken probe must not take the whole endpoint down
+                logger.warning(f"Metrics refresh hook failed: {e}")
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    """Escape a help text."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+# HTTP layer
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "anonymizer_http_request_duration_seconds",
+    "End-to-end duration of HTTP requests by route template, method and status",
+    ("route", "method", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "anonymizer_http_requests_in_flight",
+    "HTTP requests currently being served"
+)
+ADMISSION_REJECTIONS = REGISTRY.counter(
+    "anonymizer_admission_rejections_total",
+    "Requests rejected with 429 by admission control, by the limit that was "
+    "reached (in_flight or queue_depth)",
+    ("reason",)
+)
+
+# Orchestrator and agents
+DOCUMENT_DURATION = REGISTRY.histogram(
+    "anonymizer_document_duration_seconds",
+    "Time to anonymize one document through all agents",
+    ("cache",)
+)
+AGENT_DURATION = REGISTRY.histogram(
+    "anonymizer_agent_duration_seconds",
+    "Duration of a single agent step",
+    ("agent",)
+)
+ORCHESTRATOR_ITERATIONS = REGISTRY.counter(
+    "anonymizer_orchestrator_iterations_total",
+    "Agent 1 / Agent 2 iterations run by the orchestrator"
+)
+VALIDATION_FAILURES = REGISTRY.counter(
+    "anonymizer_validation_failures_total",
+    "Agent 2 validations that found remaining personal data"
+)
+SKIPPED_ENTITIES = REGISTRY.counter(
+    "anonymizer_skipped_entities_total",
+    "Entities returned by the LLM that failed validation and were skipped"
+)
+PARSE_RETRIES = REGISTRY.counter(
+    "anonymizer_parse_retries_total",
+    "LLM calls repeated because the response could not be parsed",
+    ("agent",)
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "anonymizer_cache_lookups_total",
+    "Result cache lookups by outcome",
+    ("result",)
+)
+
+# LLM provider calls
+LLM_CALL_DURATION = REGISTRY.histogram(
+    "anonymizer_llm_call_duration_seconds",
+    "Duration of calls to an LLM backend by outcome",
+    ("backend", "outcome")
+)
+LLM_HEDGES = REGISTRY.counter(
+    "anonymizer_llm_hedges_total",
+    "Slow LLM calls by hedging outcome: sent (duplicate issued), won (the "
+    "duplicate answered first), budget_exhausted or no_capacity (not sent)",
+    ("outcome",)
+)
+LLM_ERRORS = REGISTRY.counter(
+    "anonymizer_llm_errors_total",
+    "Failed LLM backend calls by exception type",
+    ("backend", "error")
+)
+LLM_TOKENS = REGISTRY.counter(
+    "anonymizer_llm_tokens_total",
+    "Tokens exchanged with LLM backends, as reported by the backend, by agent",
+    ("model", "agent", "direction")
+)
+LLM_TIME_TO_FIRST_TOKEN = REGISTRY.histogram(
+    "anonymizer_llm_time_to_first_token_seconds",
+    "Time until an LLM backend produced the first token, where reported",
+    ("model",)
+)
+LLM_CALLS_IN_FLIGHT = REGISTRY.gauge(
+    "anonymizer_llm_calls_in_flight",
+    "LLM calls holding a scheduler slot"
+)
+LLM_QUEUE_DEPTH = REGISTRY.gauge(
+    "anonymizer_llm_queue_depth",
+    "LLM calls waiting for a scheduler slot, by priority class",
+    ("priority",)
+)
+LLM_HEALTHY = REGISTRY.gauge(
+    "anonymizer_llm_healthy",
+    "Whether the last LLM readiness probes succeeded (1) or failed (0)"
+)
+LLM_PROBE_DURATION = REGISTRY.histogram(
+    "anonymizer_llm_probe_duration_seconds",
+    "Duration of LLM readiness probes by outcome",
+    ("outcome",)
+)
+
+# Event loop
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "anonymizer_event_loop_lag_seconds",
+    "Delay of event loop heartbeats beyond their scheduled time",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+EVENT_LOOP_STALLS = REGISTRY.counter(
+    "anonymizer_event_loop_stalls_total",
+    "Times the event loop was blocked longer than the stall threshold"
+)
+SYNC_IO_CALLS = REGISTRY.counter(
+    "anonymizer_sync_io_calls_total",
+    "Blocking I/O calls made from coroutines on the event loop (debug mode only)",
+    ("event",)
+)
+
+# Logging
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "anonymizer_log_records_dropped_total",
+    "Log records dropped because the logging queue was full"
+)
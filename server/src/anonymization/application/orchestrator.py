@@ -1,7 +1,8 @@
 """Main orchestrator for the anonymization workflow."""
 
-from dataclasses import dataclass
-from typing import Optional
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Optional
 
 from ..domain.models import (
     Document,
@@ -10,6 +11,17 @@ from ..domain.models import (
     RiskAssessment
 )
 from ..domain.ports import IAgent1, IAgent2, IAgent3
+from .metrics import (
+    AGENT_DURATION,
+    CACHE_LOOKUPS,
+    DOCUMENT_DURATION,
+    ORCHESTRATOR_ITERATIONS,
+    SKIPPED_ENTITIES,
+    VALIDATION_FAILURES
+)
+from .result_cache import ResultCache
+from .tracing import span
+from .usage import usage_labels, usage_scope
 
 
 @dataclass
@@ -23,6 +35,8 @@ class AnonymizationResult:
         risk_assessment: Risk assessment from Agent 3
         iterations: Number of iterations required
         success: Whether anonymization succeeded
+        usage: LLM usage of this run (see UsageRecorder.summary); a cached
+            result reports no calls
     """
     document: Document
     anonymizationMapping: AnonymizationMapping
@@ -30,6 +44,28 @@ class AnonymizationResult:
     risk_assessment: RiskAssessment
     iterations: int
     success: bool
+    usage: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class OrchestratorEvent:
+    """Progress event emitted while a document moves through the agents.
+
+    Stages, in order: ``entities`` (Agent 1 mappings), ``anonymized_text``,
+    ``validation`` (Agent 2 verdict), repeated per iteration, then
+    ``risk_assessment``. A cached result emits the same stages once.
+
+    Attributes:
+        stage: Workflow stage that produced the event
+        iteration: Iteration number (1-based)
+        data: JSON-serializable stage payload
+    """
+    stage: str
+    iteration: int
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+EventCallback = Callable[[OrchestratorEvent], None]
 
 
 class AnonymizationOrchestrator:
@@ -44,7 +80,8 @@ class AnonymizationOrchestrator:
         agent1: IAgent1,
         agent2: IAgent2,
         agent3: IAgent3,
-        max_iterations: int = 3
+        max_iterations: int = 3,
+        result_cache: Optional[ResultCache] = None
     ) -> None:
         """Initialize the orchestrator with agents.
 
@@ -53,19 +90,23 @@ class AnonymizationOrchestrator:
             agent2: Agent 2 (DIRECT-CHECK) implementation
             agent3: Agent 3 (RISK-ASSESS) implementation
             max_iterations: Maximum retry iterations for validation failures
+            result_cache: Optional cache of complete results for repeat documents
         """
         self.agent1 = agent1
         self.agent2 = agent2
         self.agent3 = agent3
         self.max_iterations = max_iterations
+        self.result_cache = result_cache
 
     async def anonymize_document(
         self,
-        document: Document
+        document: Document,
+        on_event: Optional[EventCallback] = None
     ) -> AnonymizationResult:
         """Execute the complete anonymization workflow.
 
         Workflow:
+        0. Return the cached result if this content was already processed
         1. Agent 1: Anonymize text
         2. Agent 2: Validate anonymization
         3. If validation fails, retry Agent 1 (up to max_iterations)
@@ -73,6 +114,8 @@ class AnonymizationOrchestrator:
 
         Args:
             document: Document to anonymize
+            on_event: Optional callback receiving progress events as each
+                agent finishes; it must not block
 
         Returns:
             AnonymizationResult with all agent outputs
@@ -81,24 +124,63 @@ class AnonymizationOrchestrator:
             ValueError: If document is invalid
             RuntimeError: If max iterations exceeded
         """
+        with usage_scope() as usage:
+            result = await self._run(document, on_event)
+        # A copy, so cached results never carry the usage of one run
+        return replace(result, usage=usage.summary())
+
+    async def _run(
+        self,
+        document: Document,
+        on_event: Optional[EventCallback]
+    ) -> AnonymizationResult:
+        """Run the workflow of anonymize_document."""
         if document.is_empty():
             raise ValueError("Cannot anonymize empty document")
 
+        start = time.perf_counter()
+        if self.result_cache is not None:
+            with span("cache.lookup"):
+                cached = await self.result_cache.get(document)
+            CACHE_LOOKUPS.inc(result="miss" if cached is None else "hit")
+            if cached is not None:
+                if on_event is not None:
+                    self._replay_events(cached, on_event)
+                DOCUMENT_DURATION.observe(time.perf_counter() - start, cache="hit")
+                return cached
+
         anonymizationMapping: AnonymizationMapping
         validation: Optional[ValidationResult] = None
         iteration = 0
 
         # Retry loop: Agent 1 -> Agent 2
         for iteration in range(1, self.max_iterations + 1):
-            # Agent 1: Anonymize
-            anonymizationMapping: AnonymizationMapping = await self.agent1.anonymize(document.content)
+            ORCHESTRATOR_ITERATIONS.inc()
 
-            # Agent 2: Validate
-            validation = await self.agent2.validate(anonymizationMapping.anonymized_text)
+            with span("orchestrator.iteration", iteration=iteration):
+                # Agent 1: Anonymize
+                step_start = time.perf_counter()
+                with span("agent1"), usage_labels("agent1", iteration):
+                    anonymizationMapping: AnonymizationMapping = await self.agent1.anonymize(
+                        document.content)
+                AGENT_DURATION.observe(time.perf_counter() - step_start, agent="agent1")
+                SKIPPED_ENTITIES.inc(len(anonymizationMapping.skippedEntites))
+                if on_event is not None:
+                    self._emit_anonymization(anonymizationMapping, iteration, on_event)
+
+                # Agent 2: Validate
+                step_start = time.perf_counter()
+                with span("agent2"), usage_labels("agent2", iteration):
+                    validation = await self.agent2.validate(anonymizationMapping.anonymized_text)
+                AGENT_DURATION.observe(time.perf_counter() - step_start, agent="agent2")
+                if on_event is not None:
+                    on_event(OrchestratorEvent(
+                        "validation", iteration, validation.model_dump(mode="json")))
 
             # If validation passed, break out of retry loop
             if validation.passed:
                 break
+            VALIDATION_FAILURES.inc()
 
         # At this point, validation must have passed or we exhausted iterations
         if anonymizationMapping is None or validation is None:
@@ -106,13 +188,18 @@ class AnonymizationOrchestrator:
                 "Unexpected state: anonymization or validation is None")
 
         # Agent 3: Risk Assessment
-        risk_assessment = await self.agent3.assess_risk(
-            "", {}
-            # anonymization.anonymized_text,
-            # anonymization.mappings
-        )
+        step_start = time.perf_counter()
+        with span("agent3"), usage_labels("agent3", iteration):
+            risk_assessment = await self.agent3.assess_risk(
+                anonymizationMapping.anonymized_text,
+                anonymizationMapping.mappings
+            )
+        AGENT_DURATION.observe(time.perf_counter() - step_start, agent="agent3")
+        if on_event is not None:
+            on_event(OrchestratorEvent(
+                "risk_assessment", iteration, risk_assessment.model_dump(mode="json")))
 
-        return AnonymizationResult(
+        result = AnonymizationResult(
             document=document,
             anonymizationMapping=anonymizationMapping,
             validation=validation,
@@ -120,3 +207,50 @@ class AnonymizationOrchestrator:
             iterations=iteration,
             success=validation.passed and len(anonymizationMapping.skippedEntites) == 0
         )
+
+        # Only successful results are cached so failures get retried
+        if self.result_cache is not None and result.success:
+            await self.result_cache.put(result)
+
+        DOCUMENT_DURATION.observe(
+            time.perf_counter() - start,
+            cache="miss" if self.result_cache is not None else "disabled"
+        )
+        return result
+
+    @staticmethod
+    def _emit_anonymization(
+        mapping: AnonymizationMapping,
+        iteration: int,
+        on_event: EventCallback
+    ) -> None:
+        """Emit the Agent 1 events of an iteration.
+
+        Args:
+            mapping: Agent 1 output
+            iteration: Iteration number
+            on_event: Event callback
+        """
+        on_event(OrchestratorEvent("entities", iteration, {
+            "mappings": mapping.mappings,
+            "entities": [entity.model_dump(mode="json") for entity in mapping.entities],
+            "skipped_entities": [
+                entity.model_dump(mode="json") for entity in mapping.skippedEntites
+            ]
+        }))
+        on_event(OrchestratorEvent("anonymized_text", iteration, {
+            "anonymized_text": mapping.anonymized_text
+        }))
+
+    def _replay_events(self, result: AnonymizationResult, on_event: EventCallback) -> None:
+        """Emit the events of a cached result.
+
+        Args:
+            result: Cached result
+            on_event: Event callback
+        """
+        self._emit_anonymization(result.anonymizationMapping, result.iterations, on_event)
+        on_event(OrchestratorEvent(
+            "validation", result.iterations, result.validation.model_dump(mode="json")))
+        on_event(OrchestratorEvent(
+            "risk_assessment", result.iterations, result.risk_assessment.model_dump(mode="json")))
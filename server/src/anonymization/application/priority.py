@@ -0,0 +1,49 @@
+"""Priority classes for LLM capacity sharing."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Iterator
+
+
+class Priority(IntEnum):
+    """Priority class of an LLM call; lower values are served first."""
+
+    INTERACTIVE = 0
+    """Single-document requests from users waiting for the answer"""
+
+    BATCH = 1
+    """Batch and upload requests"""
+
+    BACKGROUND = 2
+    """Asynchronous job workers"""
+
+
+_current_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    """Get the priority class of the current request or task.
+
+    Returns:
+        Priority set by the nearest enclosing priority_scope (INTERACTIVE by default)
+    """
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    """Run the enclosed code, and tasks it creates, at the given priority.
+
+    Args:
+        priority: Priority class for LLM calls made inside the scope
+
+    Example:
+        >>> with priority_scope(Priority.BACKGROUND):
+        ...     await orchestrator.anonymize_document(document)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
@@ -0,0 +1,318 @@
+"""Whole-result cache for the anonymization workflow.
+
+Stores complete AnonymizationResult objects keyed by the document content
+hash and a fingerprint of everything that influences the outcome (LLM
+provider/model/sampling settings of every backend that may answer, cassette
+replay, agent prompt versions, the prompt templates themselves and
+orchestration limits). Changing any of those
+produces a new fingerprint, so stale entries are never served.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import shutil
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .config import AppConfig
+from ..domain.agents.prompts import (
+    AGENT1_ENTITY_IDENTIFICATION_PROMPT,
+    AGENT2_VALIDATION_PROMPT,
+    AGENT3_RISK_ASSESSMENT_PROMPT,
+)
+from ..domain.models import Document
+
+if TYPE_CHECKING:
+    from .orchestrator import AnonymizationResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when the serialized layout of AnonymizationResult changes, or when
+# the in-process Agent 3 scorer (not covered by the prompts) scores differently
+# (2: deterministic scorer with dimension_scores replaced the stub)
+CACHE_FORMAT_VERSION = "2"
+
+# Marker used to render prompt templates for fingerprinting
+_PROMPT_MARKER = "\x00__fingerprint__\x00"
+
+# File identifying disk tier directories created by the cache; only
+# directories named like a fingerprint and holding it are ever purged
+_DISK_MARKER = ".anonymizer-result-cache"
+_DISK_DIR_NAME = re.compile(r"^[0-9a-f]{16}$")
+
+
+def _backend_material(backend: Any) -> Dict[str, Any]:
+    """Settings of an LLM backend that influence its answers."""
+    return {
+        "provider": backend.provider,
+        "model": backend.model,
+        "temperature": backend.temperature,
+        "max_tokens": backend.max_tokens,
+    }
+
+
+def compute_config_fingerprint(config: AppConfig) -> str:
+    """Compute a stable fingerprint of the configuration affecting results.
+
+    The rendered prompt templates are part of the fingerprint, so editing a
+    prompt invalidates cached results even if prompt_version was not bumped.
+    Fallback backends, the hedging secondary and cassette replay are
+    included, since any of them may produce a cached result.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Hex digest identifying the result-relevant configuration
+    """
+    prompts = "".join(
+        template(_PROMPT_MARKER)
+        for template in (
+            AGENT1_ENTITY_IDENTIFICATION_PROMPT,
+            AGENT2_VALIDATION_PROMPT,
+            AGENT3_RISK_ASSESSMENT_PROMPT,
+        )
+    )
+    material = {
+        "format": CACHE_FORMAT_VERSION,
+        "llm": _backend_material(config.llm),
+        "fallbacks": [_backend_material(backend) for backend in config.llm.fallbacks],
+        "hedging_secondary": (
+            _backend_material(config.llm.hedging.secondary)
+            if config.llm.hedging.enabled and config.llm.hedging.secondary is not None
+            else None),
+        "cassette": (
+            {
+                "path": config.llm.cassette.path,
+                "fallback_to_live": config.llm.cassette.fallback_to_live,
+            }
+            if config.llm.cassette.mode == "replay" else None),
+        "prompt_versions": [
+            config.agent1.prompt_version,
+            config.agent2.prompt_version,
+            config.agent3.prompt_version,
+        ],
+        "prompts": hashlib.sha256(prompts.encode("utf-8")).hexdigest(),
+        "max_iterations": config.orchestration.max_iterations,
+    }
+    encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory LRU + optional disk) cache of AnonymizationResults.
+
+    The memory tier is bounded by the total size of the serialized results
+    rather than by entry count, so a few very large documents cannot push
+    the process out of memory. The disk tier stores one JSON file per
+    result under a directory named after the fingerprint; directories the
+    cache created for other fingerprints are purged on startup. Other
+    contents of the disk path are left alone.
+
+    Example:
+        >>> cache = ResultCache(fingerprint="abc", max_memory_bytes=1024)
+        >>> key = cache.make_key("Contact John")
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[Path] = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            fingerprint: Configuration fingerprint (see compute_config_fingerprint)
+            max_memory_bytes: Upper bound for the in-memory tier
+            disk_path: Root directory for the on-disk tier (None disables it)
+        """
+        self.fingerprint = fingerprint
+        self.max_memory_bytes = max_memory_bytes
+        self._memory: "OrderedDict[str, Tuple[AnonymizationResult, int]]" = OrderedDict()
+        self._memory_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        self._disk_dir: Optional[Path] = None
+        if disk_path is not None:
+            self._disk_dir = Path(disk_path) / fingerprint[:16]
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            (self._disk_dir / _DISK_MARKER).touch()
+            self._purge_stale(Path(disk_path))
+
+    def make_key(self, content: str) -> str:
+        """Build the cache key for a document's content.
+
+        Args:
+            content: Document text
+
+        Returns:
+            Hex digest combining content hash and configuration fingerprint
+        """
+        digest = hashlib.sha256(content.encode("utf-8"))
+        digest.update(self.fingerprint.encode("ascii"))
+        return digest.hexdigest()
+
+    async def get(self, document: Document) -> Optional["AnonymizationResult"]:
+        """Look up a cached result for a document.
+
+        Args:
+            document: Document being anonymized
+
+        Returns:
+            Cached result bound to the given document, or None on a miss
+        """
+        key = self.make_key(document.content)
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return replace(entry[0], document=document)
+
+        if self._disk_dir is not None:
+            payload = await asyncio.to_thread(self._read_disk, key)
+            if payload is not None:
+                result = self._deserialize(payload, document)
+                if result is not None:
+                    self._store_memory(key, result, len(payload))
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return result
+
+        self.misses += 1
+        return None
+
+    async def put(self, result: "AnonymizationResult") -> None:
+        """Store a result in the cache.
+
+        Args:
+            result: Result of a completed anonymization workflow
+        """
+        key = self.make_key(result.document.content)
+        payload = self._serialize(result)
+        self._store_memory(key, result, len(payload))
+
+        if self._disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, payload)
+
+    def invalidate(self) -> None:
+        """Drop every cached entry from both tiers."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self._disk_dir is not None:
+            shutil.rmtree(self._disk_dir, ignore_errors=True)
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            (self._disk_dir / _DISK_MARKER).touch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and memory tier usage
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "max_memory_bytes": self.max_memory_bytes,
+        }
+
+    def _store_memory(self, key: str, result: "AnonymizationResult", size: int) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        if size > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[1]
+
+        self._memory[key] = (result, size)
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (_, evicted_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self.evictions += 1
+
+    def _serialize(self, result: "AnonymizationResult") -> bytes:
+        """Serialize a result (without the document) to JSON bytes."""
+        data = {
+            "anonymizationMapping": result.anonymizationMapping.model_dump(mode="json"),
+            "validation": result.validation.model_dump(mode="json"),
+            "risk_assessment": result.risk_assessment.model_dump(mode="json"),
+            "iterations": result.iterations,
+            "success": result.success,
+        }
+        return json.dumps(data).encode("utf-8")
+
+    def _deserialize(
+        self,
+        payload: bytes,
+        document: Document
+    ) -> Optional["AnonymizationResult"]:
+        """Rebuild a result from JSON bytes, or None if the entry is corrupt."""
+        from .orchestrator import AnonymizationResult
+        from ..domain.models import AnonymizationMapping, RiskAssessment, ValidationResult
+
+        try:
+            data = json.loads(payload)
+            return AnonymizationResult(
+                document=document,
+                anonymizationMapping=AnonymizationMapping.model_validate(
+                    data["anonymizationMapping"]),
+                validation=ValidationResult.model_validate(data["validation"]),
+                risk_assessment=RiskAssessment.model_validate(data["risk_assessment"]),
+                iterations=data["iterations"],
+                success=data["success"],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding corrupt cache entry: {e}")
+            return None
+
+    def _disk_file(self, key: str) -> Path:
+        """Get the on-disk location for a key."""
+        assert self._disk_dir is not None
+        return self._disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read a payload from the disk tier."""
+        try:
+            return self._disk_file(key).read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, payload: bytes) -> None:
+        """Write a payload to the disk tier atomically."""
+        path = self._disk_file(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry to disk: {e}")
+
+    def _purge_stale(self, root: Path) -> None:
+        """Remove disk tier directories the cache wrote under other fingerprints."""
+        assert self._disk_dir is not None
+        for child in root.iterdir():
+            if (
+                child != self._disk_dir
+                and _DISK_DIR_NAME.match(child.name)
+                and (child / _DISK_MARKER).is_file()
+            ):
+                logger.info(f"Purging stale result cache directory: {child}")
+                shutil.rmtree(child, ignore_errors=True)
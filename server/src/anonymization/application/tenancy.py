@@ -0,0 +1,39 @@
+"""Tenant identity of the current request or task."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+DEFAULT_TENANT = "default"
+
+_current_tenant: ContextVar[str] = ContextVar("tenant", default=DEFAULT_TENANT)
+
+
+def current_tenant() -> str:
+    """Get the tenant on whose behalf the current code runs.
+
+    Returns:
+        Tenant set by the nearest enclosing tenant_scope (DEFAULT_TENANT by default)
+    """
+    return _current_tenant.get()
+
+
+@contextmanager
+def tenant_scope(tenant: str) -> Iterator[None]:
+    """Run the enclosed code, and tasks it creates, on behalf of a tenant.
+
+    The tenant is carried through the orchestrator and agents to the LLM
+    call scheduler, which shares capacity fairly between tenants.
+
+    Args:
+        tenant: Tenant identifier
+
+    Example:
+        >>> with tenant_scope("team-a"):
+        ...     await orchestrator.anonymize_document(document)
+    """
+    token = _current_tenant.set(tenant)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
@@ -0,0 +1,252 @@
+"""Lightweight in-process tracing of a request's stages.
+
+A trace is opened per request with ``trace_scope``; code on the request's
+path wraps stages in ``span`` blocks. The current trace and span live in
+context variables, so spans opened in tasks spawned by the request nest
+under the span that spawned them. Outside a trace, ``span`` does nothing.
+
+Per-stage totals are aggregated as spans end, so timings cover every
+stage, while a trace keeps at most ``max_spans`` spans for export: a long
+upload or stream records thousands of stages and must not hold them all.
+
+Example:
+    >>> with trace_scope("POST /api/v1/anonymize") as trace:
+    ...     with span("agent1"):
+    ...         ...
+    >>> trace.timings()
+    {'agent1': 812.4}
+"""
+
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+# Spans kept per trace (including the root) unless configured otherwise
+DEFAULT_MAX_SPANS = 256
+
+
+@dataclass
+class Span:
+    """A timed stage of a trace.
+
+    Attributes:
+        name: Stage name (e.g. "agent1", "llm.generate")
+        span_id: 16 hex digit span identifier
+        parent_id: Identifier of the enclosing span (None for the root)
+        start_ns: Start time (Unix epoch nanoseconds)
+        end_ns: End time, None while the span is open
+        attributes: Stage details (backend, iteration, ...)
+        error: Exception type if the stage failed
+    """
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds (up to now while the span is open)."""
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+
+class Trace:
+    """The spans recorded for one request.
+
+    Attributes:
+        spans: Recorded spans, the root first, at most ``max_spans``
+        dropped_spans: Spans timed but not kept because of ``max_spans``
+    """
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        max_spans: int = DEFAULT_MAX_SPANS
+    ) -> None:
+        """Open a trace and its root span.
+
+        Args:
+            name: Root span name
+            attributes: Root span attributes
+            max_spans: Spans kept for export, including the root
+        """
+        self.trace_id = secrets.token_hex(16)
+        self.root = Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_id=None,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes or {})
+        )
+        self.spans: List[Span] = [self.root]
+        self.max_spans = max(1, max_spans)
+        self.dropped_spans = 0
+        # Stage name -> [total milliseconds, finished spans], in order of first start
+        self._stages: Dict[str, List[float]] = {}
+
+    def _start(self, recorded: Span) -> None:
+        """Register a span that started, keeping it if there is room."""
+        self._stages.setdefault(recorded.name, [0.0, 0])
+        if len(self.spans) < self.max_spans:
+            self.spans.append(recorded)
+        else:
+            self.dropped_spans += 1
+
+    def _finish(self, recorded: Span) -> None:
+        """Add a span that ended to the totals of its stage."""
+        stage = self._stages[recorded.name]
+        stage[0] += recorded.duration_ms
+        stage[1] += 1
+
+    def timings(self) -> Dict[str, float]:
+        """Total time per stage name, in milliseconds.
+
+        Stages that ran several times (retries, iterations, batch
+        documents) are summed. ``total`` is the root span so far.
+
+        Returns:
+            Stage name to milliseconds, in order of first start
+        """
+        totals = {name: ms for name, (ms, count) in self._stages.items() if count}
+        totals["total"] = self.root.duration_ms
+        return {name: round(ms, 3) for name, ms in totals.items()}
+
+    def to_otlp(self, service_name: str) -> Dict[str, Any]:
+        """Convert the trace to an OTLP/JSON ExportTraceServiceRequest.
+
+        Args:
+            service_name: Value of the ``service.name`` resource attribute
+
+        Returns:
+            JSON-serializable dictionary, one line of an OTLP JSON file
+        """
+        if self.dropped_spans:
+            self.root.attributes["dropped_spans"] = self.dropped_spans
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "anonymization"},
+                    "spans": [self._otlp_span(recorded) for recorded in self.spans],
+                }],
+            }]
+        }
+
+    def _otlp_span(self, recorded: Span) -> Dict[str, Any]:
+        """Convert one span to OTLP/JSON."""
+        end_ns = recorded.end_ns if recorded.end_ns is not None else time.time_ns()
+        otlp: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": recorded.span_id,
+            "name": recorded.name,
+            "kind": SPAN_KIND_SERVER if recorded is self.root else SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(recorded.start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in recorded.attributes.items()],
+            # Status codes: 1 OK, 2 ERROR
+            "status": {"code": 2, "message": recorded.error} if recorded.error else {"code": 1},
+        }
+        if recorded.parent_id is not None:
+            otlp["parentSpanId"] = recorded.parent_id
+        return otlp
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("anonymization_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("anonymization_span", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    """Get the trace of the current request, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_scope(
+    name: str,
+    max_spans: int = DEFAULT_MAX_SPANS,
+    **attributes: Any
+) -> Iterator[Trace]:
+    """Open a trace for the code run in the block.
+
+    Args:
+        name: Root span name
+        max_spans: Spans kept for export, including the root
+        **attributes: Root span attributes
+
+    Yields:
+        The trace; its root span ends when the block exits
+    """
+    trace = Trace(name, attributes, max_spans=max_spans)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.root.error = type(e).__name__
+        raise
+    finally:
+        trace.root.end_ns = time.time_ns()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a stage of the current trace.
+
+    Args:
+        name: Stage name
+        **attributes: Stage details
+
+    Yields:
+        The span, or None outside a trace
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    recorded = Span(
+        name=name,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent is not None else trace.root.span_id,
+        start_ns=time.time_ns(),
+        attributes=attributes
+    )
+    trace._start(recorded)
+    token = _current_span.set(recorded)
+    try:
+        yield recorded
+    except BaseException as e:
+        recorded.error = type(e).__name__
+        raise
+    finally:
+        recorded.end_ns = time.time_ns()
+        trace._finish(recorded)
+        _current_span.reset(token)
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Convert an attribute to an OTLP/JSON KeyValue."""
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
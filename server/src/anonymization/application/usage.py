@@ -0,0 +1,179 @@
+"""LLM usage (tokens, latency, time to first token) of the current request.
+
+Adapters report every call with ``record_llm_usage``; the record is
+labelled with the agent and iteration set by the orchestrator and added
+to the usage recorder of the enclosing ``usage_scope``. The provider
+interface stays ``generate(prompt) -> str``, so wrappers (scheduler,
+fallbacks, hedging, cassettes) need no changes, and hedged or retried
+calls are counted individually, as they are billed.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .metrics import LLM_TIME_TO_FIRST_TOKEN, LLM_TOKENS
+
+
+@dataclass
+class LLMUsage:
+    """Usage of one LLM call.
+
+    Attributes:
+        model: Model that answered, as reported by the provider
+        input_tokens: Prompt tokens (None if not reported)
+        output_tokens: Generated tokens (None if not reported)
+        latency_ms: Wall time of the call in the adapter
+        time_to_first_token_ms: Time until the first generated token, if
+            the provider reports it (Ollama: model load plus prompt eval)
+        agent: Agent that made the call
+        iteration: Orchestrator iteration of the call
+    """
+    model: str
+    input_tokens: Optional[int]
+    output_tokens: Optional[int]
+    latency_ms: float
+    time_to_first_token_ms: Optional[float] = None
+    agent: Optional[str] = None
+    iteration: Optional[int] = None
+
+
+class UsageRecorder:
+    """The LLM calls of one request, with per-agent and per-iteration totals."""
+
+    def __init__(self) -> None:
+        self.calls: List[LLMUsage] = []
+
+    def add(self, usage: LLMUsage) -> None:
+        """Record a call."""
+        self.calls.append(usage)
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, per-agent and per-iteration totals and the individual calls.
+
+        Returns:
+            JSON-serializable usage summary
+        """
+        by_agent: Dict[str, List[LLMUsage]] = {}
+        by_iteration: Dict[int, List[LLMUsage]] = {}
+        for call in self.calls:
+            by_agent.setdefault(call.agent or "unknown", []).append(call)
+            if call.iteration is not None:
+                by_iteration.setdefault(call.iteration, []).append(call)
+        return {
+            "totals": _totals(self.calls),
+            "by_agent": {agent: _totals(calls) for agent, calls in by_agent.items()},
+            "by_iteration": {
+                iteration: _totals(calls) for iteration, calls in sorted(by_iteration.items())},
+            "calls": [asdict(call) for call in self.calls],
+        }
+
+
+def _totals(calls: List[LLMUsage]) -> Dict[str, Any]:
+    """Summed tokens and latency of calls; time to first token is averaged."""
+    first_token = [call.time_to_first_token_ms for call in calls
+                   if call.time_to_first_token_ms is not None]
+    return {
+        "calls": len(calls),
+        "input_tokens": sum(call.input_tokens or 0 for call in calls),
+        "output_tokens": sum(call.output_tokens or 0 for call in calls),
+        "latency_ms": round(sum(call.latency_ms for call in calls), 3),
+        "avg_time_to_first_token_ms": (
+            round(sum(first_token) / len(first_token), 3) if first_token else None),
+    }
+
+
+_current_usage: ContextVar[Optional[UsageRecorder]] = ContextVar("llm_usage", default=None)
+_usage_labels: ContextVar[Tuple[Optional[str], Optional[int]]] = ContextVar(
+    "llm_usage_labels", default=(None, None))
+
+
+def current_usage() -> Optional[UsageRecorder]:
+    """Get the usage recorder of the enclosing usage_scope, if any."""
+    return _current_usage.get()
+
+
+@contextmanager
+def usage_scope() -> Iterator[UsageRecorder]:
+    """Collect the usage of LLM calls made by the enclosed code and its tasks.
+
+    A nested scope shares the recorder of the enclosing one, so a request
+    handler and the orchestrator it calls see the same calls.
+
+    Example:
+        >>> with usage_scope() as usage:
+        ...     await orchestrator.anonymize_document(document)
+        >>> usage.summary()["totals"]["output_tokens"]
+    """
+    recorder = _current_usage.get()
+    if recorder is not None:
+        yield recorder
+        return
+    recorder = UsageRecorder()
+    token = _current_usage.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_usage.reset(token)
+
+
+@contextmanager
+def usage_labels(agent: str, iteration: Optional[int] = None) -> Iterator[None]:
+    """Attribute the LLM calls of the enclosed code to an agent and iteration.
+
+    Args:
+        agent: Agent name (agent1, agent2, ...)
+        iteration: Orchestrator iteration (1-based)
+    """
+    token = _usage_labels.set((agent, iteration))
+    try:
+        yield
+    finally:
+        _usage_labels.reset(token)
+
+
+def record_llm_usage(
+    model: str,
+    input_tokens: Optional[int],
+    output_tokens: Optional[int],
+    latency_seconds: float,
+    time_to_first_token_seconds: Optional[float] = None
+) -> LLMUsage:
+    """Record a finished LLM call in the metrics and the current usage scope.
+
+    Args:
+        model: Model that answered
+        input_tokens: Prompt tokens (None if not reported)
+        output_tokens: Generated tokens (None if not reported)
+        latency_seconds: Wall time of the call
+        time_to_first_token_seconds: Time until the first token, if known
+
+    Returns:
+        The usage record
+    """
+    agent, iteration = _usage_labels.get()
+    usage = LLMUsage(
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        latency_ms=round(latency_seconds * 1000, 3),
+        time_to_first_token_ms=(
+            round(time_to_first_token_seconds * 1000, 3)
+            if time_to_first_token_seconds is not None else None),
+        agent=agent,
+        iteration=iteration
+    )
+
+    agent_label = agent or "unknown"
+    if input_tokens:
+        LLM_TOKENS.inc(input_tokens, model=model, agent=agent_label, direction="input")
+    if output_tokens:
+        LLM_TOKENS.inc(output_tokens, model=model, agent=agent_label, direction="output")
+    if time_to_first_token_seconds is not None:
+        LLM_TIME_TO_FIRST_TOKEN.observe(time_to_first_token_seconds, model=model)
+
+    recorder = _current_usage.get()
+    if recorder is not None:
+        recorder.add(usage)
+    return usage
@@ -1,18 +1,18 @@
 """Agent 3 (RISK-ASSESS) prompts for risk assessment.
 
-Version: v1 (Stub)
+Version: v1
 Last Updated: 2025-10-06
 
-Note: This is a stub implementation. Agent 3 does not currently use LLM
-      and returns hardcoded NEGLIGIBLE risk. This prompt is reserved for
-      future implementation.
+Note: Agent 3 does not use an LLM. It scores the five dimensions listed in
+      this prompt deterministically in-process. This prompt defines those
+      dimensions and is reserved for an optional LLM-based assessment.
 """
 
 
 def AGENT3_RISK_ASSESSMENT_PROMPT(anonymized_text: str) -> str:
     """Create prompt for Agent 3 risk assessment.
 
-    Note: Currently unused as Agent 3 is a stub implementation.
+    Note: Currently unused; Agent 3 scores these dimensions in-process.
 
     Args:
         anonymized_text: The text after Agent 1 + Agent 2 processing
@@ -24,3 +24,8 @@ class ValidationError(DomainException):
 class RiskAssessmentError(DomainException):
     """Raised when risk assessment processing fails."""
     pass
+
+
+class LLMProviderUnavailableError(DomainException):
+    """Raised when no LLM provider backend is available to serve a call."""
+    pass
@@ -5,6 +5,7 @@ from .entity import Entity, EntityType
 from .anonymization_mapping import AnonymizationMapping
 from .validation_result import ValidationResult, ValidationIssue
 from .risk_assessment import RiskAssessment
+from .job import Job, JobItem
 
 __all__ = [
     "Document",
@@ -14,4 +15,6 @@ __all__ = [
     "ValidationResult",
     "ValidationIssue",
     "RiskAssessment",
+    "Job",
+    "JobItem",
 ]
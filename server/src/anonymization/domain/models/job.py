@@ -0,0 +1,62 @@
+"""Asynchronous anonymization job entities."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class Job(BaseModel):
+    """A batch of documents processed in the background.
+
+    Attributes:
+        job_id: Unique job identifier
+        tenant_id: Tenant that created the job
+        status: pending, running or completed
+        total: Number of documents in the job
+        completed: Documents processed successfully
+        failed: Documents whose processing failed
+        created_at: UTC timestamp of job creation
+        updated_at: UTC timestamp of the last progress update
+
+    Example:
+        >>> job.progress
+        0.5
+    """
+
+    job_id: str = Field(description="Unique job identifier")
+    tenant_id: str = Field(default="default", description="Tenant that created the job")
+    status: str = Field(description="Job status (pending|running|completed)")
+    total: int = Field(ge=0, description="Number of documents")
+    completed: int = Field(default=0, ge=0, description="Successfully processed documents")
+    failed: int = Field(default=0, ge=0, description="Failed documents")
+    created_at: datetime = Field(description="UTC timestamp of creation")
+    updated_at: datetime = Field(description="UTC timestamp of last update")
+
+    @property
+    def progress(self) -> float:
+        """Fraction of documents processed (0.0-1.0)."""
+        if self.total == 0:
+            return 1.0
+        return (self.completed + self.failed) / self.total
+
+
+class JobItem(BaseModel):
+    """A single document of a job.
+
+    Attributes:
+        job_id: Job the document belongs to
+        tenant_id: Tenant that created the job
+        index: Position of the document in the job
+        document_id: Optional client-side document identifier
+        text: Document text (None once the document has been processed)
+        status: pending, running, done or failed
+        result: Processing result once finished
+    """
+
+    job_id: str = Field(description="Job identifier")
+    tenant_id: str = Field(default="default", description="Tenant that created the job")
+    index: int = Field(ge=0, description="Position of the document in the job")
+    document_id: Optional[str] = Field(default=None, description="Document identifier")
+    text: Optional[str] = Field(default=None, description="Document text")
+    status: str = Field(default="pending", description="Item status")
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Processing result")
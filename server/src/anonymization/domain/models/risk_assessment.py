@@ -1,6 +1,7 @@
 """Risk assessment result from Agent 3."""
 
 from datetime import datetime
+from typing import Dict
 from pydantic import BaseModel, Field
 
 
@@ -16,6 +17,7 @@ class RiskAssessment(BaseModel):
         confidence: Assessment confidence level (0.0-1.0)
         reasoning: Human-readable explanation of the assessment
         assessment_date: UTC timestamp of when assessment was completed
+        dimension_scores: Score (1-5) of each risk dimension
 
     Example:
         >>> from datetime import datetime, UTC
@@ -47,6 +49,10 @@ class RiskAssessment(BaseModel):
     )
     reasoning: str = Field(description="Explanation of risk assessment")
     assessment_date: datetime = Field(description="UTC timestamp of assessment")
+    dimension_scores: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Score (1-5) of each risk dimension"
+    )
 
     def is_safe_to_publish(self) -> bool:
         """Check if document is safe to publish."""
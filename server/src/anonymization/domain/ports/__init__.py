@@ -2,10 +2,12 @@
 
 from .agent_interfaces import IAgent1, IAgent2, IAgent3
 from .llm_provider_interface import ILLMProvider
+from .job_store_interface import IJobStore
 
 __all__ = [
     "IAgent1",
     "IAgent2",
     "IAgent3",
     "ILLMProvider",
+    "IJobStore",
 ]
@@ -0,0 +1,101 @@
+"""Job store interface - Port for durable job queues."""
+
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from ..models import Job, JobItem
+
+
+class IJobStore(Protocol):
+    """Interface for durable storage of asynchronous jobs.
+
+    The store is both the job registry and the work queue: documents are
+    claimed one at a time by workers and their results written back, so
+    a restart only loses the documents that were in flight. A claim is a
+    lease of the claiming worker: it is renewed while the document is
+    processed and requeued only once it expired.
+    """
+
+    async def create_job(
+        self,
+        documents: List[Tuple[Optional[str], str]],
+        tenant_id: str = "default"
+    ) -> Job:
+        """Create a job and enqueue its documents.
+
+        Args:
+            documents: (document_id, text) pairs in job order
+            tenant_id: Tenant creating the job
+
+        Returns:
+            The created job
+        """
+        ...
+
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job with its progress, or None if unknown."""
+        ...
+
+    async def claim_next(self) -> Optional[JobItem]:
+        """Atomically claim a pending document, or None if idle.
+
+        Tenants with pending work are served round-robin, oldest job and
+        document first within a tenant.
+        """
+        ...
+
+    async def complete_item(self, item: JobItem, result: Dict[str, Any], success: bool) -> None:
+        """Store the result of a claimed document, if the lease is still held.
+
+        Args:
+            item: Claimed document
+            result: JSON-serializable processing result
+            success: Whether processing succeeded
+        """
+        ...
+
+    async def get_results(self, job_id: str, cursor: int, limit: int) -> List[JobItem]:
+        """Get documents with index >= cursor and their status, in index order.
+
+        Results are set for finished (done or failed) documents only.
+        """
+        ...
+
+    async def delete_job(self, job_id: str) -> bool:
+        """Delete a job with its documents and results.
+
+        Returns:
+            Whether the job existed
+        """
+        ...
+
+    async def purge_finished(self, older_than_seconds: float) -> int:
+        """Delete finished jobs last updated more than older_than_seconds ago.
+
+        Returns:
+            Number of deleted jobs
+        """
+        ...
+
+    async def renew_leases(self) -> int:
+        """Extend the leases of the documents this worker is processing.
+
+        Returns:
+            Number of renewed leases
+        """
+        ...
+
+    async def requeue_expired(self) -> int:
+        """Return documents whose lease expired to the queue.
+
+        Returns:
+            Number of requeued documents
+        """
+        ...
+
+    async def release_claims(self) -> int:
+        """Return the documents this worker is processing to the queue.
+
+        Returns:
+            Number of released documents
+        """
+        ...
@@ -1,5 +1,26 @@
 """LLM provider adapters."""
 
-from .factory import create_llm_provider
+from .factory import create_llm_provider, create_provider_chain
+from .hedging import HedgedLLMProvider
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .fallback import FallbackLLMProvider, ProviderBackend
+from .instrumented import InstrumentedLLMProvider
+from .fake_adapter import FakeLLMAdapter
+from .cassette import CassetteMissError, RecordingLLMProvider, ReplayLLMProvider
+from .scheduler import LLMCallScheduler
 
-__all__ = ["create_llm_provider"]
+__all__ = [
+    "create_llm_provider",
+    "create_provider_chain",
+    "HedgedLLMProvider",
+    "CircuitBreaker",
+    "CircuitState",
+    "FallbackLLMProvider",
+    "ProviderBackend",
+    "InstrumentedLLMProvider",
+    "FakeLLMAdapter",
+    "CassetteMissError",
+    "RecordingLLMProvider",
+    "ReplayLLMProvider",
+    "LLMCallScheduler",
+]
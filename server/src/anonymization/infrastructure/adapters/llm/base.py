@@ -1,7 +1,9 @@
 """Base LLM adapter with common functionality."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
+
+from ....application.usage import record_llm_usage
 
 
 class BaseLLMAdapter(ABC):
@@ -38,3 +40,56 @@ class BaseLLMAdapter(ABC):
             Exception: If LLM call fails
         """
         pass
+
+    def _record_usage(
+        self,
+        input_tokens: Optional[int],
+        output_tokens: Optional[int],
+        latency_seconds: float,
+        time_to_first_token_seconds: Optional[float] = None,
+        model: Optional[str] = None
+    ) -> None:
+        """Record the usage of a call, as reported by the provider.
+
+        Args:
+            input_tokens: Prompt tokens (None if not reported)
+            output_tokens: Generated tokens (None if not reported)
+            latency_seconds: Wall time of the call
+            time_to_first_token_seconds: Time until the first token, if reported
+            model: Model named in the response (default: the configured model)
+        """
+        record_llm_usage(
+            model=str(model or getattr(self, "model", "unknown")),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_seconds=latency_seconds,
+            time_to_first_token_seconds=time_to_first_token_seconds
+        )
+
+    async def warm_up(self) -> None:
+        """Prepare the provider for traffic.
+
+        Called once at application startup. The default implementation does
+        nothing; adapters override it to open connections or pre-load models.
+        """
+        return None
+
+    async def probe(self) -> None:
+        """Check cheaply that the backend is reachable and can serve the model.
+
+        Used by the readiness probe on an interval. The default sends a
+        short prompt; adapters override it with a cheaper call.
+
+        Raises:
+            Exception: If the backend is unreachable or cannot serve the model
+        """
+        await self.generate("ping")
+
+    async def close(self) -> None:
+        """Release the provider client's connections."""
+        close = getattr(self.client, "close", None)
+        if close is None:
+            return
+        result = close()
+        if hasattr(result, "__await__"):
+            await result
@@ -0,0 +1,305 @@
+"""Record and replay LLM calls for reproducible benchmark runs.
+
+A cassette is a JSON lines file (gzip-compressed if the name ends in
+``.gz``). The first line is a header; every further line is one call:
+
+    {"prompt_sha256": "...", "occurrence": 0, "prompt_chars": 5230,
+     "response": "...", "latency_ms": 812.4}
+
+Calls are keyed by the SHA-256 of the prompt and the number of times the
+same prompt was seen before, so retries of a prompt replay the answers
+recorded for each attempt. Prompts are not stored unless requested.
+Responses are, and they contain the personal data found in the
+documents: cassettes must be handled like the corpus they were recorded
+from.
+
+Example:
+    >>> recorder = RecordingLLMProvider(live_provider, "cassettes/corpus.jsonl.gz")
+    >>> # ... run the corpus, then
+    >>> await recorder.close()
+    >>> replay = ReplayLLMProvider("cassettes/corpus.jsonl.gz", replay_latency=True)
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+
+from ....domain.ports import ILLMProvider
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed prompt is not in the cassette."""
+    pass
+
+
+def _prompt_key(prompt: str) -> str:
+    """SHA-256 of a prompt."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    """Open a cassette, compressed if the name ends in .gz."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _read_lines(path: Path) -> Tuple[List[str], bool]:
+    """Read the complete lines of a cassette.
+
+    A gzip cassette whose recording was interrupted lacks the gzip
+    trailer; its flushed lines are still returned.
+
+    Returns:
+        Tuple of (complete lines, whether the file was truncated)
+    """
+    lines: List[str] = []
+    truncated = False
+    with _open(path, "r") as f:
+        try:
+            for line in f:
+                lines.append(line)
+        except EOFError:
+            truncated = True
+    if lines and not lines[-1].endswith("\n"):
+        # A line cut off in the middle of a write
+        lines.pop()
+        truncated = True
+    return lines, truncated
+
+
+class RecordingLLMProvider:
+    """LLM provider wrapper writing every successful call to a cassette.
+
+    Each call is appended and flushed as it completes, in a worker thread
+    so the event loop does not wait on disk I/O. An interrupted run keeps
+    what it recorded: replay reads a gzip cassette that was never closed
+    up to its last flushed line. Failed calls are not recorded; replaying
+    such a prompt falls through to the replay provider's fallback.
+
+    Example:
+        >>> provider = RecordingLLMProvider(adapter, "cassettes/run.jsonl.gz")
+        >>> text = await provider.generate("prompt")
+    """
+
+    def __init__(
+        self,
+        inner: ILLMProvider,
+        path: Union[str, Path],
+        store_prompts: bool = False,
+        backend: Optional[str] = None
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            inner: Provider whose calls are recorded
+            path: Cassette file (overwritten)
+            store_prompts: Also store the prompt text (for debugging replays)
+            backend: Backend name written to the header
+        """
+        self.inner = inner
+        self.path = Path(path)
+        self.store_prompts = store_prompts
+        self.backend = backend
+        self._seen: Dict[str, int] = {}
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """Append one line to the cassette, opening it on first use (worker thread)."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._write_line(line)
+
+    def _write_line(self, line: str) -> None:
+        """Write a line under the lock, opening the cassette on first use."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = _open(self.path, "w")
+            self._file.write(json.dumps({
+                "cassette": CASSETTE_VERSION,
+                "recorded_at": datetime.now(UTC).isoformat(),
+                "backend": self.backend,
+            }) + "\n")
+        self._file.write(line)
+        self._file.flush()
+
+    def _close_file(self) -> None:
+        """Close the cassette, writing the gzip trailer (worker thread)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a response and record it.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+
+        Returns:
+            Text response from the wrapped provider
+        """
+        key = _prompt_key(prompt)
+        occurrence = self._seen.get(key, 0)
+        self._seen[key] = occurrence + 1
+
+        start = time.perf_counter()
+        response = await self.inner.generate(prompt)
+        entry: Dict[str, Any] = {
+            "prompt_sha256": key,
+            "occurrence": occurrence,
+            "prompt_chars": len(prompt),
+            "response": response,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        if self.store_prompts:
+            entry["prompt"] = prompt
+        await asyncio.to_thread(self._write, entry)
+        self.recorded += 1
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Get recording statistics."""
+        return {"cassette": str(self.path), "recorded": self.recorded}
+
+    async def probe(self) -> None:
+        """Probe the wrapped provider."""
+        provider_probe = getattr(self.inner, "probe", None)
+        if provider_probe is not None:
+            await provider_probe()
+
+    async def warm_up(self) -> None:
+        """Warm up the wrapped provider."""
+        provider_warm_up = getattr(self.inner, "warm_up", None)
+        if provider_warm_up is not None:
+            await provider_warm_up()
+
+    async def close(self) -> None:
+        """Close the cassette and the wrapped provider."""
+        if self._file is not None:
+            await asyncio.to_thread(self._close_file)
+            logger.info(f"Recorded {self.recorded} LLM calls to {self.path}")
+        provider_close = getattr(self.inner, "close", None)
+        if provider_close is not None:
+            await provider_close()
+
+
+class ReplayLLMProvider:
+    """LLM provider answering from a cassette.
+
+    The n-th call with a given prompt gets the answer recorded for its
+    n-th occurrence; further calls repeat the last recorded answer.
+    Prompts not in the cassette (for example after a prompt change) go to
+    the fallback provider, or raise CassetteMissError without one.
+
+    Example:
+        >>> provider = ReplayLLMProvider("cassettes/run.jsonl.gz", replay_latency=True)
+        >>> text = await provider.generate("prompt")
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        replay_latency: bool = False,
+        latency_scale: float = 1.0,
+        fallback: Optional[ILLMProvider] = None
+    ) -> None:
+        """Load a cassette.
+
+        Args:
+            path: Cassette file written by RecordingLLMProvider
+            replay_latency: Wait the recorded latency before answering
+            latency_scale: Factor applied to recorded latencies
+            fallback: Provider for prompts missing from the cassette
+
+        Raises:
+            FileNotFoundError: If the cassette does not exist
+            ValueError: If the file is not a supported cassette
+        """
+        self.path = Path(path)
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self.fallback = fallback
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._seen: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+        lines, truncated = _read_lines(self.path)
+        header = json.loads(lines[0]) if lines else {}
+        if header.get("cassette") != CASSETTE_VERSION:
+            raise ValueError(f"Not a version {CASSETTE_VERSION} cassette: {self.path}")
+        self.header = header
+        for line in lines[1:]:
+            entry = json.loads(line)
+            self._entries.setdefault(entry["prompt_sha256"], []).append(entry)
+        if truncated:
+            logger.warning(
+                f"Cassette {self.path} is truncated (recording was interrupted); "
+                f"replaying its {len(lines) - 1} complete calls")
+        for entries in self._entries.values():
+            entries.sort(key=lambda entry: entry["occurrence"])
+
+    async def generate(self, prompt: str) -> str:
+        """Answer a prompt from the cassette.
+
+        Args:
+            prompt: The prompt text
+
+        Returns:
+            Recorded response
+
+        Raises:
+            CassetteMissError: If the prompt was not recorded and there is no fallback
+        """
+        key = _prompt_key(prompt)
+        entries = self._entries.get(key)
+        if not entries:
+            self.misses += 1
+            if self.fallback is None:
+                raise CassetteMissError(
+                    f"Prompt {key[:12]} ({len(prompt)} chars) not in cassette {self.path}")
+            return await self.fallback.generate(prompt)
+
+        occurrence = self._seen.get(key, 0)
+        self._seen[key] = occurrence + 1
+        entry = entries[min(occurrence, len(entries) - 1)]
+        self.hits += 1
+
+        if self.replay_latency:
+            await asyncio.sleep(entry["latency_ms"] / 1000 * self.latency_scale)
+        return entry["response"]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get replay statistics."""
+        return {
+            "cassette": str(self.path),
+            "prompts": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def probe(self) -> None:
+        """Probe the fallback provider; a cassette alone is always available."""
+        provider_probe = getattr(self.fallback, "probe", None)
+        if provider_probe is not None:
+            await provider_probe()
+
+    async def close(self) -> None:
+        """Close the fallback provider."""
+        provider_close = getattr(self.fallback, "close", None)
+        if provider_close is not None:
+            await provider_close()
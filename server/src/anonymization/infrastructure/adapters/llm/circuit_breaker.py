@@ -0,0 +1,176 @@
+"""Circuit breaker for LLM provider backends."""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Calls flow normally"""
+
+    OPEN = "open"
+    """Calls are rejected until the cooldown elapses"""
+
+    HALF_OPEN = "half_open"
+    """A limited number of trial calls probe the backend"""
+
+
+class CircuitBreaker:
+    """Circuit breaker driven by error rate and latency SLO violations.
+
+    Outcomes of the most recent calls are kept in a sliding window. The
+    circuit opens when the failure rate or the rate of calls slower than
+    ``slow_call_threshold_seconds`` exceeds its threshold. After
+    ``cooldown_seconds`` it half-opens and lets ``half_open_max_calls``
+    trial calls through: a success closes it, a failure re-opens it.
+
+    Example:
+        >>> breaker = CircuitBreaker("ollama", cooldown_seconds=10)
+        >>> if breaker.allow_request():
+        ...     breaker.record_success(latency_seconds=1.2)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold_seconds: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        cooldown_seconds: float = 30.0,
+        half_open_max_calls: int = 1
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            name: Backend name (for logging and metrics)
+            failure_rate_threshold: Failure rate that opens the circuit
+            slow_call_threshold_seconds: Latency SLO; None disables slow-call tracking
+            slow_call_rate_threshold: Slow-call rate that opens the circuit
+            window_size: Number of recent calls considered
+            min_calls: Calls required in the window before the circuit can open
+            cooldown_seconds: Time the circuit stays open before half-opening
+            half_open_max_calls: Trial calls allowed while half-open
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold_seconds = slow_call_threshold_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.min_calls = min_calls
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        # Each outcome is (failed, slow)
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, half-opening the circuit after the cooldown."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.cooldown_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be sent to the backend.
+
+        Returns:
+            True if the call is allowed (counts as a trial call when half-open)
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency_seconds: float) -> None:
+        """Record a successful call.
+
+        Args:
+            latency_seconds: Duration of the call
+        """
+        slow = (
+            self.slow_call_threshold_seconds is not None
+            and latency_seconds > self.slow_call_threshold_seconds
+        )
+        if self._state == CircuitState.HALF_OPEN:
+            if slow:
+                self._open()
+            else:
+                self._close()
+            return
+        self._outcomes.append((False, slow))
+        self._evaluate()
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append((True, False))
+        self._evaluate()
+
+    def release(self) -> None:
+        """Return a trial slot for a call that ended without an outcome."""
+        if self._state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics.
+
+        Returns:
+            Dictionary with state, window rates and counters
+        """
+        total = len(self._outcomes)
+        failures = sum(1 for failed, _ in self._outcomes if failed)
+        slow = sum(1 for _, is_slow in self._outcomes if is_slow)
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "failure_rate": failures / total if total else 0.0,
+            "slow_call_rate": slow / total if total else 0.0,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
+
+    def _evaluate(self) -> None:
+        """Open the circuit if the window violates a threshold."""
+        total = len(self._outcomes)
+        if total < self.min_calls:
+            return
+        failures = sum(1 for failed, _ in self._outcomes if failed)
+        slow = sum(1 for _, is_slow in self._outcomes if is_slow)
+        if (
+            failures / total >= self.failure_rate_threshold
+            or slow / total >= self.slow_call_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        """Transition to OPEN."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.times_opened += 1
+
+    def _close(self) -> None:
+        """Transition to CLOSED."""
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
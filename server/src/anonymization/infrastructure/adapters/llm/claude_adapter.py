@@ -1,6 +1,7 @@
 """Claude (Anthropic) LLM adapter implementation."""
 
 import os
+import time
 from .base import BaseLLMAdapter
 
 
@@ -31,7 +32,7 @@ class ClaudeAdapter(BaseLLMAdapter):
     def _initialize_client(self) -> None:
         """Initialize Anthropic client."""
         try:
-            from anthropic import Anthropic  # type: ignore[import-untyped]
+            from anthropic import AsyncAnthropic  # type: ignore[import-untyped]
         except ImportError:
             raise ImportError(
                 "Anthropic package not installed. Install with: pip install anthropic"
@@ -43,7 +44,7 @@ class ClaudeAdapter(BaseLLMAdapter):
                 "ANTHROPIC_API_KEY environment variable not set"
             )
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key)
 
     async def generate(self, prompt: str) -> str:
         """Generate response using Claude.
@@ -57,10 +58,37 @@ class ClaudeAdapter(BaseLLMAdapter):
         Raises:
             Exception: If Claude API call fails
         """
-        message = self.client.messages.create(
+        start = time.perf_counter()
+        message = await self.client.messages.create(
             model=self.model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
             messages=[{"role": "user", "content": prompt}]
         )
+        usage = getattr(message, "usage", None)
+        self._record_usage(
+            usage.input_tokens if usage is not None else None,
+            usage.output_tokens if usage is not None else None,
+            time.perf_counter() - start,
+            model=getattr(message, "model", None)
+        )
         return str(message.content[0].text)
+
+    async def probe(self) -> None:
+        """Generate a single token (the API has no cheaper model check).
+
+        The probe is billed, so its usage is recorded like any other call.
+        """
+        start = time.perf_counter()
+        message = await self.client.messages.create(
+            model=self.model,
+            max_tokens=1,
+            messages=[{"role": "user", "content": "ping"}]
+        )
+        usage = getattr(message, "usage", None)
+        self._record_usage(
+            usage.input_tokens if usage is not None else None,
+            usage.output_tokens if usage is not None else None,
+            time.perf_counter() - start,
+            model=getattr(message, "model", None)
+        )
@@ -1,28 +1,212 @@
 """Factory for creating LLM provider adapters."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 from .ollama_adapter import OllamaAdapter
 from .claude_adapter import ClaudeAdapter
 from .openai_adapter import OpenAIAdapter
+from .fake_adapter import FakeLLMAdapter
+from .cassette import RecordingLLMProvider, ReplayLLMProvider
+from .hedging import HedgedLLMProvider
+from .circuit_breaker import CircuitBreaker
+from .fallback import FallbackLLMProvider, ProviderBackend
+from .instrumented import InstrumentedLLMProvider
+from .scheduler import LLMCallScheduler
 
 
 def create_llm_provider(provider: str, config: Dict[str, Any]) -> Any:
     """Create an LLM provider adapter based on configuration.
 
+    Every backend adapter is wrapped in an InstrumentedLLMProvider that
+    records per-backend call latency and errors.
+
+    If the configuration contains a non-empty "fallbacks" list of
+    {"provider": ..., "config": {...}} entries, the adapter becomes the
+    first link of a fallback chain (see create_provider_chain) using the
+    optional "circuit_breaker" settings.
+
+    If the configuration contains an enabled "hedging" section, the result
+    is wrapped in a HedgedLLMProvider. The optional "secondary" entry of
+    that section (same shape as a fallback entry) names the backend that
+    receives hedge requests. Under a scheduler (see "max_concurrency"), a
+    hedge takes a free call slot and is skipped when none is free, so
+    hedges count against the concurrency limit.
+
+    If the configuration contains a "cassette" section with mode "record",
+    the calls reaching the backends are written to the cassette at "path".
+    With mode "replay", calls are answered from the cassette instead of
+    the backends (see ReplayLLMProvider); prompts missing from it go to the
+    configured backends only if "fallback_to_live" is set.
+
+    If the configuration sets "max_concurrency", the outermost layer is an
+    LLMCallScheduler admitting at most that many concurrent calls, served
+    by priority class with aging after "priority_aging_seconds" and shared
+    between tenants by weight and cap ("tenants": name -> {"weight",
+    "max_concurrency"}, "default_tenant" for unlisted tenants).
+
     Args:
-        provider: Provider name ("ollama", "claude", or "openai")
+        provider: Provider name ("ollama", "claude", "openai", or "fake")
         config: Configuration dictionary for the provider
 
     Returns:
         Initialized LLM adapter instance
 
     Raises:
-        ValueError: If provider is unknown
+        ValueError: If provider or cassette mode is unknown
 
     Example:
         >>> config = {"model": "gpt-4", "temperature": 0.1}
         >>> adapter = create_llm_provider("openai", config)
     """
+    cassette = config.get("cassette") or {}
+    mode = cassette.get("mode")
+    live = None
+    if mode == "replay":
+        if cassette.get("fallback_to_live", False):
+            live = _create_live_provider(provider, config)
+        adapter = InstrumentedLLMProvider(
+            ReplayLLMProvider(
+                cassette["path"],
+                replay_latency=cassette.get("replay_latency", False),
+                latency_scale=cassette.get("latency_scale", 1.0),
+                fallback=live
+            ),
+            "replay"
+        )
+    elif mode in (None, "record"):
+        adapter = live = _create_live_provider(provider, config)
+        if mode == "record":
+            adapter = RecordingLLMProvider(
+                adapter,
+                cassette["path"],
+                store_prompts=cassette.get("store_prompts", False),
+                backend=_backend_name(provider, config)
+            )
+    else:
+        raise ValueError(f"Unknown cassette mode: {mode}. Supported modes: record, replay")
+
+    max_concurrency = config.get("max_concurrency")
+    if max_concurrency:
+        tenants = config.get("tenants") or {}
+        default_tenant = config.get("default_tenant") or {}
+        adapter = LLMCallScheduler(
+            adapter,
+            max_concurrency=max_concurrency,
+            aging_seconds=config.get("priority_aging_seconds", 10.0),
+            tenant_weights={
+                name: share["weight"] for name, share in tenants.items() if "weight" in share
+            },
+            tenant_max_concurrency={
+                name: share["max_concurrency"]
+                for name, share in tenants.items() if share.get("max_concurrency")
+            },
+            default_tenant_weight=default_tenant.get("weight", 1.0),
+            default_tenant_max_concurrency=default_tenant.get("max_concurrency")
+        )
+        if isinstance(live, HedgedLLMProvider):
+            live.scheduler = adapter
+
+    return adapter
+
+
+def _create_live_provider(provider: str, config: Dict[str, Any]) -> Any:
+    """Create the instrumented backend with its fallbacks and hedging.
+
+    Args:
+        provider: Provider name of the primary backend
+        config: Configuration dictionary (see create_llm_provider)
+
+    Returns:
+        Provider calling the configured backends
+    """
+    name = _backend_name(provider, config)
+    adapter = InstrumentedLLMProvider(_create_adapter(provider, config), name)
+
+    fallbacks = config.get("fallbacks") or []
+    if fallbacks:
+        chain = [(name, adapter)]
+        for spec in fallbacks:
+            spec_config = spec.get("config", {})
+            spec_name = _backend_name(spec["provider"], spec_config)
+            chain.append((
+                spec_name,
+                InstrumentedLLMProvider(_create_adapter(spec["provider"], spec_config), spec_name)
+            ))
+        adapter = create_provider_chain(chain, config.get("circuit_breaker") or {})
+
+    hedging = config.get("hedging")
+    if hedging and hedging.get("enabled", False):
+        secondary_spec = hedging.get("secondary")
+        secondary = None
+        if secondary_spec:
+            secondary = create_llm_provider(
+                secondary_spec["provider"], secondary_spec.get("config", {}))
+
+        adapter = HedgedLLMProvider(
+            primary=adapter,
+            secondary=secondary,
+            percentile=hedging.get("percentile", 0.95),
+            min_delay_seconds=hedging.get("min_delay_seconds", 0.5),
+            budget_ratio=hedging.get("budget_ratio", 0.05),
+            window_size=hedging.get("window_size", 200),
+            min_samples=hedging.get("min_samples", 20)
+        )
+
+    return adapter
+
+
+def create_provider_chain(
+    providers: List[Tuple[str, Any]],
+    circuit_breaker: Dict[str, Any]
+) -> FallbackLLMProvider:
+    """Create an ordered fallback chain with one circuit breaker per provider.
+
+    Args:
+        providers: (name, adapter) pairs in order of preference
+        circuit_breaker: Circuit breaker settings shared by all backends
+            (see CircuitBreaker) plus an optional "timeout_seconds"
+
+    Returns:
+        FallbackLLMProvider serving calls from the first healthy backend
+
+    Example:
+        >>> chain = create_provider_chain(
+        ...     [("ollama", ollama_adapter), ("claude", claude_adapter)],
+        ...     {"cooldown_seconds": 15, "slow_call_threshold_seconds": 60}
+        ... )
+    """
+    breaker_settings = dict(circuit_breaker)
+    timeout_seconds = breaker_settings.pop("timeout_seconds", None)
+
+    return FallbackLLMProvider([
+        ProviderBackend(
+            name=name,
+            provider=adapter,
+            breaker=CircuitBreaker(name, **breaker_settings),
+            timeout_seconds=timeout_seconds
+        )
+        for name, adapter in providers
+    ])
+
+
+def _backend_name(provider: str, config: Dict[str, Any]) -> str:
+    """Build a display name for a backend."""
+    model = config.get("model")
+    return f"{provider.lower()}:{model}" if model else provider.lower()
+
+
+def _create_adapter(provider: str, config: Dict[str, Any]) -> Any:
+    """Create a single, unwrapped provider adapter.
+
+    Args:
+        provider: Provider name ("ollama", "claude", "openai", or "fake")
+        config: Configuration dictionary for the provider
+
+    Returns:
+        Initialized LLM adapter instance
+
+    Raises:
+        ValueError: If provider is unknown
+    """
     provider = provider.lower()
 
     if provider == "ollama":
@@ -30,7 +214,8 @@ def create_llm_provider(provider: str, config: Dict[str, Any]) -> Any:
         return OllamaAdapter(
             model=config.get("model", "gemma-custom"),
             base_url=ollama_config.get("base_url") if ollama_config else None,
-            auth_token=ollama_config.get("auth_token") if ollama_config else None
+            auth_token=ollama_config.get("auth_token") if ollama_config else None,
+            keep_alive=ollama_config.get("keep_alive") if ollama_config else None
         )
     elif provider == "claude":
         return ClaudeAdapter(
@@ -44,8 +229,11 @@ def create_llm_provider(provider: str, config: Dict[str, Any]) -> Any:
             max_tokens=config.get("max_tokens", 4096),
             temperature=config.get("temperature", 0.1)
         )
+    elif provider == "fake":
+        fake_config = config.get("fake") or {}
+        return FakeLLMAdapter(model=config.get("model", "fake"), **fake_config)
     else:
         raise ValueError(
             f"Unknown LLM provider: {provider}. "
-            f"Supported providers: ollama, claude, openai"
+            f"Supported providers: ollama, claude, openai, fake"
         )
@@ -0,0 +1,222 @@
+"""Deterministic fake LLM adapter for benchmarks and tests."""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from typing import Dict, List, Set, Tuple
+
+from .base import BaseLLMAdapter
+
+# Markers of the agent prompts (see domain/agents/prompts)
+_AGENT1_TEXT = re.compile(r"<TEXT_TO_ANALYZE>(.*)</TEXT_TO_ANALYZE>", re.DOTALL)
+_AGENT2_TEXT = re.compile(r"DOCUMENT TO VERIFY:\n---\n(.*)\n---\n", re.DOTALL)
+
+# Personal data the fake "model" recognizes, in priority order
+_ENTITY_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("EMAIL", re.compile(r"\b[\w.+-]+@[\w-]+\.[\w.-]+\b")),
+    ("PHONE", re.compile(r"\+?\d[\d ()-]{7,}\d")),
+    ("ADDRESS", re.compile(r"\b\d{1,5} [A-Z][a-z]+ (?:Street|St|Avenue|Ave|Road|Rd|Lane|Blvd)\b")),
+    ("NAME", re.compile(r"\b[A-Z][a-z]+ [A-Z][a-z]+\b")),
+]
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+
+class FakeLLMAdapter(BaseLLMAdapter):
+    """LLM adapter that answers the agent prompts without a model.
+
+    Agent 1 prompts get a JSON array of the emails, phone numbers,
+    street addresses and capitalized name pairs found in the text, wrapped
+    in a markdown fence like real models do. Agent 2 prompts get a
+    verdict listing any of those still present in the anonymized text.
+
+    Latency, truncated responses, malformed responses and missed
+    entities (which make Agent 2 fail and the orchestrator iterate) are
+    drawn from a random generator seeded by ``seed``, the prompt and the
+    number of times the prompt was seen, so a run gives the same answers
+    regardless of how concurrent calls interleave.
+
+    Example:
+        >>> adapter = FakeLLMAdapter(latency_mean_seconds=0.8, malformed_rate=0.05)
+        >>> response = await adapter.generate(prompt)
+    """
+
+    def __init__(
+        self,
+        model: str = "fake",
+        latency_distribution: str = "lognormal",
+        latency_mean_seconds: float = 0.0,
+        latency_stddev_seconds: float = 0.0,
+        latency_per_1k_chars_seconds: float = 0.0,
+        truncation_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        miss_rate: float = 0.0,
+        seed: int = 0
+    ) -> None:
+        """Initialize the fake adapter.
+
+        Args:
+            model: Model name reported in metrics
+            latency_distribution: One of fixed, uniform, normal, lognormal
+            latency_mean_seconds: Mean base latency per call
+            latency_stddev_seconds: Standard deviation of the base latency
+                (half-width for uniform)
+            latency_per_1k_chars_seconds: Extra latency per 1000 prompt characters
+            truncation_rate: Probability that a response is cut off
+            malformed_rate: Probability that a response is not valid JSON
+            miss_rate: Probability that Agent 1 misses one entity
+            seed: Random seed
+
+        Raises:
+            ValueError: If the distribution is unknown or a rate is outside [0, 1]
+        """
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution: {latency_distribution}. "
+                f"Supported: {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+        for name, rate in (
+            ("truncation_rate", truncation_rate),
+            ("malformed_rate", malformed_rate),
+            ("miss_rate", miss_rate)
+        ):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+        self.model = model
+        self.latency_distribution = latency_distribution
+        self.latency_mean_seconds = latency_mean_seconds
+        self.latency_stddev_seconds = latency_stddev_seconds
+        self.latency_per_1k_chars_seconds = latency_per_1k_chars_seconds
+        self.truncation_rate = truncation_rate
+        self.malformed_rate = malformed_rate
+        self.miss_rate = miss_rate
+        self.seed = seed
+        self._seen: Dict[str, int] = {}
+        self.calls = 0
+        super().__init__()
+
+    def _initialize_client(self) -> None:
+        """No client is needed."""
+        return None
+
+    async def generate(self, prompt: str) -> str:
+        """Answer an agent prompt after a simulated delay.
+
+        Args:
+            prompt: Agent 1 or Agent 2 prompt
+
+        Returns:
+            Simulated model output
+        """
+        start = time.perf_counter()
+        rng = self._rng(prompt)
+        self.calls += 1
+
+        delay = self.sample_latency(rng, len(prompt))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        agent1 = _AGENT1_TEXT.search(prompt)
+        if agent1 is not None:
+            response = self._entities_response(agent1.group(1), rng)
+        else:
+            agent2 = _AGENT2_TEXT.search(prompt)
+            response = self._validation_response(agent2.group(1) if agent2 else "", rng)
+
+        roll = rng.random()
+        if roll < self.malformed_rate:
+            response = "I found the following personal data: " + response.replace('"', "")
+        elif roll < self.malformed_rate + self.truncation_rate:
+            response = response[:max(1, int(len(response) * rng.uniform(0.3, 0.9)))]
+
+        self._record_usage(len(prompt) // 4, len(response) // 4, time.perf_counter() - start)
+        return response
+
+    async def probe(self) -> None:
+        """The fake model is always available."""
+        return None
+
+    def _rng(self, prompt: str) -> random.Random:
+        """Random generator for the n-th occurrence of a prompt."""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+        occurrence = self._seen.get(digest, 0)
+        self._seen[digest] = occurrence + 1
+        return random.Random(f"{self.seed}:{digest}:{occurrence}")
+
+    def sample_latency(self, rng: random.Random, prompt_chars: int) -> float:
+        """Draw the simulated latency of a call.
+
+        Args:
+            rng: Random generator to draw from
+            prompt_chars: Prompt length in characters
+
+        Returns:
+            Latency in seconds
+        """
+        mean = self.latency_mean_seconds
+        stddev = self.latency_stddev_seconds
+        if self.latency_distribution == "fixed" or stddev <= 0 or mean <= 0:
+            base = mean
+        elif self.latency_distribution == "uniform":
+            base = rng.uniform(mean - stddev, mean + stddev)
+        elif self.latency_distribution == "normal":
+            base = rng.gauss(mean, stddev)
+        else:
+            # Lognormal with the requested mean and standard deviation
+            sigma2 = math.log(1 + (stddev / mean) ** 2)
+            base = rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        return max(0.0, base) + self.latency_per_1k_chars_seconds * prompt_chars / 1000
+
+    def _entities_response(self, text: str, rng: random.Random) -> str:
+        """Agent 1 answer: the entities found in the text."""
+        entities = find_entities(text)
+        if entities and rng.random() < self.miss_rate:
+            entities.pop(rng.randrange(len(entities)))
+        body = json.dumps([{"type": kind, "value": value} for kind, value in entities], indent=2)
+        return f"```json\n{body}\n```"
+
+    def _validation_response(self, text: str, rng: random.Random) -> str:
+        """Agent 2 answer: identifiers left in the anonymized text."""
+        issues = [
+            {"type": kind, "value": value, "context": value, "location": "paragraph 1"}
+            for kind, value in find_entities(text)
+        ]
+        return json.dumps({
+            "passed": not issues,
+            "issues": issues,
+            "reasoning": f"Found {len(issues)} remaining identifiers.",
+            "confidence": round(rng.uniform(0.85, 0.99), 2),
+        })
+
+
+def find_entities(text: str) -> List[Tuple[str, str]]:
+    """Find the personal data the fake model recognizes.
+
+    Args:
+        text: Text to scan (placeholders such as [NAME_1] are ignored)
+
+    Returns:
+        Unique (type, value) pairs in order of first appearance
+    """
+    found: List[Tuple[int, str, str]] = []
+    taken: List[Tuple[int, int]] = []
+    for kind, pattern in _ENTITY_PATTERNS:
+        for match in pattern.finditer(text):
+            span = match.span()
+            if any(span[0] < end and start < span[1] for start, end in taken):
+                continue
+            taken.append(span)
+            found.append((span[0], kind, match.group(0)))
+
+    seen: Set[str] = set()
+    entities = []
+    for _, kind, value in sorted(found):
+        if value not in seen:
+            seen.add(value)
+            entities.append((kind, value))
+    return entities
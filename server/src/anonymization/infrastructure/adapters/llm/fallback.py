@@ -0,0 +1,159 @@
+"""Ordered provider fallback chain with per-backend circuit breakers."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from ....domain.exceptions import LLMProviderUnavailableError
+from ....domain.ports import ILLMProvider
+from .circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderBackend:
+    """A provider in the fallback chain.
+
+    Attributes:
+        name: Backend name (e.g. "ollama:qwen3:14b")
+        provider: Provider adapter
+        breaker: Circuit breaker guarding the provider
+        timeout_seconds: Per-call timeout; None waits indefinitely
+    """
+    name: str
+    provider: ILLMProvider
+    breaker: CircuitBreaker
+    timeout_seconds: Optional[float] = None
+
+
+class FallbackLLMProvider:
+    """LLM provider that tries an ordered chain of backends.
+
+    Each call goes to the first backend whose circuit breaker allows it.
+    Failures (including timeouts) are recorded on the breaker and the call
+    moves on to the next backend, so traffic shifts to healthy backends as
+    soon as a breaker opens.
+
+    Example:
+        >>> chain = FallbackLLMProvider([ollama_backend, claude_backend])
+        >>> text = await chain.generate("prompt")
+    """
+
+    def __init__(self, backends: List[ProviderBackend]) -> None:
+        """Initialize the fallback chain.
+
+        Args:
+            backends: Backends in order of preference
+
+        Raises:
+            ValueError: If no backends are given
+        """
+        if not backends:
+            raise ValueError("Fallback chain requires at least one backend")
+        self.backends = backends
+        self.fallbacks = 0
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a response from the first healthy backend.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+
+        Returns:
+            Text response from the backend that served the call
+
+        Raises:
+            LLMProviderUnavailableError: If every backend is open or failed
+        """
+        last_error: Optional[Exception] = None
+
+        for index, backend in enumerate(self.backends):
+            if not backend.breaker.allow_request():
+                continue
+
+            if index > 0:
+                self.fallbacks += 1
+
+            start = time.perf_counter()
+            try:
+                if backend.timeout_seconds is not None:
+                    result = await asyncio.wait_for(
+                        backend.provider.generate(prompt), backend.timeout_seconds)
+                else:
+                    result = await backend.provider.generate(prompt)
+            except asyncio.CancelledError:
+                backend.breaker.release()
+                raise
+            except Exception as e:
+                backend.breaker.record_failure()
+                last_error = e
+                logger.warning(f"LLM backend {backend.name} failed: {e!r}")
+                continue
+
+            backend.breaker.record_success(time.perf_counter() - start)
+            return result
+
+        if last_error is not None:
+            raise LLMProviderUnavailableError(
+                f"All LLM backends failed. Last error: {last_error}"
+            ) from last_error
+        raise LLMProviderUnavailableError("All LLM backends are unavailable (circuits open)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get fallback chain statistics.
+
+        Returns:
+            Dictionary with fallback count and per-backend breaker stats
+        """
+        return {
+            "fallbacks": self.fallbacks,
+            "backends": [backend.breaker.stats() for backend in self.backends],
+        }
+
+    async def probe(self) -> None:
+        """Probe every backend concurrently; the chain is healthy if one is.
+
+        Probes bypass the circuit breakers, so an open breaker does not hide
+        a recovered backend from the readiness check.
+
+        Raises:
+            LLMProviderUnavailableError: If every backend's probe failed
+        """
+        async def probe_backend(backend: ProviderBackend) -> None:
+            provider_probe = getattr(backend.provider, "probe", None)
+            if provider_probe is None:
+                return
+            if backend.timeout_seconds is not None:
+                await asyncio.wait_for(provider_probe(), backend.timeout_seconds)
+            else:
+                await provider_probe()
+
+        results = await asyncio.gather(
+            *(probe_backend(backend) for backend in self.backends), return_exceptions=True)
+        errors = []
+        for backend, result in zip(self.backends, results):
+            if not isinstance(result, BaseException):
+                return
+            errors.append(f"{backend.name}: {result!r}")
+        raise LLMProviderUnavailableError(f"All LLM backend probes failed: {'; '.join(errors)}")
+
+    async def warm_up(self) -> None:
+        """Warm up every backend, tolerating failures of individual backends."""
+        for backend in self.backends:
+            provider_warm_up = getattr(backend.provider, "warm_up", None)
+            if provider_warm_up is None:
+                continue
+            try:
+                await provider_warm_up()
+            except Exception as e:
+                logger.warning(f"Warm-up of LLM backend {backend.name} failed: {e}")
+
+    async def close(self) -> None:
+        """Close every backend."""
+        for backend in self.backends:
+            provider_close = getattr(backend.provider, "close", None)
+            if provider_close is not None:
+                await provider_close()
@@ -0,0 +1,222 @@
+"""Hedged LLM requests to cut tail latency."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from ....application.metrics import LLM_HEDGES
+from ....domain.ports import ILLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedLLMProvider:
+    """LLM provider wrapper that hedges slow calls.
+
+    If a call has not finished after the configured percentile of recent
+    latencies, a duplicate request is sent to the secondary provider (or
+    the primary again) and whichever answers first wins; the other call is
+    cancelled. Hedges are rate limited by a token bucket so they never add
+    more than ``budget_ratio`` extra calls. With a ``scheduler`` (the
+    LLMCallScheduler in front of this provider), a hedge takes a free call
+    slot and is skipped when there is none, so hedging never exceeds the
+    scheduler's ``max_concurrency``. Outcomes are counted in
+    ``anonymizer_llm_hedges_total``.
+
+    Example:
+        >>> provider = HedgedLLMProvider(primary, percentile=0.95)
+        >>> text = await provider.generate("prompt")
+    """
+
+    def __init__(
+        self,
+        primary: ILLMProvider,
+        secondary: Optional[ILLMProvider] = None,
+        percentile: float = 0.95,
+        min_delay_seconds: float = 0.5,
+        budget_ratio: float = 0.05,
+        window_size: int = 200,
+        min_samples: int = 20
+    ) -> None:
+        """Initialize the hedged provider.
+
+        Args:
+            primary: Provider receiving every call
+            secondary: Provider receiving hedge calls (defaults to primary)
+            percentile: Latency percentile after which a hedge is sent
+            min_delay_seconds: Lower bound for the hedge delay
+            budget_ratio: Maximum fraction of extra calls caused by hedging
+            window_size: Number of recent latencies kept for the percentile
+            min_samples: Samples required before hedging starts
+        """
+        self.primary = primary
+        self.secondary = secondary or primary
+        self.percentile = percentile
+        self.min_delay_seconds = min_delay_seconds
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+
+        # Token bucket: each call earns budget_ratio tokens, a hedge costs one
+        self._budget_cap = max(1.0, budget_ratio * 20)
+        self._budget = 0.0
+
+        # Set by the factory when an LLMCallScheduler wraps this provider
+        self.scheduler: Optional[Any] = None
+
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+        self.no_capacity = 0
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a response, hedging the call if it is slow.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+
+        Returns:
+            Text response of whichever call finished first
+
+        Raises:
+            Exception: If the primary call (and hedge, if sent) fails
+        """
+        self.calls += 1
+        self._budget = min(self._budget_cap, self._budget + self.budget_ratio)
+
+        start = time.perf_counter()
+        primary_task = asyncio.create_task(self.primary.generate(prompt))
+        tasks = {primary_task}
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    hedge_task = self._hedge(prompt)
+                    if hedge_task is not None:
+                        tasks.add(hedge_task)
+
+            winner = await self._first_successful(tasks)
+            if winner is not primary_task:
+                self.hedge_wins += 1
+                LLM_HEDGES.inc(outcome="won")
+            self._latencies.append(time.perf_counter() - start)
+            return winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _hedge(self, prompt: str) -> "Optional[asyncio.Task[str]]":
+        """Send a hedge request if the budget and a scheduler slot allow.
+
+        Args:
+            prompt: The prompt text of the slow call
+
+        Returns:
+            The hedge task, or None if no hedge was sent
+        """
+        if self._budget < 1.0:
+            self.budget_exhausted += 1
+            LLM_HEDGES.inc(outcome="budget_exhausted")
+            return None
+        scheduler = self.scheduler
+        if scheduler is not None and not scheduler.try_acquire_slot():
+            self.no_capacity += 1
+            LLM_HEDGES.inc(outcome="no_capacity")
+            return None
+
+        self._budget -= 1.0
+        self.hedges += 1
+        LLM_HEDGES.inc(outcome="sent")
+        task = asyncio.create_task(self.secondary.generate(prompt))
+        if scheduler is not None:
+            # A done callback also runs if the task is cancelled before it starts
+            task.add_done_callback(lambda _: scheduler.release_slot())
+        return task
+
+    async def _first_successful(self, tasks: "set[asyncio.Task[str]]") -> "asyncio.Task[str]":
+        """Wait for the first task that completes without raising.
+
+        Args:
+            tasks: Running generate tasks
+
+        Returns:
+            The first successful task
+
+        Raises:
+            Exception: The first task's error if every task failed
+        """
+        pending = set(tasks)
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    return task
+                if first_error is None:
+                    first_error = error
+                if pending:
+                    logger.warning(f"Hedged LLM call failed, waiting for the other: {error}")
+        assert first_error is not None
+        raise first_error
+
+    def hedge_delay(self) -> Optional[float]:
+        """Get the current hedge delay.
+
+        Returns:
+            Seconds to wait before hedging, or None while warming up
+        """
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(self.min_delay_seconds, ordered[index])
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hedging statistics.
+
+        Returns:
+            Dictionary with call, hedge and win counters
+        """
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_exhausted": self.budget_exhausted,
+            "no_capacity": self.no_capacity,
+            "hedge_rate": self.hedges / self.calls if self.calls else 0.0,
+            "hedge_delay_seconds": self.hedge_delay(),
+        }
+
+    def _providers(self) -> List[ILLMProvider]:
+        """Get the distinct wrapped providers."""
+        if self.secondary is self.primary:
+            return [self.primary]
+        return [self.primary, self.secondary]
+
+    async def probe(self) -> None:
+        """Probe the primary provider, which serves every call first."""
+        provider_probe = getattr(self.primary, "probe", None)
+        if provider_probe is not None:
+            await provider_probe()
+
+    async def warm_up(self) -> None:
+        """Warm up the primary and secondary providers."""
+        for provider in self._providers():
+            provider_warm_up = getattr(provider, "warm_up", None)
+            if provider_warm_up is not None:
+                await provider_warm_up()
+
+    async def close(self) -> None:
+        """Close the primary and secondary providers."""
+        for provider in self._providers():
+            provider_close = getattr(provider, "close", None)
+            if provider_close is not None:
+                await provider_close()
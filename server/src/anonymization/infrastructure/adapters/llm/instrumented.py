@@ -0,0 +1,82 @@
+"""Metrics for calls to a single LLM backend."""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+from ....application.metrics import LLM_CALL_DURATION, LLM_ERRORS
+from ....application.tracing import span
+from ....domain.ports import ILLMProvider
+
+
+class InstrumentedLLMProvider:
+    """LLM provider wrapper recording call latency and errors of a backend.
+
+    The factory wraps every adapter it creates, so fallback chains and
+    hedge targets report each backend separately. Cancelled calls (lost
+    hedges, client disconnects) are recorded with outcome ``cancelled``
+    and do not count as errors. Each call is also an ``llm.generate``
+    span of the current trace.
+
+    Example:
+        >>> provider = InstrumentedLLMProvider(adapter, backend="ollama:qwen3:14b")
+        >>> text = await provider.generate("prompt")
+    """
+
+    def __init__(self, inner: ILLMProvider, backend: str) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            inner: Provider adapter to measure
+            backend: Backend name used as metric label
+        """
+        self.inner = inner
+        self.backend = backend
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a response and record its latency.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+
+        Returns:
+            Text response from the wrapped provider
+        """
+        start = time.perf_counter()
+        outcome = "success"
+        try:
+            with span("llm.generate", backend=self.backend):
+                return await self.inner.generate(prompt)
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            outcome = "error"
+            LLM_ERRORS.inc(backend=self.backend, error=type(e).__name__)
+            raise
+        finally:
+            LLM_CALL_DURATION.observe(
+                time.perf_counter() - start, backend=self.backend, outcome=outcome)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get statistics of the wrapped provider, if it has any."""
+        inner_stats = getattr(self.inner, "stats", None)
+        return inner_stats() if inner_stats is not None else {}
+
+    async def probe(self) -> None:
+        """Probe the wrapped provider."""
+        provider_probe = getattr(self.inner, "probe", None)
+        if provider_probe is not None:
+            await provider_probe()
+
+    async def warm_up(self) -> None:
+        """Warm up the wrapped provider."""
+        provider_warm_up = getattr(self.inner, "warm_up", None)
+        if provider_warm_up is not None:
+            await provider_warm_up()
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        provider_close = getattr(self.inner, "close", None)
+        if provider_close is not None:
+            await provider_close()
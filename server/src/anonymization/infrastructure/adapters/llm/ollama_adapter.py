@@ -1,7 +1,8 @@
 """Ollama LLM adapter implementation."""
 
 import os
-from typing import Any, Optional
+import time
+from typing import Optional
 from .base import BaseLLMAdapter
 
 
@@ -16,7 +17,8 @@ class OllamaAdapter(BaseLLMAdapter):
         self,
         model: str = "gemma-custom",
         base_url: Optional[str] = None,
-        auth_token: Optional[str] = None
+        auth_token: Optional[str] = None,
+        keep_alive: Optional[str] = None
     ) -> None:
         """Initialize Ollama adapter.
 
@@ -24,10 +26,13 @@ class OllamaAdapter(BaseLLMAdapter):
             model: Name of the Ollama model to use
             base_url: Ollama server URL (falls back to OLLAMA_HOST env var)
             auth_token: Optional authentication token (falls back to OLLAMA_AUTH_TOKEN env var)
+            keep_alive: How long Ollama keeps the model loaded after a call
+                (e.g. "30m"); None uses the server default
         """
         self.model = model
         self.base_url = base_url
         self.auth_token = auth_token
+        self.keep_alive = keep_alive
         super().__init__()
 
     def _initialize_client(self) -> None:
@@ -55,7 +60,7 @@ class OllamaAdapter(BaseLLMAdapter):
         if ollama_token:
             client_kwargs["headers"] = {"Authorization": f"Bearer {ollama_token}"}
 
-        self.client = ollama.Client(**client_kwargs)
+        self.client = ollama.AsyncClient(**client_kwargs)
 
     async def generate(self, prompt: str) -> str:
         """Generate response using Ollama.
@@ -69,5 +74,47 @@ class OllamaAdapter(BaseLLMAdapter):
         Raises:
             Exception: If Ollama call fails
         """
-        response = self.client.generate(model=self.model, prompt=prompt)
+        start = time.perf_counter()
+        response = await self.client.generate(
+            model=self.model,
+            prompt=prompt,
+            keep_alive=self.keep_alive
+        )
+        # Durations are reported in nanoseconds; the first token follows
+        # model loading and prompt evaluation
+        first_token_seconds = None
+        if "prompt_eval_duration" in response:
+            first_token_seconds = (
+                (response.get("load_duration") or 0) + response["prompt_eval_duration"]) / 1e9
+        self._record_usage(
+            response.get("prompt_eval_count"),
+            response.get("eval_count"),
+            time.perf_counter() - start,
+            first_token_seconds,
+            model=response.get("model")
+        )
         return str(response["response"])
+
+    async def probe(self) -> None:
+        """List the server's models and check that the configured one is pulled.
+
+        Raises:
+            LookupError: If the model is not available on the server
+        """
+        response = await self.client.list()
+        names = {model.get("name") for model in response.get("models", [])}
+        if self.model not in names and f"{self.model}:latest" not in names:
+            raise LookupError(f"Model {self.model} is not available on the Ollama server")
+
+    async def warm_up(self) -> None:
+        """Load the model into Ollama's memory.
+
+        A generate call with an empty prompt makes Ollama load the model
+        without producing tokens, so the first real request does not pay
+        the model load time.
+        """
+        await self.client.generate(
+            model=self.model,
+            prompt="",
+            keep_alive=self.keep_alive
+        )
@@ -1,6 +1,7 @@
 """OpenAI LLM adapter implementation."""
 
 import os
+import time
 from .base import BaseLLMAdapter
 
 
@@ -31,7 +32,7 @@ class OpenAIAdapter(BaseLLMAdapter):
     def _initialize_client(self) -> None:
         """Initialize OpenAI client."""
         try:
-            from openai import OpenAI  # type: ignore[import-untyped]
+            from openai import AsyncOpenAI  # type: ignore[import-untyped]
         except ImportError:
             raise ImportError(
                 "OpenAI package not installed. Install with: pip install openai"
@@ -43,7 +44,7 @@ class OpenAIAdapter(BaseLLMAdapter):
                 "OPENAI_API_KEY environment variable not set"
             )
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key)
 
     async def generate(self, prompt: str) -> str:
         """Generate response using OpenAI.
@@ -57,11 +58,27 @@ class OpenAIAdapter(BaseLLMAdapter):
         Raises:
             Exception: If OpenAI API call fails
         """
-        response = self.client.chat.completions.create(
+        start = time.perf_counter()
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=self.temperature,
             max_tokens=self.max_tokens
         )
+        usage = response.usage
+        self._record_usage(
+            usage.prompt_tokens if usage is not None else None,
+            usage.completion_tokens if usage is not None else None,
+            time.perf_counter() - start,
+            model=response.model
+        )
         content = response.choices[0].message.content
         return str(content) if content else ""
+
+    async def probe(self) -> None:
+        """Fetch the model metadata (no tokens are generated)."""
+        await self.client.models.retrieve(self.model)
+
+    async def warm_up(self) -> None:
+        """Open the HTTP connection pool by fetching the model metadata."""
+        await self.client.models.retrieve(self.model)
@@ -0,0 +1,331 @@
+"""LLM call scheduler sharing provider capacity by priority and tenant."""
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+from ....application.priority import Priority, current_priority
+from ....application.tenancy import current_tenant
+from ....application.tracing import span
+from ....domain.ports import ILLMProvider
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """A call waiting for a slot."""
+    future: asyncio.Future
+    priority: Priority
+    tenant: str
+    enqueued_at: float
+    start_tag: float
+    finish_tag: float
+
+
+class LLMCallScheduler:
+    """LLM provider wrapper that admits at most ``max_concurrency`` calls.
+
+    Calls beyond the limit wait in one lane per priority class
+    (interactive, batch, background; taken from the caller's context, see
+    ``priority_scope``). A freed slot goes to the lane whose oldest call
+    has the best aged rank: its priority value minus the time it has
+    waited divided by ``aging_seconds``. Interactive calls therefore jump
+    ahead of queued bulk work, while a batch call that waited
+    ``aging_seconds`` competes as if it were interactive, so lower classes
+    never starve.
+
+    Within a lane, tenants (see ``tenant_scope``) share slots by weighted
+    fair queuing: every call gets a virtual finish tag advancing by
+    1/weight per call of its tenant, and the smallest tag is served first.
+    A tenant with a concurrency cap never holds more slots than the cap,
+    even when others are idle.
+
+    Every code path that talks to the LLM (single requests, batches,
+    background jobs) goes through the same scheduler, so the backend never
+    sees more than the configured number of concurrent generations.
+
+    Example:
+        >>> scheduler = LLMCallScheduler(adapter, max_concurrency=4,
+        ...                              tenant_weights={"team-a": 2.0})
+        >>> text = await scheduler.generate("prompt")
+    """
+
+    def __init__(
+        self,
+        inner: ILLMProvider,
+        max_concurrency: int = 4,
+        aging_seconds: float = 10.0,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        tenant_max_concurrency: Optional[Dict[str, int]] = None,
+        default_tenant_weight: float = 1.0,
+        default_tenant_max_concurrency: Optional[int] = None
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            inner: Provider that executes the calls
+            max_concurrency: Maximum number of concurrent calls
+            aging_seconds: Waiting time that promotes a call by one priority class
+            tenant_weights: Fair-share weight per tenant
+            tenant_max_concurrency: Concurrency cap per tenant
+            default_tenant_weight: Weight of tenants not listed
+            default_tenant_max_concurrency: Cap of tenants not listed (None for no cap)
+
+        Raises:
+            ValueError: If max_concurrency or aging_seconds is not positive
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if aging_seconds <= 0:
+            raise ValueError("aging_seconds must be positive")
+        self.inner = inner
+        self.max_concurrency = max_concurrency
+        self.aging_seconds = aging_seconds
+        self.tenant_weights = tenant_weights or {}
+        self.tenant_max_concurrency = tenant_max_concurrency or {}
+        self.default_tenant_weight = default_tenant_weight
+        self.default_tenant_max_concurrency = default_tenant_max_concurrency
+
+        self.in_flight = 0
+        self._lanes: Dict[Priority, Dict[str, Deque[_Waiter]]] = {priority: {} for priority in Priority}
+        self._virtual_time: Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._last_finish_tag: Dict[Priority, Dict[str, float]] = {priority: {} for priority in Priority}
+        self._tenant_in_flight: Dict[str, int] = defaultdict(int)
+
+        self.completed = 0
+        self._completed_by_priority: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._wait_seconds_by_priority: Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._completed_by_tenant: Dict[str, int] = defaultdict(int)
+        self._wait_seconds_by_tenant: Dict[str, float] = defaultdict(float)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a slot."""
+        return sum(
+            len(queue)
+            for tenants in self._lanes.values()
+            for queue in tenants.values()
+        )
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a response once a call slot is available.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+
+        Returns:
+            Text response from the wrapped provider
+        """
+        priority = current_priority()
+        tenant = current_tenant()
+        with span("llm.queue_wait", priority=priority.name.lower(), tenant=tenant):
+            await self._acquire(priority, tenant)
+        try:
+            return await self.inner.generate(prompt)
+        finally:
+            self.completed += 1
+            self._completed_by_priority[priority] += 1
+            self._completed_by_tenant[tenant] += 1
+            self._finish(tenant)
+
+    def try_acquire_slot(self) -> bool:
+        """Take a free slot for an extra call of the current tenant, without queueing.
+
+        Used for hedge requests, which count against ``max_concurrency``
+        but are only worth sending when capacity is idle. Release the slot
+        with ``release_slot`` in the same tenant context.
+
+        Returns:
+            Whether a slot was taken
+        """
+        tenant = current_tenant()
+        if (
+            self.queue_depth
+            or self.in_flight >= self.max_concurrency
+            or not self._has_capacity(tenant)
+        ):
+            return False
+        self._start(tenant)
+        return True
+
+    def release_slot(self) -> None:
+        """Free a slot taken with ``try_acquire_slot``."""
+        self._finish(current_tenant())
+
+    async def _acquire(self, priority: Priority, tenant: str) -> None:
+        """Wait for a free call slot."""
+        # Waiters that could run are dispatched whenever a slot frees, so a
+        # free slot means nobody eligible is waiting
+        if self.in_flight < self.max_concurrency and self._has_capacity(tenant):
+            self._start(tenant)
+            return
+
+        start_tag = max(
+            self._virtual_time[priority],
+            self._last_finish_tag[priority].get(tenant, 0.0)
+        )
+        finish_tag = start_tag + 1.0 / self.tenant_weights.get(tenant, self.default_tenant_weight)
+        self._last_finish_tag[priority][tenant] = finish_tag
+
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            priority=priority,
+            tenant=tenant,
+            enqueued_at=time.monotonic(),
+            start_tag=start_tag,
+            finish_tag=finish_tag
+        )
+        self._lanes[priority].setdefault(tenant, deque()).append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was granted just before cancellation
+                self._finish(tenant)
+            else:
+                self._discard(waiter)
+            raise
+
+        waited = time.monotonic() - waiter.enqueued_at
+        self._wait_seconds_by_priority[priority] += waited
+        self._wait_seconds_by_tenant[tenant] += waited
+
+    def _has_capacity(self, tenant: str) -> bool:
+        """Check whether a tenant is below its concurrency cap."""
+        cap = self.tenant_max_concurrency.get(tenant, self.default_tenant_max_concurrency)
+        return cap is None or self._tenant_in_flight.get(tenant, 0) < cap
+
+    def _start(self, tenant: str) -> None:
+        """Account for a call taking a slot."""
+        self.in_flight += 1
+        self._tenant_in_flight[tenant] += 1
+
+    def _finish(self, tenant: str) -> None:
+        """Free a slot and hand out free slots to eligible waiters."""
+        self.in_flight -= 1
+        self._tenant_in_flight[tenant] -= 1
+        if not self._tenant_in_flight[tenant]:
+            del self._tenant_in_flight[tenant]
+
+        while self.in_flight < self.max_concurrency:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            if waiter.future.done():
+                # Cancelled while queued
+                continue
+            self._start(waiter.tenant)
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """Pop the next waiter to serve.
+
+        The lane is chosen by aged priority rank of its oldest eligible
+        call; within the lane, the eligible tenant with the smallest
+        finish tag is served.
+        """
+        now = time.monotonic()
+        best: Optional[_Waiter] = None
+        best_rank = 0.0
+        for priority, tenants in self._lanes.items():
+            candidate: Optional[_Waiter] = None
+            oldest = now
+            for tenant, queue in tenants.items():
+                if not self._has_capacity(tenant):
+                    continue
+                head = queue[0]
+                if candidate is None or head.finish_tag < candidate.finish_tag:
+                    candidate = head
+                oldest = min(oldest, head.enqueued_at)
+            if candidate is None:
+                continue
+            rank = priority.value - (now - oldest) / self.aging_seconds
+            if best is None or rank < best_rank:
+                best, best_rank = candidate, rank
+
+        if best is not None:
+            self._discard(best)
+            self._virtual_time[best.priority] = max(self._virtual_time[best.priority], best.start_tag)
+        return best
+
+    def _discard(self, waiter: _Waiter) -> None:
+        """Remove a waiter from its queue, dropping empty queues."""
+        tenants = self._lanes[waiter.priority]
+        queue = tenants.get(waiter.tenant)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del tenants[waiter.tenant]
+            if not tenants:
+                # Lane idle: restart virtual time so tags stay small
+                self._virtual_time[waiter.priority] = 0.0
+                self._last_finish_tag[waiter.priority].clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary with in-flight calls, queue depth and limit, plus
+            per-priority and per-tenant queue depth, completed calls and
+            average wait
+        """
+        tenants = (
+            set(self._completed_by_tenant)
+            | set(self._tenant_in_flight)
+            | {tenant for lane in self._lanes.values() for tenant in lane}
+        )
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_concurrency": self.max_concurrency,
+            "completed": self.completed,
+            "priorities": {
+                priority.name.lower(): {
+                    "queue_depth": sum(len(queue) for queue in self._lanes[priority].values()),
+                    "completed": self._completed_by_priority[priority],
+                    "avg_wait_seconds": _average(
+                        self._wait_seconds_by_priority[priority],
+                        self._completed_by_priority[priority]
+                    ),
+                }
+                for priority in Priority
+            },
+            "tenants": {
+                tenant: {
+                    "in_flight": self._tenant_in_flight.get(tenant, 0),
+                    "queue_depth": sum(
+                        len(lane.get(tenant, ())) for lane in self._lanes.values()),
+                    "completed": self._completed_by_tenant.get(tenant, 0),
+                    "avg_wait_seconds": _average(
+                        self._wait_seconds_by_tenant.get(tenant, 0.0),
+                        self._completed_by_tenant.get(tenant, 0)
+                    ),
+                }
+                for tenant in sorted(tenants)
+            },
+        }
+
+    async def probe(self) -> None:
+        """Probe the wrapped provider, bypassing the queue."""
+        provider_probe = getattr(self.inner, "probe", None)
+        if provider_probe is not None:
+            await provider_probe()
+
+    async def warm_up(self) -> None:
+        """Warm up the wrapped provider."""
+        provider_warm_up = getattr(self.inner, "warm_up", None)
+        if provider_warm_up is not None:
+            await provider_warm_up()
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        provider_close = getattr(self.inner, "close", None)
+        if provider_close is not None:
+            await provider_close()
+
+
+def _average(total: float, count: int) -> float:
+    """Average that is zero for an empty sample."""
+    return total / count if count else 0.0
@@ -9,9 +9,17 @@ import re
 from typing import Dict, List, Optional
 from pydantic import BaseModel, ValidationError, field_validator
 
+from ...application.metrics import PARSE_RETRIES
+from ...application.tracing import span
 from ...domain.models import Entity, EntityType, AnonymizationMapping
 from ...domain.ports import ILLMProvider
 from ...domain.agents.prompts import AGENT1_ENTITY_IDENTIFICATION_PROMPT
+from ..telemetry import payload
+
+# Matchers used to clean LLM responses, compiled once at import time
+_JSON_FENCE_PATTERN = re.compile(r'```json\s*')
+_FENCE_PATTERN = re.compile(r'```\s*')
+_UNESCAPED_VALUE_PATTERN = re.compile(r'("value"\s*:\s*")(.*?)("(?:\s*[,}]))')
 
 class LLMEntityResponse(BaseModel):
 
@@ -68,8 +76,8 @@ class Agent1Implementation:
             Cleaned JSON string or None if no valid JSON found
         """
         # Remove markdown code fences
-        response = re.sub(r'```json\s*', '', response)
-        response = re.sub(r'```\s*', '', response)
+        response = _JSON_FENCE_PATTERN.sub('', response)
+        response = _FENCE_PATTERN.sub('', response)
 
         # Find JSON array boundaries
         start = response.find('[')
@@ -92,8 +100,7 @@ class Agent1Implementation:
         except json.JSONDecodeError as e:
             # Attempt 2: Check if it's truncated (missing closing bracket)
             if not json_str.rstrip().endswith(']'):
-                self.logger.warning(
-                    f"JSON appears truncated, attempting to fix: {e}")
+                self.logger.warning("JSON appears truncated, attempting to fix: %s", e.msg)
                 # Try to close the last object and array
                 fixed = json_str.rstrip()
                 # Remove any incomplete object at the end
@@ -111,8 +118,7 @@ class Agent1Implementation:
             # This is risky, so we only do it as a last resort
             try:
                 # Find all string values and escape internal quotes
-                fixed = re.sub(
-                    r'("value"\s*:\s*")(.*?)("(?:\s*[,}]))',
+                fixed = _UNESCAPED_VALUE_PATTERN.sub(
                     lambda m: m.group(
                         1) + m.group(2).replace('"', '\\"') + m.group(3),
                     json_str
@@ -155,24 +161,26 @@ class Agent1Implementation:
                 # Generate prompt and call LLM
                 prompt = AGENT1_ENTITY_IDENTIFICATION_PROMPT(text)
 
-                self.logger.warning("sending AGENT1_ENTITY_IDENTIFICATION_PROMPT")
-                self.logger.debug(prompt)
+                self.logger.debug(
+                    "Agent 1 LLM call (attempt %d): %s", attempt, payload(prompt))
 
                 response = await self.llm.generate(prompt)
 
-                self.logger.info("response received")
-                self.logger.info(response)
+                self.logger.debug(
+                    "Agent 1 LLM response (attempt %d): %s", attempt, payload(response))
 
                 # Parse entities from response (with automatic cleaning/fixing)
-                result: tuple[list[Entity], list[Entity]] = self._parse_entities(
-                    response, attempt)
+                with span("agent1.parse", attempt=attempt):
+                    result: tuple[list[Entity], list[Entity]] = self._parse_entities(
+                        response, attempt)
 
                 skippedEntites = result[1]
                 entities = result[0]
-                mappings = self._build_mappings(entities)
+                with span("agent1.replace", entities=len(entities)):
+                    mappings = self._build_mappings(entities)
 
-                # Apply replacements to text
-                anonymized_text = self._apply_replacements(text, mappings)
+                    # Apply replacements to text
+                    anonymized_text = self._apply_replacements(text, mappings)
 
                 return AnonymizationMapping(
                     original_text=text,
@@ -191,7 +199,8 @@ class Agent1Implementation:
                         f"Last error: {str(e)}"
                     )
                 self.logger.warning(
-                    f"Attempt {attempt}/{max_attempts} failed, retrying: {e}")
+                    "Attempt %d/%d failed, retrying: %s", attempt, max_attempts, payload(e))
+                PARSE_RETRIES.inc(agent="agent1")
                 continue
 
         # Should never reach here, but satisfy type checker
@@ -215,12 +224,12 @@ class Agent1Implementation:
 
         try:
             # Clean and extract JSON from response
-            json_str = self._clean_json_response(response)
+            with span("agent1.json_repair"):
+                json_str = self._clean_json_response(response)
 
             if json_str is None:
-                self.logger.error(
-                    f"No JSON array found in LLM response (attempt {attempt})")
-                self.logger.debug(f"Full response: {response}")
+                self.logger.error("No JSON array found in LLM response (attempt %d)", attempt)
+                self.logger.debug("Full response: %s", payload(response))
                 raise ValueError("No JSON array found in LLM response")
 
             # Parse JSON
@@ -228,18 +237,20 @@ class Agent1Implementation:
 
             # Validate it's a list
             if not isinstance(data, list):
-                self.logger.error(f"Expected JSON array, got {type(data).__name__}")
+                self.logger.error("Expected JSON array, got %s", type(data).__name__)
                 raise ValueError(
                     f"Expected JSON array, got {type(data).__name__}")
 
             # Pydantic validation: validate entire structure first
             try:
                 validated_response = LLMEntitiesListResponse(entities=data)
-                self.logger.info(
-                    f"LLM response structure validated successfully with {len(validated_response.entities)} entities")
+                self.logger.debug(
+                    "LLM response structure validated successfully with %d entities",
+                    len(validated_response.entities))
             except ValidationError as ve:
                 self.logger.warning(
-                    f"Pydantic validation failed, falling back to per-entity validation: {ve}")
+                    "Pydantic validation failed with %d errors, falling back to per-entity validation",
+                    ve.error_count())
                 # Fall through to per-entity validation below
 
             # Convert to Entity objects (with per-entity error handling)
@@ -257,8 +268,9 @@ class Agent1Implementation:
                     entities.append(entity)
 
                 except (KeyError, ValueError, ValidationError) as e:
-                    error_msg = f"Invalid entity at index {idx}: {item}. Error: {e}"
-                    self.logger.warning(f"Skipping {error_msg}")
+                    self.logger.warning(
+                        "Skipping invalid entity at index %d: %s. Error: %s",
+                        idx, payload(item), payload(e))
                     skipped_entities.append(
                         {"index": idx, "item": item, "error": str(e)})
                     continue
@@ -269,8 +281,8 @@ class Agent1Implementation:
             invalid_entities = len(skipped_entities)
 
             self.logger.info(
-                f"Entity parsing complete (attempt {attempt}): "
-                f"{valid_entities}/{total_entities} valid, {invalid_entities} skipped"
+                "Entity parsing complete (attempt %d): %d/%d valid, %d skipped",
+                attempt, valid_entities, total_entities, invalid_entities
             )
 
             all: tuple[list[Entity], list[Entity]] = entities, skipped_entities
@@ -280,8 +292,8 @@ class Agent1Implementation:
         except (ValueError, ValidationError, KeyError, json.JSONDecodeError) as e:
             # Log full response for debugging
             self.logger.error(
-                f"Failed to parse LLM response (attempt {attempt}): {e}")
-            self.logger.debug(f"Full LLM response:\n{response}")
+                "Failed to parse LLM response (attempt %d): %s", attempt, payload(e))
+            self.logger.debug("Full LLM response: %s", payload(response))
 
             # Raise with detailed error but don't truncate
             error_msg = (
@@ -4,6 +4,8 @@ Migrated from validation.py - maintains exact same logic.
 """
 
 import json
+from ...application.metrics import PARSE_RETRIES
+from ...application.tracing import span
 from ...domain.models import ValidationResult, ValidationIssue
 from ...domain.ports import ILLMProvider
 from ...domain.agents.prompts import AGENT2_VALIDATION_PROMPT
@@ -61,13 +63,15 @@ class Agent2Implementation:
         for attempt in range(1, max_attempts + 1):
             try:
                 response = await self.llm.generate(prompt)
-                result = self._parse_validation_response(response)
+                with span("agent2.parse", attempt=attempt):
+                    result = self._parse_validation_response(response)
                 return result
             except (ValueError, json.JSONDecodeError) as e:
                 if attempt >= max_attempts:
                     raise ValueError(
                         f"Failed to parse LLM response after {max_attempts} attempts: {e}"
                     )
+                PARSE_RETRIES.inc(agent="agent2")
                 continue
 
         # This should never be reached due to the raise above
@@ -8,7 +8,21 @@ from typing import Any, Dict
 import yaml
 from pydantic import ValidationError
 
-from ..application.config import AppConfig, LLMConfig, AgentConfig, OrchestrationConfig
+from ..application.config import (
+    AppConfig,
+    LLMConfig,
+    AgentConfig,
+    OrchestrationConfig,
+    CacheConfig,
+    JobsConfig,
+    AdmissionConfig,
+    TenancyConfig,
+    MetricsConfig,
+    TracingConfig,
+    ProfilingConfig,
+    ReadinessConfig,
+    EventLoopConfig
+)
 
 
 class ConfigLoader:
@@ -49,7 +63,16 @@ class ConfigLoader:
                 agent1=AgentConfig(**config_dict['agents']['agent1']),
                 agent2=AgentConfig(**config_dict['agents']['agent2']),
                 agent3=AgentConfig(**config_dict['agents']['agent3']),
-                orchestration=OrchestrationConfig(**config_dict['orchestration'])
+                orchestration=OrchestrationConfig(**config_dict['orchestration']),
+                cache=CacheConfig(**(config_dict.get('cache') or {})),
+                jobs=JobsConfig(**(config_dict.get('jobs') or {})),
+                admission=AdmissionConfig(**(config_dict.get('admission') or {})),
+                tenancy=TenancyConfig(**(config_dict.get('tenancy') or {})),
+                metrics=MetricsConfig(**(config_dict.get('metrics') or {})),
+                tracing=TracingConfig(**(config_dict.get('tracing') or {})),
+                profiling=ProfilingConfig(**(config_dict.get('profiling') or {})),
+                readiness=ReadinessConfig(**(config_dict.get('readiness') or {})),
+                event_loop=EventLoopConfig(**(config_dict.get('event_loop') or {}))
             )
         except (KeyError, ValidationError) as e:
             raise ValueError(f"Invalid configuration: {e}") from e
@@ -134,5 +157,20 @@ class ConfigLoader:
             'orchestration': {
                 'max_iterations': 3,
                 'timeout_seconds': 300
+            },
+            'cache': {
+                'enabled': True,
+                'max_memory_bytes': 64 * 1024 * 1024,
+                'disk_path': None
+            },
+            'jobs': {
+                'enabled': True,
+                'database_path': 'data/jobs.db',
+                'workers': 2
+            },
+            'admission': {
+                'enabled': True,
+                'max_in_flight_requests': 32,
+                'max_queue_depth': 64
             }
         }
@@ -0,0 +1,7 @@
+"""Persistence adapters."""
+
+from .sqlite_job_store import SQLiteJobStore
+
+__all__ = [
+    "SQLiteJobStore",
+]
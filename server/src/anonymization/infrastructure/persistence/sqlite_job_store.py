@@ -0,0 +1,451 @@
+"""SQLite-backed durable job queue."""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...application.tenancy import DEFAULT_TENANT
+from ...domain.models import Job, JobItem
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    tenant_id TEXT NOT NULL DEFAULT 'default',
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL REFERENCES jobs(job_id),
+    idx INTEGER NOT NULL,
+    document_id TEXT,
+    text TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    result TEXT,
+    worker_id TEXT,
+    lease_expires_at TEXT,
+    PRIMARY KEY (job_id, idx)
+);
+CREATE INDEX IF NOT EXISTS job_items_status ON job_items(status);
+CREATE INDEX IF NOT EXISTS job_items_pending ON job_items(job_id, status, idx);
+"""
+
+
+class SQLiteJobStore:
+    """Durable job store and work queue on a local SQLite database.
+
+    A single connection is shared and serialized by a lock; calls run in a
+    worker thread so the event loop is never blocked on disk I/O. The
+    database uses WAL journaling, so readers (progress polling) do not
+    block the workers writing results. Document text is dropped once a
+    document is processed; results, which hold the mappings of original
+    values, are deleted with their job (delete_job, or purge_finished
+    once the retention period expired).
+    Workers claim documents round-robin across tenants, so one tenant's
+    large job does not hold back the jobs of others.
+
+    A claim is a lease held by this store's worker id: the owner renews
+    it while processing, only the owner can store the result, and only
+    expired leases are requeued. Several processes sharing the database
+    therefore never take over each other's documents in flight.
+
+    Example:
+        >>> store = SQLiteJobStore("data/jobs.db")
+        >>> job = await store.create_job([("doc-1", "Contact John")])
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        lease_seconds: float = 60.0,
+        worker_id: Optional[str] = None
+    ) -> None:
+        """Open (and create if needed) the job database.
+
+        Args:
+            database_path: Path of the SQLite file (":memory:" for tests)
+            lease_seconds: Time a claim stays valid unless renewed
+            worker_id: Identifier recorded on claims (default: host, process
+                and a random suffix)
+        """
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}")
+        if database_path != ":memory:":
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            database_path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "tenant_id" not in columns:
+            # Databases created before jobs were owned by tenants
+            self._conn.execute(
+                "ALTER TABLE jobs ADD COLUMN tenant_id TEXT NOT NULL DEFAULT 'default'")
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(job_items)")}
+        for column in ("worker_id", "lease_expires_at"):
+            if column not in columns:
+                # Databases created before claims were leases
+                self._conn.execute(f"ALTER TABLE job_items ADD COLUMN {column} TEXT")
+        self._last_tenant: Optional[str] = None
+
+    async def create_job(
+        self,
+        documents: List[Tuple[Optional[str], str]],
+        tenant_id: str = DEFAULT_TENANT
+    ) -> Job:
+        """Create a job and enqueue its documents.
+
+        Args:
+            documents: (document_id, text) pairs in job order
+            tenant_id: Tenant creating the job
+
+        Returns:
+            The created job
+        """
+        return await asyncio.to_thread(self._create_job, documents, tenant_id)
+
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job with its progress.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job, or None if unknown
+        """
+        return await asyncio.to_thread(self._get_job, job_id)
+
+    async def claim_next(self) -> Optional[JobItem]:
+        """Atomically claim a pending document under a lease.
+
+        Tenants with pending work take turns; within a tenant the oldest
+        job and the lowest document index come first.
+
+        Returns:
+            The claimed document, or None if the queue is empty
+        """
+        return await asyncio.to_thread(self._claim_next)
+
+    async def complete_item(self, item: JobItem, result: Dict[str, Any], success: bool) -> None:
+        """Store the result of a claimed document.
+
+        The result is dropped if this worker no longer holds the lease
+        (it expired and the document was claimed again).
+
+        Args:
+            item: Claimed document
+            result: JSON-serializable processing result
+            success: Whether processing succeeded
+        """
+        await asyncio.to_thread(self._complete_item, item, json.dumps(result), success)
+
+    async def get_results(self, job_id: str, cursor: int, limit: int) -> List[JobItem]:
+        """Get documents of a job with their status, in index order.
+
+        Args:
+            job_id: Job identifier
+            cursor: Smallest document index to return
+            limit: Maximum number of documents
+
+        Returns:
+            Documents with index >= cursor (without text); result is set
+            for finished documents only
+        """
+        return await asyncio.to_thread(self._get_results, job_id, cursor, limit)
+
+    async def delete_job(self, job_id: str) -> bool:
+        """Delete a job with its documents and results.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Whether the job existed
+        """
+        return await asyncio.to_thread(self._delete_jobs, [job_id]) > 0
+
+    async def purge_finished(self, older_than_seconds: float) -> int:
+        """Delete finished jobs last updated more than older_than_seconds ago.
+
+        Args:
+            older_than_seconds: Retention period
+
+        Returns:
+            Number of deleted jobs
+        """
+        return await asyncio.to_thread(self._purge_finished, older_than_seconds)
+
+    async def renew_leases(self) -> int:
+        """Extend the leases of the documents this worker is processing.
+
+        Returns:
+            Number of renewed leases
+        """
+        return await asyncio.to_thread(self._renew_leases)
+
+    async def requeue_expired(self) -> int:
+        """Return documents whose lease expired to the queue.
+
+        Their worker died or stopped renewing (e.g. a process that was
+        killed), so the documents are claimable again.
+
+        Returns:
+            Number of requeued documents
+        """
+        return await asyncio.to_thread(self._requeue_expired)
+
+    async def release_claims(self) -> int:
+        """Return the documents this worker is processing to the queue.
+
+        Called on shutdown, so they are picked up without waiting for the
+        leases to expire.
+
+        Returns:
+            Number of released documents
+        """
+        return await asyncio.to_thread(self._release_claims)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _create_job(self, documents: List[Tuple[Optional[str], str]], tenant_id: str) -> Job:
+        """Insert a job and its documents in one transaction."""
+        job_id = uuid.uuid4().hex
+        now = _now()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO jobs (job_id, tenant_id, total, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (job_id, tenant_id, len(documents), now, now)
+                )
+                self._conn.executemany(
+                    "INSERT INTO job_items (job_id, idx, document_id, text) VALUES (?, ?, ?, ?)",
+                    ((job_id, index, document_id, text)
+                     for index, (document_id, text) in enumerate(documents))
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return self._read_job(job_id)
+
+    def _get_job(self, job_id: str) -> Optional[Job]:
+        """Read a job under the connection lock."""
+        with self._lock:
+            return self._read_job(job_id)
+
+    def _read_job(self, job_id: str) -> Optional[Job]:
+        """Read a job and derive its status from the counters."""
+        row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        finished = row["completed"] + row["failed"]
+        if finished >= row["total"]:
+            status = "completed"
+        elif finished > 0 or self._conn.execute(
+            "SELECT 1 FROM job_items WHERE job_id = ? AND status = 'running' LIMIT 1",
+            (job_id,)
+        ).fetchone():
+            status = "running"
+        else:
+            status = "pending"
+
+        return Job(
+            job_id=row["job_id"],
+            tenant_id=row["tenant_id"],
+            status=status,
+            total=row["total"],
+            completed=row["completed"],
+            failed=row["failed"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"])
+        )
+
+    def _claim_next(self) -> Optional[JobItem]:
+        """Mark the next pending document as running and return it."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                claimed = self._find_pending()
+                if claimed is not None:
+                    tenant_id, row = claimed
+                    self._conn.execute(
+                        "UPDATE job_items SET status = 'running', worker_id = ?, "
+                        "lease_expires_at = ? WHERE rowid = ?",
+                        (self.worker_id, self._lease_expiry(), row["rowid"])
+                    )
+                    self._last_tenant = tenant_id
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if claimed is None:
+            return None
+        return JobItem(
+            job_id=row["job_id"],
+            tenant_id=tenant_id,
+            index=row["idx"],
+            document_id=row["document_id"],
+            text=row["text"],
+            status="running"
+        )
+
+    def _find_pending(self) -> Optional[Tuple[str, sqlite3.Row]]:
+        """Find the next pending document, rotating over tenants."""
+        tenants = [
+            row["tenant_id"]
+            for row in self._conn.execute(
+                "SELECT DISTINCT tenant_id FROM jobs WHERE completed + failed < total "
+                "ORDER BY tenant_id"
+            )
+        ]
+        if self._last_tenant in tenants:
+            start = tenants.index(self._last_tenant) + 1
+            tenants = tenants[start:] + tenants[:start]
+
+        for tenant_id in tenants:
+            jobs = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE tenant_id = ? AND completed + failed < total "
+                "ORDER BY created_at, job_id",
+                (tenant_id,)
+            ).fetchall()
+            for job in jobs:
+                row = self._conn.execute(
+                    "SELECT rowid, job_id, idx, document_id, text FROM job_items "
+                    "WHERE job_id = ? AND status = 'pending' ORDER BY idx LIMIT 1",
+                    (job["job_id"],)
+                ).fetchone()
+                if row is not None:
+                    return tenant_id, row
+        return None
+
+    def _complete_item(self, item: JobItem, result: str, success: bool) -> None:
+        """Store a result and update the job counters in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                updated = self._conn.execute(
+                    "UPDATE job_items SET status = ?, result = ?, text = NULL, "
+                    "worker_id = NULL, lease_expires_at = NULL "
+                    "WHERE job_id = ? AND idx = ? AND status = 'running' AND worker_id = ?",
+                    ("done" if success else "failed", result, item.job_id, item.index,
+                     self.worker_id)
+                ).rowcount
+                if updated:
+                    column = "completed" if success else "failed"
+                    self._conn.execute(
+                        f"UPDATE jobs SET {column} = {column} + 1, updated_at = ? WHERE job_id = ?",
+                        (_now(), item.job_id)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _get_results(self, job_id: str, cursor: int, limit: int) -> List[JobItem]:
+        """Read a page of documents."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idx, document_id, status, result FROM job_items "
+                "WHERE job_id = ? AND idx >= ? ORDER BY idx LIMIT ?",
+                (job_id, cursor, limit)
+            ).fetchall()
+        return [
+            JobItem(
+                job_id=job_id,
+                index=row["idx"],
+                document_id=row["document_id"],
+                status=row["status"],
+                result=json.loads(row["result"]) if row["result"] is not None else None
+            )
+            for row in rows
+        ]
+
+    def _delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete jobs and their documents in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM job_items WHERE job_id = ?", ((job_id,) for job_id in job_ids))
+                deleted = sum(
+                    self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,)).rowcount
+                    for job_id in job_ids
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return deleted
+
+    def _purge_finished(self, older_than_seconds: float) -> int:
+        """Delete finished jobs older than the retention period."""
+        cutoff = (datetime.now(UTC) - timedelta(seconds=older_than_seconds)).isoformat()
+        with self._lock:
+            job_ids = [
+                row["job_id"]
+                for row in self._conn.execute(
+                    "SELECT job_id FROM jobs WHERE completed + failed >= total AND updated_at < ?",
+                    (cutoff,)
+                )
+            ]
+        return self._delete_jobs(job_ids) if job_ids else 0
+
+    def _renew_leases(self) -> int:
+        """Move the lease expiry of this worker's documents forward."""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE job_items SET lease_expires_at = ? "
+                "WHERE status = 'running' AND worker_id = ?",
+                (self._lease_expiry(), self.worker_id)
+            ).rowcount
+
+    def _requeue_expired(self) -> int:
+        """Reset running documents with an expired (or no) lease to pending."""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE job_items SET status = 'pending', worker_id = NULL, "
+                "lease_expires_at = NULL WHERE status = 'running' "
+                "AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+                (_now(),)
+            ).rowcount
+
+    def _release_claims(self) -> int:
+        """Reset this worker's running documents to pending."""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE job_items SET status = 'pending', worker_id = NULL, "
+                "lease_expires_at = NULL WHERE status = 'running' AND worker_id = ?",
+                (self.worker_id,)
+            ).rowcount
+
+    def _lease_expiry(self) -> str:
+        """Expiry time of a lease taken or renewed now."""
+        return (datetime.now(UTC) + timedelta(seconds=self.lease_seconds)).isoformat()
+
+
+def _now() -> str:
+    """Current UTC time as ISO 8601 string."""
+    return datetime.now(UTC).isoformat()
@@ -0,0 +1,28 @@
+"""Telemetry exporters, profilers, event loop monitoring and structured logging."""
+
+from .loop_monitor import EventLoopMonitor
+from .otlp_file_exporter import OtlpJsonFileExporter
+from .profiler import StackSampler, profile_summary
+from .structured_logging import (
+    JsonFormatter,
+    LogPayload,
+    NonBlockingQueueHandler,
+    configure_logging,
+    logging_configured,
+    payload,
+    set_payload_policy
+)
+
+__all__ = [
+    "EventLoopMonitor",
+    "OtlpJsonFileExporter",
+    "StackSampler",
+    "profile_summary",
+    "JsonFormatter",
+    "LogPayload",
+    "NonBlockingQueueHandler",
+    "configure_logging",
+    "logging_configured",
+    "payload",
+    "set_payload_policy",
+]
@@ -0,0 +1,215 @@
+"""Event loop lag monitoring and detection of blocking calls."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ...application.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS, SYNC_IO_CALLS
+
+logger = logging.getLogger(__name__)
+
+# Audit events of blocking I/O flagged in debug mode
+_SYNC_IO_EVENTS = frozenset({
+    "open",
+    "os.system",
+    "socket.connect",
+    "socket.getaddrinfo",
+    "socket.gethostbyname",
+    "subprocess.Popen",
+    "time.sleep",
+})
+
+# Callers whose file reads are not request-path I/O: module imports, and
+# source lines read for tracebacks (by asyncio debug mode among others)
+_IGNORED_CALLER_PREFIXES = ("<frozen importlib",)
+_IGNORED_CALLER_SUFFIXES = ("linecache.py", "tokenize.py")
+
+_active_monitor: Optional["EventLoopMonitor"] = None
+_audit_hook_installed = False
+_in_hook = threading.local()
+
+
+def _audit_hook(event: str, args: Tuple[Any, ...]) -> None:
+    """Forward blocking I/O events to the active monitor (audit hooks cannot be removed)."""
+    monitor = _active_monitor
+    if monitor is None or event not in _SYNC_IO_EVENTS or getattr(_in_hook, "active", False):
+        return
+    if threading.get_ident() != monitor._loop_thread_id:
+        return
+    _in_hook.active = True
+    try:
+        monitor._on_sync_io(event, args)
+    finally:
+        _in_hook.active = False
+
+
+class EventLoopMonitor:
+    """Measures event loop lag and reports what blocks the loop.
+
+    A heartbeat task sleeps for ``interval_seconds`` in a loop; how late
+    it wakes up is the lag every other coroutine sees, and is recorded in
+    the ``anonymizer_event_loop_lag_seconds`` histogram. A watchdog thread
+    checks the heartbeat: when the loop has not run it for longer than
+    ``stall_threshold_seconds``, the loop thread's current stack - the code
+    blocking it - is logged once per stall and counted.
+
+    In debug mode asyncio's own debug checks are enabled (callbacks slower
+    than the threshold are logged with their coroutine) and blocking I/O
+    made from coroutines on the loop thread - file opens, blocking socket
+    connects, DNS lookups, ``time.sleep``, subprocesses - is counted and
+    logged with its stack, once per call site. Debug mode slows the loop
+    down and is meant for staging and local runs.
+
+    Example:
+        >>> monitor = EventLoopMonitor(stall_threshold_seconds=0.25)
+        >>> monitor.start()
+        >>> monitor.stats()["max_lag_ms"]
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        stall_threshold_seconds: float = 0.25,
+        debug: bool = False,
+        max_stack_depth: int = 30
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval_seconds: Time between heartbeats
+            stall_threshold_seconds: Blocking longer than this is logged with its stack
+            debug: Enable asyncio debug mode and flag blocking I/O in coroutines
+            max_stack_depth: Frames logged per stack
+        """
+        self.interval_seconds = interval_seconds
+        self.stall_threshold_seconds = stall_threshold_seconds
+        self.debug = debug
+        self.max_stack_depth = max_stack_depth
+
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self.stalls = 0
+        self.sync_io_calls = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._loop_debug = False
+        self._beat = 0.0
+        self._reported_beat: Optional[float] = None
+        self._sync_io_sites: Set[Tuple[str, str, int]] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog on the running event loop."""
+        global _active_monitor, _audit_hook_installed
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat(), name="event-loop-monitor")
+        self._thread = threading.Thread(
+            target=self._watchdog, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+        if self.debug:
+            self._loop_debug = self._loop.get_debug()
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self.stall_threshold_seconds
+            if not _audit_hook_installed:
+                sys.addaudithook(_audit_hook)
+                _audit_hook_installed = True
+            _active_monitor = self
+            logger.warning("Event loop debug mode is on: blocking I/O in coroutines is logged")
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the watchdog."""
+        global _active_monitor
+        if _active_monitor is self:
+            _active_monitor = None
+        if self.debug and self._loop is not None:
+            self._loop.set_debug(self._loop_debug)
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._stop.set()
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        """Record how late each heartbeat wakes up."""
+        while True:
+            expected = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            now = time.perf_counter()
+            self._beat = now
+            lag = max(0.0, now - expected)
+            self.last_lag_seconds = lag
+            self.max_lag_seconds = max(self.max_lag_seconds, lag)
+            EVENT_LOOP_LAG.observe(lag)
+
+    def _watchdog(self) -> None:
+        """Log the loop thread's stack when the heartbeat is overdue."""
+        check_interval = min(self.interval_seconds, self.stall_threshold_seconds) / 2
+        while not self._stop.wait(check_interval):
+            beat = self._beat
+            blocked = time.perf_counter() - beat - self.interval_seconds
+            if blocked < self.stall_threshold_seconds or self._reported_beat == beat:
+                continue
+            self._reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self.stalls += 1
+            EVENT_LOOP_STALLS.inc()
+            logger.warning(
+                "Event loop blocked for more than %.0f ms in:\n%s",
+                blocked * 1000, self._format_stack(frame))
+
+    def _on_sync_io(self, event: str, args: Tuple[Any, ...]) -> None:
+        """Count and log a blocking I/O call made on the loop thread (debug mode)."""
+        if self._loop is None or asyncio.current_task(self._loop) is None:
+            return
+        if event == "socket.connect" and not args[0].getblocking():
+            return
+
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        if frame is None:
+            return
+        filename = frame.f_code.co_filename
+        if filename.startswith(_IGNORED_CALLER_PREFIXES) or filename.endswith(
+                _IGNORED_CALLER_SUFFIXES):
+            return
+
+        self.sync_io_calls += 1
+        SYNC_IO_CALLS.inc(event=event)
+        site = (event, frame.f_code.co_filename, frame.f_lineno)
+        if site in self._sync_io_sites:
+            return
+        self._sync_io_sites.add(site)
+        logger.warning(
+            "Blocking %s call in a coroutine on the event loop:\n%s",
+            event, self._format_stack(frame))
+
+    def _format_stack(self, frame: FrameType) -> str:
+        """Format a stack, innermost frame last."""
+        return "".join(traceback.format_stack(frame, limit=self.max_stack_depth)).rstrip()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get event loop statistics."""
+        return {
+            "last_lag_ms": round(self.last_lag_seconds * 1000, 3),
+            "max_lag_ms": round(self.max_lag_seconds * 1000, 3),
+            "stalls": self.stalls,
+            "sync_io_calls": self.sync_io_calls,
+            "debug": self.debug,
+        }
@@ -0,0 +1,60 @@
+"""Export traces as OpenTelemetry JSON to a local file."""
+
+import asyncio
+import json
+import logging
+import threading
+from pathlib import Path
+
+from ...application.tracing import Trace
+
+logger = logging.getLogger(__name__)
+
+
+class OtlpJsonFileExporter:
+    """Append traces to a file in the OTLP/JSON file format.
+
+    Each line is one ExportTraceServiceRequest, the format read by the
+    OpenTelemetry Collector's ``otlpjsonfile`` receiver, so traces can be
+    shipped to Jaeger, Tempo or any OTLP backend later. Writes happen in a
+    worker thread; a failed write is logged and the trace dropped.
+
+    Example:
+        >>> exporter = OtlpJsonFileExporter("data/traces.jsonl")
+        >>> await exporter.export(trace)
+    """
+
+    def __init__(self, path: str, service_name: str = "gdpr-anonymizer") -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: File the traces are appended to (parent directories are created)
+            service_name: ``service.name`` resource attribute
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self.exported = 0
+        self.failed = 0
+
+    async def export(self, trace: Trace) -> None:
+        """Append a finished trace to the file.
+
+        Args:
+            trace: Trace to export
+        """
+        line = json.dumps(trace.to_otlp(self.service_name), separators=(",", ":"))
+        try:
+            await asyncio.to_thread(self._append, line)
+        except OSError as e:
+            self.failed += 1
+            logger.warning(f"Failed to export trace {trace.trace_id}: {e}")
+            return
+        self.exported += 1
+
+    def _append(self, line: str) -> None:
+        """Append one line, serialized between threads."""
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
@@ -0,0 +1,174 @@
+"""Sampling and per-request CPU profiling."""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+# (function name, file, first line) of a stack frame
+FrameKey = Tuple[str, str, int]
+
+
+class StackSampler:
+    """Profiler sampling the Python stacks of all threads at an interval.
+
+    A background thread captures ``sys._current_frames()`` every
+    ``interval_seconds`` while the sampler runs. Sampling has a small,
+    constant cost independent of the code being profiled, so it can run
+    over live traffic. Stacks of the event loop thread show where request
+    handling spends CPU; a thread waiting in the selector shows up as idle
+    time in ``select``/``epoll``.
+
+    Example:
+        >>> sampler = StackSampler(interval_seconds=0.01)
+        >>> sampler.start()
+        >>> await asyncio.sleep(30)
+        >>> sampler.stop()
+        >>> text = sampler.collapsed()
+    """
+
+    def __init__(self, interval_seconds: float = 0.01, max_depth: int = 128) -> None:
+        """Initialize the sampler.
+
+        Args:
+            interval_seconds: Time between samples
+            max_depth: Frames kept per stack (innermost first)
+        """
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.duration_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop.clear()
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        own_id = threading.get_ident()
+        names = {}
+        start = time.perf_counter()
+        while not self._stop.wait(self.interval_seconds):
+            if len(names) != threading.active_count():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                thread = names.get(thread_id, str(thread_id))
+                self.stacks[(thread, self._stack(frame))] += 1
+            self.samples += 1
+        self.duration_seconds = time.perf_counter() - start
+
+    def _stack(self, frame: Optional[FrameType]) -> Tuple[FrameKey, ...]:
+        """Frames of a stack, outermost first."""
+        frames: List[FrameKey] = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        frames.reverse()
+        return tuple(frames)
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format (flamegraph.pl, speedscope, ...).
+
+        Returns:
+            One ``thread;outer;...;inner count`` line per distinct stack
+        """
+        lines = []
+        for (thread, frames), count in self.stacks.most_common():
+            path = ";".join([thread] + [_label(frame) for frame in frames])
+            lines.append(f"{path} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str = "profile") -> Dict[str, Any]:
+        """Samples as a speedscope file, one sampled profile per thread.
+
+        Args:
+            name: Profile name shown by speedscope
+
+        Returns:
+            JSON-serializable speedscope document
+        """
+        frame_index: Dict[FrameKey, int] = {}
+        frames: List[Dict[str, Any]] = []
+        profiles: Dict[str, Dict[str, Any]] = {}
+
+        for (thread, stack), count in self.stacks.items():
+            indices = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                indices.append(frame_index[frame])
+            profile = profiles.setdefault(thread, {
+                "type": "sampled",
+                "name": thread,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0.0,
+                "samples": [],
+                "weights": [],
+            })
+            profile["samples"].append(indices)
+            profile["weights"].append(count * self.interval_seconds)
+            profile["endValue"] += count * self.interval_seconds
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "gdpr-anonymizer",
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
+
+
+def profile_summary(profile: cProfile.Profile, limit: int = 40, sort: str = "cumulative") -> str:
+    """Render the top functions of a cProfile run as text.
+
+    Args:
+        profile: Finished profile
+        limit: Number of functions listed
+        sort: pstats sort key (cumulative, tottime, calls, ...)
+
+    Returns:
+        pstats report
+    """
+    output = io.StringIO()
+    stats = pstats.Stats(profile, stream=output)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+
+def _label(frame: FrameKey) -> str:
+    """Collapsed-stack label of a frame."""
+    name, filename, line = frame
+    return f"{name} ({_short_path(filename)}:{line})"
+
+
+def _short_path(filename: str) -> str:
+    """Path relative to site-packages or the source tree."""
+    for marker in ("site-packages/", "/src/"):
+        index = filename.rfind(marker)
+        if index != -1:
+            return filename[index + len(marker):]
+    return filename
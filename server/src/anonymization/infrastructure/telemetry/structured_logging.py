@@ -0,0 +1,226 @@
+"""Non-blocking structured logging with redaction of document content.
+
+``configure_logging`` applies a logging YAML file and moves the handlers
+it defines behind queues: loggers only append records to a queue, and a
+listener thread formats and writes them. Messages use %-style
+arguments, which are formatted in the listener thread, not where the call
+is made, and not at all when the level is disabled.
+
+Document text, prompts and LLM responses are logged through ``payload``.
+By default a payload renders as its length only, so original values never
+reach the logs; with redaction turned off (for local debugging) large
+payloads are truncated and only a sample of them is logged.
+
+Example:
+    >>> configure_logging("logging.yaml")
+    >>> logger.debug("LLM response: %s", payload(response))
+"""
+
+import atexit
+import json
+import logging
+import logging.config
+import logging.handlers
+import queue
+import random
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import yaml
+
+from ...application.metrics import LOG_RECORDS_DROPPED
+from ...application.tenancy import current_tenant
+from ...application.tracing import current_trace
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "taskName", "trace_id", "tenant"}
+
+# Argument types that are safe to format later in the listener thread
+_DEFERRABLE_TYPES = (str, int, float, bool, type(None))
+
+
+@dataclass
+class PayloadPolicy:
+    """How ``payload`` values render in log messages.
+
+    Attributes:
+        redact: Render payloads as their length only
+        max_chars: Payloads longer than this are truncated (when not redacted)
+        sample_rate: Share of large payloads that are shown at all (when
+            not redacted); the others render as their length
+    """
+    redact: bool = True
+    max_chars: int = 2000
+    sample_rate: float = 1.0
+
+
+_policy = PayloadPolicy()
+_configured = False
+
+
+def set_payload_policy(
+    redact: bool = True,
+    max_chars: int = 2000,
+    sample_rate: float = 1.0
+) -> None:
+    """Set how payloads are rendered (see PayloadPolicy)."""
+    global _policy
+    _policy = PayloadPolicy(redact=redact, max_chars=max_chars, sample_rate=sample_rate)
+
+
+class LogPayload:
+    """Log argument wrapping document content, rendered per PayloadPolicy."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        text = self.value if isinstance(self.value, str) else str(self.value)
+        if _policy.redact:
+            return f"<redacted {len(text)} chars>"
+        if len(text) <= _policy.max_chars:
+            return text
+        if random.random() >= _policy.sample_rate:
+            return f"<{len(text)} chars, not sampled>"
+        return f"{text[:_policy.max_chars]}... <{len(text) - _policy.max_chars} more chars>"
+
+    __repr__ = __str__
+
+
+def payload(value: Any) -> LogPayload:
+    """Mark document content (text, prompts, responses, entity values) in a log call.
+
+    Rendering happens only when the record is written.
+
+    Example:
+        >>> logger.debug("Full response: %s", payload(response))
+    """
+    return LogPayload(value)
+
+
+def logging_configured() -> bool:
+    """Whether configure_logging has run in this process."""
+    return _configured
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Every record has ``timestamp``, ``level``, ``logger`` and ``message``,
+    the trace id and tenant of the request that logged it, ``extra``
+    fields passed to the logging call, and ``exception`` if any.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Render a record as JSON."""
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("trace_id", "tenant"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        elif record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks the caller and formats lazily.
+
+    Records are enqueued without waiting; when the queue is full they are
+    dropped and counted. Unlike the standard QueueHandler, the message is
+    not formatted here when its arguments are immutable (strings, numbers,
+    payloads), which moves the formatting cost to the listener thread.
+    The request's trace id and tenant are captured here, while the
+    context is still available.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Capture context and make the record safe to hand to another thread."""
+        trace = current_trace()
+        record.trace_id = trace.trace_id if trace is not None else None
+        record.tenant = current_tenant()
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        args = record.args
+        if args and not all(isinstance(arg, _DEFERRABLE_TYPES + (LogPayload,)) for arg in (
+                args.values() if isinstance(args, dict) else args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def configure_logging(
+    config_path: Union[str, Path],
+    queue_size: int = 10000
+) -> List[logging.handlers.QueueListener]:
+    """Apply a logging YAML file and route its handlers through queues.
+
+    Loggers sharing the same handlers share one queue and listener thread.
+    Besides the standard ``logging.config.dictConfig`` schema the file may
+    contain:
+
+        queue: false          # keep handlers synchronous
+        payloads:             # see PayloadPolicy
+          redact: true
+          max_chars: 2000
+          sample_rate: 1.0
+
+    Args:
+        config_path: Logging configuration file
+        queue_size: Records buffered per queue before new ones are dropped
+
+    Returns:
+        Running queue listeners (stopped at exit); empty if queues are disabled
+    """
+    global _configured
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+    _configured = True
+    use_queue = config.pop("queue", True)
+    set_payload_policy(**(config.pop("payloads", None) or {}))
+    logging.config.dictConfig(config)
+    if not use_queue:
+        return []
+
+    queue_handlers: Dict[tuple, NonBlockingQueueHandler] = {}
+    listeners: List[logging.handlers.QueueListener] = []
+    loggers = [logging.getLogger()] + [
+        logging.getLogger(name) for name in (config.get("loggers") or {})]
+    for logger in loggers:
+        if not logger.handlers:
+            continue
+        handlers = tuple(logger.handlers)
+        if handlers not in queue_handlers:
+            queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+            listener = logging.handlers.QueueListener(
+                queue_handler.queue, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            queue_handlers[handlers] = queue_handler
+            listeners.append(listener)
+        logger.handlers = [queue_handlers[handlers]]
+    return listeners
@@ -0,0 +1,179 @@
+"""Admission control and load shedding for the REST layer."""
+
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .serialization import ModelJSONResponse
+from ...application.metrics import ADMISSION_REJECTIONS
+
+
+class AdmissionController:
+    """Decides whether a new request may start, based on current load.
+
+    A request is rejected when the number of admitted in-flight requests
+    reached ``max_in_flight`` or when the LLM call queue is deeper than
+    ``max_queue_depth``. The Retry-After hint is derived from the moving
+    average duration of admitted requests and the size of the backlog.
+    Rejections are counted in ``anonymizer_admission_rejections_total``.
+
+    Example:
+        >>> controller = AdmissionController(max_in_flight=32)
+        >>> admitted, retry_after = controller.try_acquire()
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        max_queue_depth: Optional[int] = 64,
+        queue_depth_probe: Optional[Callable[[], int]] = None,
+        retry_after_min_seconds: int = 1,
+        retry_after_max_seconds: int = 60,
+        smoothing: float = 0.1
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            max_in_flight: Maximum concurrently admitted requests
+            max_queue_depth: Maximum LLM calls waiting for a slot; None disables the check
+            queue_depth_probe: Returns the current LLM call queue depth
+            retry_after_min_seconds: Lower bound of the Retry-After hint
+            retry_after_max_seconds: Upper bound of the Retry-After hint
+            smoothing: Weight of the newest duration in the moving average
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.queue_depth_probe = queue_depth_probe
+        self.retry_after_min_seconds = retry_after_min_seconds
+        self.retry_after_max_seconds = retry_after_max_seconds
+        self.smoothing = smoothing
+
+        self.in_flight = 0
+        self.avg_duration_seconds: Optional[float] = None
+
+        self.admitted = 0
+        self.rejected_in_flight = 0
+        self.rejected_queue_depth = 0
+
+    def try_acquire(self) -> Tuple[bool, int]:
+        """Admit a request if capacity allows.
+
+        Returns:
+            Tuple of (admitted, Retry-After seconds when rejected)
+        """
+        if self.in_flight >= self.max_in_flight:
+            self.rejected_in_flight += 1
+            ADMISSION_REJECTIONS.inc(reason="in_flight")
+            return False, self._retry_after(self.in_flight - self.max_in_flight + 1)
+
+        if self.max_queue_depth is not None and self.queue_depth_probe is not None:
+            queue_depth = self.queue_depth_probe()
+            if queue_depth > self.max_queue_depth:
+                self.rejected_queue_depth += 1
+                ADMISSION_REJECTIONS.inc(reason="queue_depth")
+                return False, self._retry_after(queue_depth - self.max_queue_depth)
+
+        self.in_flight += 1
+        self.admitted += 1
+        return True, 0
+
+    def release(self, duration_seconds: float) -> None:
+        """Mark an admitted request as finished.
+
+        Args:
+            duration_seconds: Time the request spent in the application
+        """
+        self.in_flight -= 1
+        if self.avg_duration_seconds is None:
+            self.avg_duration_seconds = duration_seconds
+        else:
+            self.avg_duration_seconds += self.smoothing * (duration_seconds - self.avg_duration_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get admission statistics.
+
+        Returns:
+            Dictionary with in-flight requests, limits and rejection counts
+        """
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected_in_flight + self.rejected_queue_depth,
+            "rejected_in_flight": self.rejected_in_flight,
+            "rejected_queue_depth": self.rejected_queue_depth,
+            "avg_duration_seconds": self.avg_duration_seconds,
+        }
+
+    def _retry_after(self, backlog: int) -> int:
+        """Estimate when capacity frees up.
+
+        Admitted requests finish at about max_in_flight / avg_duration per
+        second, so a backlog of ``backlog`` requests drains in
+        backlog * avg_duration / max_in_flight seconds.
+
+        Args:
+            backlog: Requests (or calls) above the limit, including this one
+
+        Returns:
+            Retry-After seconds, clamped to the configured bounds
+        """
+        if self.avg_duration_seconds is None:
+            return self.retry_after_min_seconds
+        estimate = math.ceil(backlog * self.avg_duration_seconds / self.max_in_flight)
+        return max(self.retry_after_min_seconds, min(self.retry_after_max_seconds, estimate))
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying the admission controller to LLM-bound routes.
+
+    The controller is read from ``app.state.admission_controller`` (set by
+    the lifespan handler); without one every request is admitted. A request
+    counts as in flight until its response, including streamed bodies, is
+    complete.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            paths: Path prefixes subject to admission control
+        """
+        self.app = app
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Admit, reject or pass through a request."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        controller: Optional[AdmissionController] = getattr(
+            scope["app"].state, "admission_controller", None)
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        admitted, retry_after = controller.try_acquire()
+        if not admitted:
+            response = ModelJSONResponse(
+                {"detail": "Server is at capacity, retry later"},
+                status_code=429,
+                headers={"Retry-After": str(retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(time.perf_counter() - start)
@@ -2,11 +2,14 @@
 
 from pathlib import Path
 from functools import lru_cache
-from typing import Any
+from typing import Any, Dict, Optional, Union
 
-from ...application.config import AppConfig
+from ...application.config import AppConfig, LLMBackendConfig, LLMConfig
 from ...application.orchestrator import AnonymizationOrchestrator
+from ...application.result_cache import ResultCache, compute_config_fingerprint
+from ...domain.ports import IJobStore
 from ...infrastructure.config_loader import ConfigLoader
+from ...infrastructure.persistence import SQLiteJobStore
 from ...infrastructure.adapters.llm import create_llm_provider
 from ...infrastructure.agents import (
     Agent1Implementation,
@@ -30,6 +33,35 @@ def get_config() -> AppConfig:
     return ConfigLoader.load_from_file(config_path)
 
 
+def _provider_config(llm: Union[LLMConfig, LLMBackendConfig]) -> Dict[str, Any]:
+    """Build the adapter configuration dictionary for a backend.
+
+    Args:
+        llm: Primary LLM configuration or an additional backend
+
+    Returns:
+        Configuration dictionary accepted by create_llm_provider
+    """
+    llm_config: Dict[str, Any] = {
+        "model": llm.model,
+        "temperature": llm.temperature,
+        "max_tokens": llm.max_tokens
+    }
+
+    # Add ollama-specific configuration if present
+    if llm.ollama:
+        llm_config["ollama"] = {
+            "base_url": llm.ollama.base_url,
+            "auth_token": llm.ollama.auth_token,
+            "keep_alive": llm.ollama.keep_alive
+        }
+
+    if llm.fake:
+        llm_config["fake"] = llm.fake.model_dump()
+
+    return llm_config
+
+
 @lru_cache()
 def get_llm_provider() -> Any:
     """Get LLM provider instance (singleton).
@@ -41,18 +73,32 @@ def get_llm_provider() -> Any:
         ValueError: If provider configuration is invalid
     """
     config = get_config()
-    llm_config = {
-        "model": config.llm.model,
-        "temperature": config.llm.temperature,
-        "max_tokens": config.llm.max_tokens
+    llm_config = _provider_config(config.llm)
+    llm_config["max_concurrency"] = config.llm.max_concurrency
+    llm_config["priority_aging_seconds"] = config.llm.priority_aging_seconds
+    llm_config["tenants"] = {
+        name: tenant.model_dump() for name, tenant in config.tenancy.tenants.items()
     }
-
-    # Add ollama-specific configuration if present
-    if config.llm.ollama:
-        llm_config["ollama"] = {
-            "base_url": config.llm.ollama.base_url,
-            "auth_token": config.llm.ollama.auth_token
-        }
+    llm_config["default_tenant"] = config.tenancy.default.model_dump()
+
+    if config.llm.fallbacks:
+        llm_config["fallbacks"] = [
+            {"provider": backend.provider, "config": _provider_config(backend)}
+            for backend in config.llm.fallbacks
+        ]
+        llm_config["circuit_breaker"] = config.llm.circuit_breaker.model_dump()
+
+    hedging = config.llm.hedging
+    if hedging.enabled:
+        llm_config["hedging"] = hedging.model_dump(exclude={"secondary"})
+        if hedging.secondary:
+            llm_config["hedging"]["secondary"] = {
+                "provider": hedging.secondary.provider,
+                "config": _provider_config(hedging.secondary)
+            }
+
+    if config.llm.cassette.mode:
+        llm_config["cassette"] = config.llm.cassette.model_dump()
 
     return create_llm_provider(
         provider=config.llm.provider,
@@ -60,8 +106,30 @@ def get_llm_provider() -> Any:
     )
 
 
+@lru_cache()
+def get_result_cache() -> Optional[ResultCache]:
+    """Get the whole-result cache (singleton).
+
+    Returns:
+        ResultCache instance, or None if caching is disabled
+    """
+    config = get_config()
+    if not config.cache.enabled:
+        return None
+
+    return ResultCache(
+        fingerprint=compute_config_fingerprint(config),
+        max_memory_bytes=config.cache.max_memory_bytes,
+        disk_path=Path(config.cache.disk_path) if config.cache.disk_path else None
+    )
+
+
+@lru_cache()
 def get_orchestrator() -> AnonymizationOrchestrator:
-    """Get orchestrator instance (per-request).
+    """Get orchestrator instance (singleton).
+
+    Created once by the application lifespan handler and shared by all
+    requests; agents hold no per-request state.
 
     Returns:
         AnonymizationOrchestrator with configured agents
@@ -79,5 +147,17 @@ def get_orchestrator() -> AnonymizationOrchestrator:
         agent1=agent1,
         agent2=agent2,
         agent3=agent3,
-        max_iterations=config.orchestration.max_iterations
+        max_iterations=config.orchestration.max_iterations,
+        result_cache=get_result_cache()
     )
+
+
+@lru_cache()
+def get_job_store() -> IJobStore:
+    """Get the durable job store (singleton).
+
+    Returns:
+        SQLiteJobStore on the configured database file
+    """
+    config = get_config().jobs
+    return SQLiteJobStore(config.database_path, lease_seconds=config.lease_seconds)
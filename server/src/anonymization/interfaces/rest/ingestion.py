@@ -0,0 +1,491 @@
+"""Incremental parsing and rendering of bulk upload files.
+
+Uploads (JSONL, CSV or plain text, sent raw or as multipart/form-data)
+are consumed chunk by chunk from the request stream and turned into
+records without buffering the whole body. Each format has a codec that
+reads records and renders the anonymized record in the same format.
+"""
+
+import codecs
+import csv
+import io
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from .schemas import AnonymizeResponse
+
+MAX_RECORD_BYTES = 16 * 1024 * 1024
+"""Upper bound for a single record (line or CSV row)."""
+
+MAX_PART_HEADER_BYTES = 16 * 1024
+"""Upper bound for the headers of a multipart part."""
+
+UPLOAD_MEDIA_TYPES = {
+    "jsonl": "application/x-ndjson",
+    "csv": "text/csv",
+    "text": "text/plain",
+}
+
+_CONTENT_TYPE_FORMATS = {
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/json-lines": "jsonl",
+    "text/csv": "csv",
+    "text/plain": "text",
+}
+
+_EXTENSION_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".txt": "text",
+}
+
+_BOUNDARY_PATTERN = re.compile(r'boundary="?([^";]+)"?')
+_FILENAME_PATTERN = re.compile(r'filename="([^"]*)"')
+
+
+class UploadError(ValueError):
+    """Raised when an upload cannot be parsed."""
+    pass
+
+
+class UploadStreamingResponse(StreamingResponse):
+    """Streaming response whose body is produced while the request is read.
+
+    StreamingResponse listens for client disconnects on ``receive``, which
+    would swallow request body chunks that the body iterator still needs.
+    This variant leaves ``receive`` to the iterator; a disconnect surfaces
+    as ClientDisconnect while reading the request stream.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the response without competing for request messages."""
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def detect_format(content_type: Optional[str], filename: Optional[str] = None) -> Optional[str]:
+    """Infer the upload format from a content type or file name.
+
+    Args:
+        content_type: Content type of the body or multipart part
+        filename: File name of the multipart part
+
+    Returns:
+        "jsonl", "csv", "text", or None if unknown
+    """
+    if filename:
+        for extension, upload_format in _EXTENSION_FORMATS.items():
+            if filename.lower().endswith(extension):
+                return upload_format
+    if content_type:
+        return _CONTENT_TYPE_FORMATS.get(content_type.split(";")[0].strip().lower())
+    return None
+
+
+class MultipartFileReader:
+    """Streaming reader for the first file of a multipart/form-data body.
+
+    Only the bytes of the file part are yielded; the body is scanned for
+    the boundary with a carry-over buffer, so memory stays bounded by the
+    chunk size.
+
+    Example:
+        >>> reader = MultipartFileReader(request.stream(), content_type)
+        >>> await reader.open()
+        >>> async for chunk in reader.iter_bytes():
+        ...     ...
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], content_type: str) -> None:
+        """Initialize the reader.
+
+        Args:
+            chunks: Request body chunks
+            content_type: Content-Type header of the request
+
+        Raises:
+            UploadError: If the content type has no boundary
+        """
+        match = _BOUNDARY_PATTERN.search(content_type)
+        if match is None:
+            raise UploadError("multipart/form-data request without boundary")
+        self._chunks = chunks
+        self._delimiter = b"\r\n--" + match.group(1).encode("latin-1")
+        # The first delimiter is not preceded by CRLF
+        self._buffer = b"\r\n"
+        self._exhausted = False
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+
+    async def open(self) -> None:
+        """Skip to the body of the first file part.
+
+        Raises:
+            UploadError: If the body contains no file part
+        """
+        while True:
+            if not await self._skip_to_delimiter():
+                raise UploadError("multipart body contains no file")
+            if not await self._fill(2):
+                raise UploadError("truncated multipart body")
+            if self._buffer.startswith(b"--"):
+                raise UploadError("multipart body contains no file")
+
+            headers = await self._read_part_headers()
+            disposition = headers.get("content-disposition", "")
+            filename = _FILENAME_PATTERN.search(disposition)
+            if filename is not None:
+                self.filename = filename.group(1)
+                self.content_type = headers.get("content-type")
+                return
+
+    async def iter_bytes(self) -> AsyncIterator[bytes]:
+        """Yield the content of the file part.
+
+        Yields:
+            Chunks of the file content
+
+        Raises:
+            UploadError: If the body ends before the closing boundary
+        """
+        keep = len(self._delimiter) - 1
+        while True:
+            index = self._buffer.find(self._delimiter)
+            if index >= 0:
+                if index:
+                    yield self._buffer[:index]
+                self._buffer = self._buffer[index:]
+                return
+            if len(self._buffer) > keep:
+                yield self._buffer[:-keep]
+                self._buffer = self._buffer[-keep:]
+            if not await self._read_chunk():
+                raise UploadError("truncated multipart body")
+
+    async def _skip_to_delimiter(self) -> bool:
+        """Discard data up to and including the next delimiter."""
+        keep = len(self._delimiter) - 1
+        while True:
+            index = self._buffer.find(self._delimiter)
+            if index >= 0:
+                self._buffer = self._buffer[index + len(self._delimiter):]
+                return True
+            self._buffer = self._buffer[-keep:]
+            if not await self._read_chunk():
+                return False
+
+    async def _read_part_headers(self) -> Dict[str, str]:
+        """Read the headers following a delimiter line."""
+        while True:
+            end = self._buffer.find(b"\r\n\r\n")
+            if end >= 0:
+                break
+            if len(self._buffer) > MAX_PART_HEADER_BYTES:
+                raise UploadError("multipart part headers too large")
+            if not await self._read_chunk():
+                raise UploadError("truncated multipart body")
+
+        raw_headers = self._buffer[:end].decode("latin-1")
+        self._buffer = self._buffer[end + 4:]
+
+        headers: Dict[str, str] = {}
+        for line in raw_headers.split("\r\n"):
+            name, separator, value = line.partition(":")
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+        return headers
+
+    async def _fill(self, size: int) -> bool:
+        """Read until the buffer holds at least ``size`` bytes."""
+        while len(self._buffer) < size:
+            if not await self._read_chunk():
+                return False
+        return True
+
+    async def _read_chunk(self) -> bool:
+        """Append the next body chunk to the buffer."""
+        if self._exhausted:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._exhausted = True
+            return False
+        self._buffer += chunk
+        return True
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 chunks and split them into lines.
+
+    Args:
+        chunks: Byte chunks
+
+    Yields:
+        Lines without their line terminator
+
+    Raises:
+        UploadError: If a line exceeds MAX_RECORD_BYTES
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        if len(pending) > MAX_RECORD_BYTES:
+            raise UploadError(f"record exceeds {MAX_RECORD_BYTES} bytes")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+class JsonlCodec:
+    """JSON Lines records: one JSON object per line.
+
+    The text field is replaced by the anonymized text and an
+    ``anonymization`` object with the outcome is added.
+    """
+
+    media_type = UPLOAD_MEDIA_TYPES["jsonl"]
+
+    def __init__(self, text_field: str = "text", id_field: Optional[str] = None) -> None:
+        """Initialize the codec.
+
+        Args:
+            text_field: Key holding the text to anonymize
+            id_field: Optional key holding the document identifier
+        """
+        self.text_field = text_field
+        self.id_field = id_field
+
+    async def records(self, lines: AsyncIterator[str]) -> AsyncIterator[Tuple[Any, Optional[str], Optional[str]]]:
+        """Parse records from lines.
+
+        Args:
+            lines: Input lines
+
+        Yields:
+            Tuples of (record, text or None, document id)
+        """
+        async for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"anonymization": {"success": False, "error": f"Invalid JSON: {e}"}}, None, None
+                continue
+            if not isinstance(record, dict) or not isinstance(record.get(self.text_field), str):
+                yield {"anonymization": {
+                    "success": False,
+                    "error": f"Record has no string field '{self.text_field}'"
+                }}, None, None
+                continue
+            document_id = record.get(self.id_field) if self.id_field else None
+            yield record, record[self.text_field], None if document_id is None else str(document_id)
+
+    def header(self) -> Optional[str]:
+        """JSON Lines have no header."""
+        return None
+
+    def render(self, record: Any, response: Optional[AnonymizeResponse]) -> str:
+        """Render an output line.
+
+        Args:
+            record: Parsed input record
+            response: Anonymization result, or None if the record was not processed
+
+        Returns:
+            JSON line
+        """
+        if response is None:
+            return json.dumps(record, ensure_ascii=False) + "\n"
+        output = dict(record)
+        output[self.text_field] = response.anonymized_text
+        output["anonymization"] = _outcome(response)
+        return json.dumps(output, ensure_ascii=False) + "\n"
+
+
+class CsvCodec:
+    """CSV records with a header row.
+
+    Rows are assembled from lines by quote parity, so quoted fields may
+    contain line breaks. The text column is replaced by the anonymized
+    text and ``anonymization_success`` and ``risk_level`` columns are
+    appended.
+    """
+
+    media_type = UPLOAD_MEDIA_TYPES["csv"]
+
+    def __init__(self, text_field: str = "text", id_field: Optional[str] = None) -> None:
+        """Initialize the codec.
+
+        Args:
+            text_field: Column holding the text to anonymize
+            id_field: Optional column holding the document identifier
+        """
+        self.text_field = text_field
+        self.id_field = id_field
+        self.columns: List[str] = []
+        self._text_index = 0
+        self._id_index: Optional[int] = None
+
+    async def read_header(self, rows: AsyncIterator[List[str]]) -> None:
+        """Read and check the header row.
+
+        Args:
+            rows: Row iterator positioned at the header
+
+        Raises:
+            UploadError: If the header is missing or lacks the text column
+        """
+        try:
+            self.columns = await rows.__anext__()
+        except StopAsyncIteration:
+            raise UploadError("CSV upload is empty")
+        if self.text_field not in self.columns:
+            raise UploadError(f"CSV header has no column '{self.text_field}'")
+        self._text_index = self.columns.index(self.text_field)
+        if self.id_field and self.id_field in self.columns:
+            self._id_index = self.columns.index(self.id_field)
+
+    async def records(self, rows: AsyncIterator[List[str]]) -> AsyncIterator[Tuple[Any, Optional[str], Optional[str]]]:
+        """Parse records from rows following the header.
+
+        Args:
+            rows: Row iterator positioned after the header
+
+        Yields:
+            Tuples of (row, text or None, document id)
+        """
+        async for row in rows:
+            if self._text_index >= len(row):
+                yield row, None, None
+                continue
+            document_id = row[self._id_index] if self._id_index is not None and self._id_index < len(row) else None
+            yield row, row[self._text_index], document_id
+
+    def header(self) -> Optional[str]:
+        """Render the output header row."""
+        return _csv_line(self.columns + ["anonymization_success", "risk_level"])
+
+    def render(self, record: Any, response: Optional[AnonymizeResponse]) -> str:
+        """Render an output row.
+
+        Args:
+            record: Parsed input row
+            response: Anonymization result, or None if the row was not processed
+
+        Returns:
+            CSV row
+        """
+        row = list(record)
+        if response is None:
+            return _csv_line(row + ["", ""])
+        row[self._text_index] = response.anonymized_text
+        return _csv_line(row + [
+            "true" if response.success else "false",
+            response.risk_assessment.risk_level
+        ])
+
+
+class TextCodec:
+    """Plain text: every non-blank line is a document.
+
+    Output has one anonymized line per input line; a line that could not
+    be processed is emitted empty so the original is never echoed, and
+    blank lines are passed through.
+    """
+
+    media_type = UPLOAD_MEDIA_TYPES["text"]
+
+    async def records(self, lines: AsyncIterator[str]) -> AsyncIterator[Tuple[Any, Optional[str], Optional[str]]]:
+        """Parse records from lines.
+
+        Args:
+            lines: Input lines
+
+        Yields:
+            Tuples of (line, text or None, None)
+        """
+        async for line in lines:
+            yield line, line if line.strip() else None, None
+
+    def header(self) -> Optional[str]:
+        """Plain text has no header."""
+        return None
+
+    def render(self, record: Any, response: Optional[AnonymizeResponse]) -> str:
+        """Render an output line.
+
+        Args:
+            record: Input line
+            response: Anonymization result, or None for a blank line
+
+        Returns:
+            Anonymized line
+        """
+        if response is None:
+            return record + "\n"
+        # Multi-line output would shift the line correspondence
+        return response.anonymized_text.replace("\n", " ") + "\n"
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[List[str]]:
+    """Assemble CSV rows from lines.
+
+    A row is complete once it contains an even number of quote
+    characters; until then the next line belongs to a quoted field.
+
+    Args:
+        lines: Input lines
+
+    Yields:
+        Parsed rows
+
+    Raises:
+        UploadError: If a row exceeds MAX_RECORD_BYTES or a quote is never closed
+    """
+    pending: Optional[str] = None
+    async for line in lines:
+        pending = line if pending is None else pending + "\n" + line
+        if pending.count('"') % 2:
+            if len(pending) > MAX_RECORD_BYTES:
+                raise UploadError(f"record exceeds {MAX_RECORD_BYTES} bytes")
+            continue
+        if pending:
+            yield next(csv.reader([pending]))
+        pending = None
+
+    if pending is not None:
+        raise UploadError("CSV upload ends inside a quoted field")
+
+
+def _csv_line(row: List[str]) -> str:
+    """Render a CSV row terminated by a newline."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(row)
+    return buffer.getvalue()
+
+
+def _outcome(response: AnonymizeResponse) -> Dict[str, Any]:
+    """Summarize an anonymization result for an output record."""
+    outcome: Dict[str, Any] = {
+        "success": response.success,
+        "risk_level": response.risk_assessment.risk_level,
+        "mappings": len(response.mappings),
+    }
+    if not response.success and response.error:
+        outcome["error"] = response.error
+    return outcome
@@ -0,0 +1,241 @@
+"""Application lifecycle - service creation, warm-up and shutdown."""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import FastAPI
+
+from .admission import AdmissionController
+from .profiling import ProfilingService
+from .dependencies import get_config, get_job_store, get_llm_provider, get_orchestrator
+from .tenancy import TenantResolver
+from .routers.jobs import failed_job_result, process_job_item
+from ...application.config import AppConfig
+from ...application.job_runner import JobRunner
+from ...application.llm_health import LLMHealthMonitor
+from ...application.metrics import LLM_CALLS_IN_FLIGHT, LLM_QUEUE_DEPTH, REGISTRY
+from ...application.usage import usage_labels
+from ...infrastructure.telemetry import (
+    EventLoopMonitor,
+    OtlpJsonFileExporter,
+    configure_logging,
+    logging_configured
+)
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the logging configuration file
+LOGGING_CONFIG_ENV = "ANONYMIZER_LOGGING_CONFIG"
+
+# Providers whose readiness probe is a billed generation
+BILLED_PROBE_PROVIDERS = frozenset({"claude"})
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up phase.
+
+    Attributes:
+        ready: True once warm-up finished (successfully or not)
+        error: Error message if warm-up failed
+        duration_seconds: Time spent warming up
+    """
+    ready: bool = False
+    error: Optional[str] = None
+    duration_seconds: Optional[float] = None
+
+
+warmup_state = WarmupState()
+
+
+async def warm_up(state: WarmupState) -> None:
+    """Warm up the LLM provider so the first request is fast.
+
+    Opens provider connections and, for Ollama, loads the model into memory
+    with the configured keep-alive. Failures are recorded but do not stop
+    the application; the provider is retried lazily on the first request.
+
+    Args:
+        state: Warm-up state to update
+    """
+    start = time.perf_counter()
+    try:
+        provider = get_llm_provider()
+        provider_warm_up = getattr(provider, "warm_up", None)
+        if provider_warm_up is not None:
+            await provider_warm_up()
+        logger.info("LLM provider warm-up complete")
+    except Exception as e:
+        state.error = str(e)
+        logger.warning(f"LLM provider warm-up failed: {e}")
+    finally:
+        state.duration_seconds = time.perf_counter() - start
+        state.ready = True
+
+
+def _configure_logging() -> None:
+    """Apply the logging configuration unless the launcher already did.
+
+    run_api.py configures logging before uvicorn starts; servers started
+    directly with uvicorn (as in the container image) get the queued JSON
+    pipeline and payload policy here.
+    """
+    if logging_configured():
+        return
+    path = Path(os.environ.get(LOGGING_CONFIG_ENV, "logging.yaml"))
+    if not path.is_file():
+        logger.warning(f"Logging configuration {path} not found; using the default logging setup")
+        return
+    configure_logging(path)
+
+
+async def _probe_llm_provider() -> None:
+    """Probe the LLM provider, if it supports probing."""
+    provider_probe = getattr(get_llm_provider(), "probe", None)
+    if provider_probe is not None:
+        with usage_labels("readiness_probe"):
+            await provider_probe()
+
+
+def _probe_interval(config: AppConfig) -> float:
+    """Time between LLM probes, longer if any configured backend bills them.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Probe interval in seconds
+    """
+    backends = [config.llm, *config.llm.fallbacks]
+    if config.llm.hedging.enabled and config.llm.hedging.secondary is not None:
+        backends.append(config.llm.hedging.secondary)
+    if any(backend.provider in BILLED_PROBE_PROVIDERS for backend in backends):
+        return config.readiness.billed_probe_interval_seconds
+    return config.readiness.probe_interval_seconds
+
+
+def _llm_queue_depth() -> int:
+    """Number of LLM calls waiting in the provider call scheduler."""
+    stats = getattr(get_llm_provider(), "stats", None)
+    if stats is None:
+        return 0
+    return stats().get("queue_depth", 0)
+
+
+def _refresh_llm_gauges() -> None:
+    """Mirror the provider call scheduler's state into the metrics gauges."""
+    stats = getattr(get_llm_provider(), "stats", None)
+    if stats is None:
+        return
+    snapshot = stats()
+    if "in_flight" in snapshot:
+        LLM_CALLS_IN_FLIGHT.set(snapshot["in_flight"])
+    for priority, lane in snapshot.get("priorities", {}).items():
+        LLM_QUEUE_DEPTH.set(lane["queue_depth"], priority=priority)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create application-lifetime services and run warm-up.
+
+    The orchestrator, agents and LLM provider are built once before the
+    server accepts connections, and the job workers are started. Warm-up
+    runs in the background so liveness probes answer immediately while
+    readiness stays false until it ends. The LLM health monitor probes
+    the provider in the background for the readiness check, and the event
+    loop monitor reports code blocking the loop.
+
+    Args:
+        app: FastAPI application
+    """
+    _configure_logging()
+    config = get_config()
+    get_orchestrator()
+
+    loop_monitor: Optional[EventLoopMonitor] = None
+    if config.event_loop.monitor_enabled:
+        loop_monitor = EventLoopMonitor(
+            interval_seconds=config.event_loop.interval_ms / 1000,
+            stall_threshold_seconds=config.event_loop.stall_threshold_ms / 1000,
+            debug=config.event_loop.debug
+        )
+        loop_monitor.start()
+        app.state.event_loop_monitor = loop_monitor
+
+    warmup_task = asyncio.create_task(warm_up(warmup_state))
+
+    llm_health: Optional[LLMHealthMonitor] = None
+    if config.readiness.llm_probe_enabled:
+        llm_health = LLMHealthMonitor(
+            _probe_llm_provider,
+            interval_seconds=_probe_interval(config),
+            timeout_seconds=config.readiness.probe_timeout_seconds,
+            failure_threshold=config.readiness.failure_threshold
+        )
+        llm_health.start()
+        app.state.llm_health = llm_health
+
+    app.state.tenant_resolver = TenantResolver(config.tenancy)
+    app.state.tracing_enabled = config.tracing.enabled
+    app.state.trace_max_spans = config.tracing.max_spans
+    if config.tracing.enabled and config.tracing.export_path:
+        app.state.trace_exporter = OtlpJsonFileExporter(
+            config.tracing.export_path, service_name=config.tracing.service_name)
+    REGISTRY.add_refresh_hook(_refresh_llm_gauges)
+
+    if config.profiling.enabled:
+        admin_token = os.environ.get(config.profiling.admin_token_env)
+        if not admin_token:
+            logger.warning(
+                f"Profiling is enabled but {config.profiling.admin_token_env} is not set; "
+                "debug endpoints will refuse all requests")
+        app.state.profiling = ProfilingService(config.profiling, admin_token)
+
+    if config.admission.enabled:
+        app.state.admission_controller = AdmissionController(
+            max_in_flight=config.admission.max_in_flight_requests,
+            max_queue_depth=config.admission.max_queue_depth,
+            queue_depth_probe=_llm_queue_depth,
+            retry_after_min_seconds=config.admission.retry_after_min_seconds,
+            retry_after_max_seconds=config.admission.retry_after_max_seconds
+        )
+
+    # Job workers resume documents interrupted by a previous shutdown
+    job_runner: Optional[JobRunner] = None
+    if config.jobs.enabled:
+        job_runner = JobRunner(
+            store=get_job_store(),
+            handler=process_job_item,
+            workers=config.jobs.workers,
+            poll_interval_seconds=config.jobs.poll_interval_seconds,
+            error_handler=failed_job_result,
+            retention_seconds=config.jobs.retention_seconds,
+            purge_interval_seconds=config.jobs.purge_interval_seconds,
+            lease_renew_interval_seconds=config.jobs.lease_seconds / 3
+        )
+        await job_runner.start()
+        app.state.job_runner = job_runner
+
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        if llm_health is not None:
+            await llm_health.stop()
+        REGISTRY.remove_refresh_hook(_refresh_llm_gauges)
+        if job_runner is not None:
+            await job_runner.stop()
+        provider_close = getattr(get_llm_provider(), "close", None)
+        if provider_close is not None:
+            try:
+                await provider_close()
+            except Exception as e:
+                logger.warning(f"Failed to close LLM provider: {e}")
+        if loop_monitor is not None:
+            await loop_monitor.stop()
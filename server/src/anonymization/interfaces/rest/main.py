@@ -6,7 +6,15 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pathlib import Path
 
-from .routers import anonymization, health
+from .admission import AdmissionMiddleware
+from .lifecycle import lifespan
+from .metrics import MetricsMiddleware
+from .priority import PriorityMiddleware
+from .profiling import RequestProfileMiddleware
+from .tenancy import TenantMiddleware
+from .tracing import TracingMiddleware
+from ...application.priority import Priority
+from .routers import anonymization, debug, health, jobs, metrics
 
 # Create FastAPI application
 app = FastAPI(
@@ -14,10 +22,31 @@ app = FastAPI(
     description="Production-ready text anonymization system with hexagonal architecture",
     version="0.5.0",
     docs_url="/api/docs",      # Move docs to /api/docs
-    redoc_url="/api/redoc"     # Move redoc to /api/redoc
+    redoc_url="/api/redoc",    # Move redoc to /api/redoc
+    lifespan=lifespan
 )
 
-# Configure CORS
+# Shed load on LLM-bound routes before work is queued
+app.add_middleware(AdmissionMiddleware, paths=["/api/v1/anonymize"])
+
+# LLM priority class per route (overridable with the X-Priority header)
+app.add_middleware(PriorityMiddleware, routes=[
+    ("/api/v1/anonymize/batch", Priority.BATCH),
+    ("/api/v1/anonymize/upload", Priority.BATCH),
+    ("/api/v1/anonymize", Priority.INTERACTIVE),
+])
+
+# Attribute API requests to tenants (runs before admission and priority)
+app.add_middleware(TenantMiddleware, path_prefix="/api/")
+
+# cProfile single requests on demand (admin token and X-Profile header)
+app.add_middleware(RequestProfileMiddleware)
+
+# Per-request stage tracing and Server-Timing header
+app.add_middleware(TracingMiddleware, path_prefix="/api/")
+
+# Configure CORS (outside admission and tenancy, so their 429 and 401
+# responses carry CORS headers and preflights are answered before them)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
@@ -26,9 +55,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency and concurrency metrics (outermost, sees rejected requests)
+app.add_middleware(MetricsMiddleware)
+
 # Include API routers
 app.include_router(health.router)
 app.include_router(anonymization.router)
+app.include_router(jobs.router)
+app.include_router(metrics.router)
+app.include_router(debug.router)
 
 # Serve static files (UI)
 static_dir = Path("/app/static")
@@ -0,0 +1,57 @@
+"""HTTP request metrics."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...application.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording duration and concurrency of HTTP requests.
+
+    Requests are labelled with the matched route template (for example
+    ``/api/v1/jobs/{job_id}``) rather than the raw path, so label
+    cardinality stays bounded. Durations include streamed response bodies.
+    Added as the outermost middleware, it also sees requests rejected by
+    the tenant and admission middlewares.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: tuple = ("/metrics",)) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            exclude_paths: Paths not recorded (the scrape endpoint itself)
+        """
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time a request."""
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                route=getattr(route, "path", "unmatched"),
+                method=scope["method"],
+                status=str(status)
+            )
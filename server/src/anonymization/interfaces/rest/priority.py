@@ -0,0 +1,70 @@
+"""Per-request LLM priority selection."""
+
+from typing import Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ...application.priority import Priority, priority_scope
+
+PRIORITY_HEADER = b"x-priority"
+
+
+class PriorityMiddleware:
+    """ASGI middleware setting the LLM priority class of each request.
+
+    The class comes from the ``X-Priority`` header (interactive, batch or
+    background) or else from the first matching route prefix. Everything
+    the request runs, including tasks it spawns and streamed response
+    bodies, inherits the class through the context.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Sequence[Tuple[str, Priority]],
+        default: Priority = Priority.INTERACTIVE
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            routes: (path prefix, priority) pairs, most specific first
+            default: Priority for requests matching no prefix
+        """
+        self.app = app
+        self.routes = list(routes)
+        self.default = default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request inside its priority scope."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with priority_scope(self.resolve(scope)):
+            await self.app(scope, receive, send)
+
+    def resolve(self, scope: Scope) -> Priority:
+        """Determine the priority of a request.
+
+        Args:
+            scope: ASGI HTTP scope
+
+        Returns:
+            Priority from the header if valid, else from the route table
+        """
+        requested = _header_priority(scope)
+        if requested is not None:
+            return requested
+        for prefix, priority in self.routes:
+            if scope["path"].startswith(prefix):
+                return priority
+        return self.default
+
+
+def _header_priority(scope: Scope) -> Optional[Priority]:
+    """Read the X-Priority header, ignoring unknown values."""
+    for name, value in scope["headers"]:
+        if name == PRIORITY_HEADER:
+            return Priority.__members__.get(value.decode("latin-1").strip().upper())
+    return None
@@ -0,0 +1,174 @@
+"""On-demand profiling of the running server."""
+
+import asyncio
+import cProfile
+import secrets
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...application.config import ProfilingConfig
+from ...infrastructure.telemetry import StackSampler, profile_summary
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a sampling profile is requested while another one runs."""
+    pass
+
+
+class ProfilingService:
+    """Admin-only sampling profiles and per-request cProfile summaries.
+
+    Sampling profiles run one at a time over all threads for a fixed
+    duration. Request profiles run one at a time as well: a request asking
+    for one while another is being profiled is served unprofiled. Their
+    summaries are kept in a small ring buffer for retrieval by id.
+
+    Example:
+        >>> service = ProfilingService(config.profiling, admin_token="secret")
+        >>> sampler = await service.sample(seconds=30)
+        >>> text = sampler.collapsed()
+    """
+
+    def __init__(self, config: ProfilingConfig, admin_token: Optional[str]) -> None:
+        """Initialize the service.
+
+        Args:
+            config: Profiling configuration
+            admin_token: Token admin requests must present; None refuses all
+        """
+        self.config = config
+        self.admin_token = admin_token or None
+        self.sampling = False
+        self.request_profiling = False
+        self.profiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.samples_taken = 0
+        self.requests_profiled = 0
+
+    def is_admin(self, token: Optional[str]) -> bool:
+        """Whether a token matches the admin token (constant-time)."""
+        if self.admin_token is None or token is None:
+            return False
+        return secrets.compare_digest(token.encode("utf-8"), self.admin_token.encode("utf-8"))
+
+    async def sample(self, seconds: float, interval_ms: Optional[float] = None) -> StackSampler:
+        """Sample all thread stacks for a while.
+
+        Args:
+            seconds: Sampling duration (capped at max_seconds)
+            interval_ms: Time between samples (default from the configuration)
+
+        Returns:
+            Stopped sampler holding the samples
+
+        Raises:
+            ProfilerBusyError: If another sampling profile is running
+        """
+        if self.sampling:
+            raise ProfilerBusyError("A sampling profile is already running")
+        self.sampling = True
+        sampler = StackSampler(interval_seconds=(interval_ms or self.config.interval_ms) / 1000)
+        try:
+            sampler.start()
+            await asyncio.sleep(min(seconds, self.config.max_seconds))
+        finally:
+            # Joining waits for at most one sampling interval
+            await asyncio.to_thread(sampler.stop)
+            self.sampling = False
+        self.samples_taken += 1
+        return sampler
+
+    def get_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Stored request profile by id, or None."""
+        return self.profiles.get(profile_id)
+
+    def _store_profile(self, profile_id: str, record: Dict[str, Any]) -> None:
+        """Keep a request profile, dropping the oldest beyond the limit."""
+        self.profiles[profile_id] = record
+        while len(self.profiles) > self.config.stored_request_profiles:
+            self.profiles.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get profiling statistics."""
+        return {
+            "sampling": self.sampling,
+            "request_profiling": self.request_profiling,
+            "samples_taken": self.samples_taken,
+            "requests_profiled": self.requests_profiled,
+            "stored_request_profiles": len(self.profiles),
+        }
+
+
+class RequestProfileMiddleware:
+    """ASGI middleware running single requests under cProfile on request.
+
+    A request carrying the profile header (``X-Profile: 1`` by default) and
+    a valid admin token is profiled from the moment it enters the
+    application until its response is complete. The response carries an
+    ``X-Profile-Id`` header; the summary is available from
+    GET /api/v1/debug/profiles/{id} once the request finished.
+
+    cProfile hooks the whole interpreter thread, so coroutines of other
+    requests that run while the profiled request awaits appear in its
+    profile too. Profile a request on an otherwise quiet instance for a
+    clean picture.
+
+    The service is read from ``app.state.profiling`` (set by the lifespan
+    when profiling is enabled); without one the header is ignored.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile or pass through a request."""
+        service: Optional[ProfilingService] = getattr(scope["app"].state, "profiling", None)
+        if scope["type"] != "http" or service is None or service.request_profiling:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if (
+            headers.get(service.config.request_header, "").lower() in ("", "0", "false")
+            or not service.is_admin(headers.get(service.config.admin_token_header))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        record: Dict[str, Any] = {
+            "id": profile_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": "running",
+        }
+        service._store_profile(profile_id, record)
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                record["status_code"] = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        service.request_profiling = True
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.disable()
+            service.request_profiling = False
+            service.requests_profiled += 1
+            record["duration_seconds"] = round(time.perf_counter() - start, 6)
+            record["summary"] = profile_summary(profiler, limit=service.config.summary_limit)
+            record["status"] = "complete"
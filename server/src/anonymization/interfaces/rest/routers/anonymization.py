@@ -1,11 +1,27 @@
 """Anonymization API router."""
 
-from datetime import datetime
+import asyncio
+from collections import deque
+from datetime import datetime, UTC
 import json
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from ..dependencies import get_orchestrator, get_config
+from ..ingestion import (
+    CsvCodec,
+    JsonlCodec,
+    MultipartFileReader,
+    TextCodec,
+    UploadError,
+    UploadStreamingResponse,
+    detect_format,
+    iter_csv_rows,
+    iter_lines
+)
+from ..serialization import ModelJSONResponse, dumps
 from ..schemas import (
     AnonymizeRequest,
     AnonymizeResponse,
@@ -13,30 +29,314 @@ from ..schemas import (
     BatchAnonymizeResponse,
     ValidationIssueResponse,
     ValidationResponse,
-    RiskAssessmentResponse
+    RiskAssessmentResponse,
+    UsageResponse
+)
+from ....application.orchestrator import (
+    AnonymizationOrchestrator,
+    AnonymizationResult,
+    EventCallback,
+    OrchestratorEvent
 )
-from ....application.orchestrator import AnonymizationOrchestrator, AnonymizationResult
 from ....application.config import AppConfig
+from ....application.tracing import current_trace
+from ....application.usage import usage_scope
+from ....domain.exceptions import LLMProviderUnavailableError
 from ....domain.models import Document
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/v1", tags=["anonymization"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 @router.post("/anonymize", response_model=AnonymizeResponse)
 async def anonymize_document(
     request: AnonymizeRequest,
+    timings: bool = Query(False, description="Include per-stage timings in the response"),
     orchestrator: AnonymizationOrchestrator = Depends(get_orchestrator),
     config: AppConfig = Depends(get_config)
-) -> AnonymizeResponse:
+) -> ModelJSONResponse:
     """Anonymize a single document.
 
     Args:
         request: Document to anonymize
+        timings: Whether to fill the timings field from the request trace
         orchestrator: Injected orchestrator instance
 
     Returns:
         AnonymizeResponse with anonymized text and analysis
 
+    Raises:
+        HTTPException: If anonymization fails
+    """
+    response = await _anonymize(request, orchestrator, config)
+    trace = current_trace()
+    if timings and trace is not None:
+        response.timings = trace.timings()
+    return ModelJSONResponse(response)
+
+
+@router.post("/anonymize/stream")
+async def anonymize_document_stream(
+    request: AnonymizeRequest,
+    orchestrator: AnonymizationOrchestrator = Depends(get_orchestrator),
+    config: AppConfig = Depends(get_config)
+) -> StreamingResponse:
+    """Anonymize a single document, streaming progress as server-sent events.
+
+    Emits one event per workflow stage as soon as it finishes
+    (``entities``, ``anonymized_text`` and ``validation`` for every
+    iteration, then ``risk_assessment``), followed by a ``result`` event
+    carrying the full AnonymizeResponse, or an ``error`` event.
+
+    Args:
+        request: Document to anonymize
+        orchestrator: Injected orchestrator instance
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    return StreamingResponse(
+        _stream_events(request, orchestrator, config),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/anonymize/upload")
+async def anonymize_upload(
+    http_request: Request,
+    upload_format: Optional[str] = Query(
+        None,
+        alias="format",
+        pattern="^(jsonl|csv|text)$",
+        description="Upload format; inferred from the file name or content type if omitted"
+    ),
+    text_field: str = Query("text", description="JSONL key or CSV column holding the text"),
+    id_field: Optional[str] = Query(None, description="JSONL key or CSV column holding the document id"),
+    orchestrator: AnonymizationOrchestrator = Depends(get_orchestrator),
+    config: AppConfig = Depends(get_config)
+) -> UploadStreamingResponse:
+    """Anonymize a JSONL, CSV or plain text file, streaming the output.
+
+    The file is sent as the raw request body or as the first file of a
+    multipart/form-data body. Records are parsed incrementally from the
+    request stream, processed with at most orchestration.batch_concurrency
+    in flight, and written back in input order and in the same format, so
+    memory stays constant regardless of file size.
+
+    Args:
+        http_request: Raw request providing the body stream
+        upload_format: Upload format (jsonl, csv, text)
+        text_field: Key or column holding the text to anonymize
+        id_field: Optional key or column holding the document identifier
+        orchestrator: Injected orchestrator instance
+
+    Returns:
+        StreamingResponse with the anonymized records
+
+    Raises:
+        HTTPException: 400 for malformed uploads, 415 for unknown formats
+    """
+    content_type = http_request.headers.get("content-type", "")
+    chunks: AsyncIterator[bytes] = http_request.stream()
+    file_format = upload_format
+
+    try:
+        if content_type.startswith("multipart/form-data"):
+            multipart = MultipartFileReader(chunks, content_type)
+            await multipart.open()
+            chunks = multipart.iter_bytes()
+            file_format = file_format or detect_format(multipart.content_type, multipart.filename)
+        else:
+            file_format = file_format or detect_format(content_type)
+
+        if file_format is None:
+            raise HTTPException(
+                status_code=415,
+                detail="Unknown upload format; use ?format=jsonl|csv|text"
+            )
+
+        lines = iter_lines(chunks)
+        if file_format == "csv":
+            codec = CsvCodec(text_field, id_field)
+            rows = iter_csv_rows(lines)
+            await codec.read_header(rows)
+            records = codec.records(rows)
+        elif file_format == "jsonl":
+            codec = JsonlCodec(text_field, id_field)
+            records = codec.records(lines)
+        else:
+            codec = TextCodec()
+            records = codec.records(lines)
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return UploadStreamingResponse(
+        _stream_upload(codec, records, orchestrator, config),
+        media_type=codec.media_type
+    )
+
+
+async def _stream_upload(
+    codec: Any,
+    records: AsyncIterator[Tuple[Any, Optional[str], Optional[str]]],
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig
+) -> AsyncIterator[str]:
+    """Anonymize upload records and render them in input order.
+
+    A sliding window of batch_concurrency records is in flight; output is
+    emitted in input order, so a slow record delays the ones after it but
+    memory stays bounded by the window.
+
+    Args:
+        codec: Format codec rendering the output
+        records: Parsed (record, text, document id) tuples
+        orchestrator: Orchestrator instance
+        config: Application configuration
+
+    Yields:
+        Rendered output records
+    """
+    async def process(record: Any, text: Optional[str], document_id: Optional[str]) -> str:
+        if text is None or not text.strip():
+            return codec.render(record, None)
+        response, _ = await process_document(
+            AnonymizeRequest(text=text, document_id=document_id), orchestrator, config)
+        return codec.render(record, response)
+
+    header = codec.header()
+    if header is not None:
+        yield header
+
+    window: Deque[asyncio.Task] = deque()
+    try:
+        try:
+            async for record, text, document_id in records:
+                window.append(asyncio.create_task(process(record, text, document_id)))
+                if len(window) >= config.orchestration.batch_concurrency:
+                    yield await window.popleft()
+        except UploadError as e:
+            # Headers are already sent: flush finished records, then abort
+            logger.warning(f"Upload aborted: {e}")
+            while window:
+                yield await window.popleft()
+            raise
+
+        while window:
+            yield await window.popleft()
+    finally:
+        for task in window:
+            task.cancel()
+
+
+async def _stream_events(
+    request: AnonymizeRequest,
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig
+) -> AsyncIterator[str]:
+    """Run the workflow and yield its progress as SSE frames.
+
+    Args:
+        request: Document to anonymize
+        orchestrator: Orchestrator instance
+        config: Application configuration
+
+    Yields:
+        Server-sent event frames
+    """
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_event(event: OrchestratorEvent) -> None:
+        events.put_nowait(("progress", event))
+
+    async def run() -> None:
+        try:
+            response = await _anonymize(request, orchestrator, config, on_event)
+            events.put_nowait(("result", response))
+        except HTTPException as e:
+            events.put_nowait(("error", e))
+
+    task = asyncio.create_task(run())
+    try:
+        while True:
+            kind, payload = await events.get()
+            if kind == "progress":
+                yield _sse_frame(payload.stage, {"iteration": payload.iteration, **payload.data})
+            elif kind == "result":
+                yield f"event: result\ndata: {payload.model_dump_json()}\n\n"
+                break
+            else:
+                yield _sse_frame("error", {"status_code": payload.status_code, "detail": payload.detail})
+                break
+    finally:
+        # Stop the workflow if the client disconnected early
+        task.cancel()
+
+
+def _sse_frame(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        SSE frame terminated by a blank line
+    """
+    return f"event: {event}\ndata: {dumps(data).decode('utf-8')}\n\n"
+
+
+async def _anonymize(
+    request: AnonymizeRequest,
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig,
+    on_event: Optional[EventCallback] = None
+) -> AnonymizeResponse:
+    """Run the workflow for one document and build the API response.
+
+    The LLM usage of the document is attached to the response, including
+    the calls of documents whose entities could not be parsed.
+
+    Args:
+        request: Document to anonymize
+        orchestrator: Orchestrator instance
+        config: Application configuration
+        on_event: Optional orchestrator progress callback
+
+    Returns:
+        AnonymizeResponse with anonymized text, analysis and usage
+
+    Raises:
+        HTTPException: If anonymization fails
+    """
+    with usage_scope() as usage:
+        response = await _run_workflow(request, orchestrator, config, on_event)
+    if response.usage is None:
+        response.usage = UsageResponse.model_validate(usage.summary())
+    return response
+
+
+async def _run_workflow(
+    request: AnonymizeRequest,
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig,
+    on_event: Optional[EventCallback] = None
+) -> AnonymizeResponse:
+    """Run the workflow for one document and build the API response.
+
+    Args:
+        request: Document to anonymize
+        orchestrator: Orchestrator instance
+        config: Application configuration
+        on_event: Optional orchestrator progress callback
+
+    Returns:
+        AnonymizeResponse with anonymized text and analysis
+
     Raises:
         HTTPException: If anonymization fails
     """
@@ -47,43 +347,10 @@ async def anonymize_document(
             document_id=request.document_id
         )
 
-        result: AnonymizationResult = await orchestrator.anonymize_document(document)
-
-        validation_issues = [
-            ValidationIssueResponse(
-                identifier_type=issue.identifier_type,
-                value=issue.value,
-                context=issue.context,
-                location_hint=issue.location_hint
-            )
-            for issue in result.validation.issues
-        ]
+        result: AnonymizationResult = await orchestrator.anonymize_document(document, on_event)
 
         # Build response - return even if validation failed
-        return AnonymizeResponse(
-            document_id=request.document_id,
-            anonymized_text=result.anonymizationMapping.anonymized_text,
-            mappings=result.anonymizationMapping.mappings,
-            validation=ValidationResponse(
-                passed=result.validation.passed,
-                issues=validation_issues,
-                reasoning=result.validation.reasoning,
-                confidence=result.validation.confidence
-            ),
-            risk_assessment=RiskAssessmentResponse(
-                overall_score=result.risk_assessment.overall_score,
-                risk_level=result.risk_assessment.risk_level,
-                gdpr_compliant=result.risk_assessment.gdpr_compliant,
-                confidence=result.risk_assessment.confidence,
-                reasoning=result.risk_assessment.reasoning,
-                assessment_date=result.risk_assessment.assessment_date
-            ),
-            iterations=result.iterations,
-            success=result.success,
-            llm_provider=config.llm.provider,
-            llm_model=config.llm.model,
-            error=json.dumps(result.anonymizationMapping.skippedEntites)  # No error on success
-        )
+        return build_response(request, result, config)
 
     except ValueError as e:
         # Parsing/validation error - return 200 OK with success=false and error field
@@ -115,6 +382,10 @@ async def anonymize_document(
             # error=error_detail  # Full error message for UI error box
         )
 
+    except LLMProviderUnavailableError as e:
+        # Every LLM backend is down or its circuit is open - retryable
+        raise HTTPException(status_code=503, detail=f"LLM provider unavailable: {e}")
+
     except Exception as e:
         # Unexpected errors - return as 500
         error_detail = f"Anonymization failed: {str(e)}"
@@ -124,64 +395,249 @@ async def anonymize_document(
 @router.post("/anonymize/batch", response_model=BatchAnonymizeResponse)
 async def batch_anonymize(
     request: BatchAnonymizeRequest,
+    http_request: Request,
+    stream: bool = Query(False, description="Stream results as NDJSON as they complete"),
     orchestrator: AnonymizationOrchestrator = Depends(get_orchestrator),
     config: AppConfig = Depends(get_config)
-) -> BatchAnonymizeResponse:
+):
     """Anonymize multiple documents.
 
+    Documents are processed concurrently, at most
+    orchestration.batch_concurrency at a time; the LLM call scheduler
+    additionally bounds the calls reaching the provider. A failing document
+    does not affect the others.
+
+    With ``?stream=true`` or ``Accept: application/x-ndjson`` the response is
+    NDJSON: one ``result`` line per document as soon as it completes (in
+    completion order, tagged with its input index), then a ``summary`` line.
+    Otherwise all results are returned at once, in input order.
+
     Args:
         request: Batch of documents to anonymize
+        http_request: Raw request (for content negotiation)
+        stream: Whether to stream NDJSON
         orchestrator: Injected orchestrator instance
 
     Returns:
-        BatchAnonymizeResponse with results for all documents
-
-    Raises:
-        HTTPException: If batch processing fails
+        BatchAnonymizeResponse with results for all documents, or a
+        StreamingResponse in NDJSON mode
     """
-    results: List[AnonymizeResponse] = []
-    successful = 0
-    failed = 0
+    if stream or NDJSON_MEDIA_TYPE in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_batch(request.documents, orchestrator, config),
+            media_type=NDJSON_MEDIA_TYPE
+        )
 
-    for doc_request in request.documents:
-        try:
-            # Anonymize each document
-            response = await anonymize_document(doc_request, orchestrator, config)
-            results.append(response)
-            successful += 1
-        except HTTPException as e:
-            # Record failure but continue processing
-            failed += 1
-            # Create error response
-            results.append(
-                AnonymizeResponse(
-                    document_id=doc_request.document_id,
-                    anonymized_text="",
-                    mappings={},
-                    validation=ValidationResponse(
-                        passed=False,
-                        issues=[],
-                        reasoning=f"Error: {e.detail}",
-                        confidence=0.0
-                    ),
-                    risk_assessment=RiskAssessmentResponse(
-                        overall_score=25,
-                        risk_level="CRITICAL",
-                        gdpr_compliant=False,
-                        confidence=0.0,
-                        reasoning=f"Processing failed: {e.detail}",
-                        assessment_date=None  # type: ignore
-                    ),
-                    iterations=0,
-                    success=False,
-                    llm_provider=config.llm.provider,
-                    llm_model=config.llm.model
-                )
-            )
+    results: List[Optional[AnonymizeResponse]] = [None] * len(request.documents)
+    successful = 0
+    async for index, response, ok in _iter_batch_results(request.documents, orchestrator, config):
+        results[index] = response
+        successful += ok
 
-    return BatchAnonymizeResponse(
+    return ModelJSONResponse(BatchAnonymizeResponse.model_construct(
         results=results,
         total=len(request.documents),
         successful=successful,
-        failed=failed
+        failed=len(results) - successful
+    ))
+
+
+async def _stream_batch(
+    documents: Iterable[AnonymizeRequest],
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig
+) -> AsyncIterator[str]:
+    """Yield NDJSON lines for a batch: one per document, then a summary.
+
+    Args:
+        documents: Documents to anonymize
+        orchestrator: Orchestrator instance
+        config: Application configuration
+
+    Yields:
+        Newline-terminated JSON lines
+    """
+    total = 0
+    successful = 0
+    async for index, response, ok in _iter_batch_results(documents, orchestrator, config):
+        total += 1
+        successful += ok
+        yield (
+            f'{{"type":"result","index":{index},"result":{response.model_dump_json()}}}\n'
+        )
+
+    yield dumps({
+        "type": "summary",
+        "total": total,
+        "successful": successful,
+        "failed": total - successful
+    }).decode("utf-8") + "\n"
+
+
+async def _iter_batch_results(
+    documents: Iterable[AnonymizeRequest],
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig
+) -> AsyncIterator[Tuple[int, AnonymizeResponse, bool]]:
+    """Process documents concurrently and yield results as they complete.
+
+    At most orchestration.batch_concurrency documents are in flight; the
+    next document is only started when one finishes, so memory stays flat
+    regardless of batch size. Pending work is cancelled if the consumer
+    stops iterating (e.g. the client disconnects).
+
+    Args:
+        documents: Documents to anonymize
+        orchestrator: Orchestrator instance
+        config: Application configuration
+
+    Yields:
+        Tuples of (input index, response, success flag) in completion order
+    """
+    async def process(index: int, doc_request: AnonymizeRequest) -> Tuple[int, AnonymizeResponse, bool]:
+        response, ok = await process_document(doc_request, orchestrator, config)
+        return index, response, ok
+
+    limit = config.orchestration.batch_concurrency
+    pending: Set[asyncio.Task] = set()
+    try:
+        for index, doc_request in enumerate(documents):
+            if len(pending) >= limit:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.create_task(process(index, doc_request)))
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def process_document(
+    doc_request: AnonymizeRequest,
+    orchestrator: AnonymizationOrchestrator,
+    config: AppConfig
+) -> Tuple[AnonymizeResponse, bool]:
+    """Anonymize one document of a batch or job, never raising.
+
+    Args:
+        doc_request: Document to anonymize
+        orchestrator: Orchestrator instance
+        config: Application configuration
+
+    Returns:
+        Tuple of (response, success flag); failures are recorded in the
+        response instead of being raised
+    """
+    try:
+        response = await _anonymize(doc_request, orchestrator, config)
+        return response, True
+    except HTTPException as e:
+        # Record failure but continue processing
+        return failed_response(doc_request.document_id, str(e.detail), config), False
+    except Exception as e:
+        return failed_response(
+            doc_request.document_id, f"Anonymization failed: {e}", config), False
+
+
+def build_response(
+    request: AnonymizeRequest,
+    result: AnonymizationResult,
+    config: AppConfig
+) -> AnonymizeResponse:
+    """Build the API response of a finished workflow.
+
+    The domain objects were validated when they were created, so the
+    response models are assembled with model_construct and not validated
+    a second time.
+
+    Args:
+        request: Document request
+        result: Orchestrator result
+        config: Application configuration
+
+    Returns:
+        AnonymizeResponse with anonymized text and analysis
+    """
+    validation = result.validation
+    risk = result.risk_assessment
+
+    return AnonymizeResponse.model_construct(
+        document_id=request.document_id,
+        anonymized_text=result.anonymizationMapping.anonymized_text,
+        mappings=result.anonymizationMapping.mappings,
+        validation=ValidationResponse.model_construct(
+            passed=validation.passed,
+            issues=[
+                ValidationIssueResponse.model_construct(
+                    identifier_type=issue.identifier_type,
+                    value=issue.value,
+                    context=issue.context,
+                    location_hint=issue.location_hint
+                )
+                for issue in validation.issues
+            ],
+            reasoning=validation.reasoning,
+            confidence=validation.confidence
+        ),
+        risk_assessment=RiskAssessmentResponse.model_construct(
+            overall_score=risk.overall_score,
+            risk_level=risk.risk_level,
+            gdpr_compliant=risk.gdpr_compliant,
+            confidence=risk.confidence,
+            reasoning=risk.reasoning,
+            assessment_date=risk.assessment_date,
+            dimension_scores=risk.dimension_scores
+        ),
+        iterations=result.iterations,
+        success=result.success,
+        llm_provider=config.llm.provider,
+        llm_model=config.llm.model,
+        error=json.dumps(result.anonymizationMapping.skippedEntites),  # No error on success
+        usage=UsageResponse.model_validate(result.usage) if result.usage is not None else None
+    )
+
+
+def failed_response(
+    document_id: Optional[str],
+    reason: str,
+    config: AppConfig
+) -> AnonymizeResponse:
+    """Build the response recorded for a document that could not be processed.
+
+    Args:
+        document_id: Identifier of the document that failed
+        reason: Error description
+        config: Application configuration
+
+    Returns:
+        AnonymizeResponse with success=false
+    """
+    return AnonymizeResponse(
+        document_id=document_id,
+        anonymized_text="",
+        mappings={},
+        validation=ValidationResponse(
+            passed=False,
+            issues=[],
+            reasoning=f"Error: {reason}",
+            confidence=0.0
+        ),
+        risk_assessment=RiskAssessmentResponse(
+            overall_score=25,
+            risk_level="CRITICAL",
+            gdpr_compliant=False,
+            confidence=0.0,
+            reasoning=f"Processing failed: {reason}",
+            assessment_date=datetime.now(UTC)
+        ),
+        iterations=0,
+        success=False,
+        llm_provider=config.llm.provider,
+        llm_model=config.llm.model,
+        error=reason
     )
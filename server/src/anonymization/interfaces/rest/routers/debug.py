@@ -0,0 +1,82 @@
+"""Admin debugging router (on-demand profiling)."""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from ..profiling import ProfilerBusyError, ProfilingService
+
+router = APIRouter(prefix="/api/v1/debug", tags=["debug"])
+
+
+def _require_admin(request: Request) -> ProfilingService:
+    """Profiling service of an authenticated admin request.
+
+    Raises:
+        HTTPException: 404 if profiling is disabled, 403 if no admin token is
+            configured, 401 if the request's token is missing or wrong
+    """
+    service: Optional[ProfilingService] = getattr(request.app.state, "profiling", None)
+    if service is None:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    if service.admin_token is None:
+        raise HTTPException(status_code=403, detail="No admin token is configured")
+    if not service.is_admin(request.headers.get(service.config.admin_token_header)):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+    return service
+
+
+@router.get("/profile")
+async def sample_profile(
+    request: Request,
+    seconds: float = Query(default=30.0, gt=0, description="Sampling duration"),
+    format: str = Query(default="collapsed", pattern="^(collapsed|speedscope)$"),
+    interval_ms: Optional[float] = Query(default=None, ge=1, description="Time between samples")
+):
+    """
+    Sample the server's stacks over live traffic.
+
+    Blocks for the sampling duration (capped at profiling.max_seconds)
+    while a background thread records the Python stacks of every thread.
+    The result is returned as collapsed stacks (one ``thread;frames count``
+    line per stack, for flamegraph.pl or speedscope) or as a speedscope
+    JSON file.
+
+    Returns:
+        Collapsed stacks as text, or a speedscope document
+
+    Raises:
+        HTTPException: 401/403/404 as for all debug endpoints, 409 if a
+            sampling profile is already running
+    """
+    service = _require_admin(request)
+    try:
+        sampler = await service.sample(seconds, interval_ms)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    headers = {"X-Profile-Samples": str(sampler.samples)}
+    if format == "speedscope":
+        headers["Content-Disposition"] = 'attachment; filename="profile.speedscope.json"'
+        return JSONResponse(sampler.speedscope(name=f"{seconds:g}s sample"), headers=headers)
+    return PlainTextResponse(sampler.collapsed(), headers=headers)
+
+
+@router.get("/profiles/{profile_id}")
+async def get_request_profile(profile_id: str, request: Request) -> Dict[str, Any]:
+    """
+    cProfile summary of a request sent with the profile header.
+
+    Returns:
+        Method, path, status code, duration and the pstats summary
+
+    Raises:
+        HTTPException: 401/403/404 as for all debug endpoints, 404 if the
+            profile is unknown or was evicted
+    """
+    service = _require_admin(request)
+    profile = service.get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    return profile
@@ -1,10 +1,11 @@
 """Health check router."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from datetime import datetime, timezone
 from typing import Dict, Any
 
 from ..dependencies import get_config
+from ..lifecycle import warmup_state
 from ..schemas import HealthResponse
 from ....application.config import AppConfig
 
@@ -30,14 +31,21 @@ async def health_check(config: AppConfig = Depends(get_config)) -> HealthRespons
 
 
 @router.get("/health/ready")
-async def readiness_check(config: AppConfig = Depends(get_config)) -> Dict[str, Any]:
+async def readiness_check(
+    request: Request,
+    response: Response,
+    config: AppConfig = Depends(get_config)
+) -> Dict[str, Any]:
     """
     Readiness check - readiness probe.
 
-    Returns 200 if service is ready to accept traffic.
+    Returns 200 if service is ready to accept traffic, 503 otherwise.
     Checks:
     - Configuration loaded
     - LLM provider configured
+    - Startup warm-up finished
+    - LLM provider healthy, from the cached result of the background
+      probe (the provider is not contacted by this handler)
 
     Used by Kubernetes readiness probe.
 
@@ -49,11 +57,37 @@ async def readiness_check(config: AppConfig = Depends(get_config)) -> Dict[str,
         "llm_provider": config.llm.provider,
         "dependencies": {
             "llm_provider": config.llm.provider
+        },
+        "warmup": {
+            "complete": warmup_state.ready,
+            "duration_seconds": warmup_state.duration_seconds,
+            "error": warmup_state.error
         }
     }
 
+    # Shedding load is not unreadiness: report it without failing the probe
+    admission = getattr(request.app.state, "admission_controller", None)
+    if admission is not None:
+        details["admission"] = admission.stats()
+    loop_monitor = getattr(request.app.state, "event_loop_monitor", None)
+    if loop_monitor is not None:
+        details["event_loop"] = loop_monitor.stats()
+
+    ready = warmup_state.ready
+    status = "ready" if ready else "warming_up"
+    llm_health = getattr(request.app.state, "llm_health", None)
+    if llm_health is not None:
+        details["llm"] = llm_health.stats()
+        # Unknown until the first probe finished
+        if ready and llm_health.healthy is not True:
+            ready = False
+            status = "warming_up" if llm_health.healthy is None else "llm_unavailable"
+
+    if not ready:
+        response.status_code = 503
+
     return {
-        "status": "ready",
+        "status": status,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "version": "0.5.0",
         "details": details
@@ -0,0 +1,243 @@
+"""Asynchronous job API router."""
+
+from typing import Any, Dict, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import ValidationError
+
+from ..dependencies import get_config, get_job_store, get_orchestrator
+from ..schemas import (
+    AnonymizeRequest,
+    AnonymizeResponse,
+    BatchAnonymizeRequest,
+    JobResponse,
+    JobResultItem,
+    JobResultsResponse
+)
+from .anonymization import failed_response, process_document
+from ....application.config import AppConfig
+from ....application.tenancy import current_tenant
+from ....domain.models import Job, JobItem
+from ....domain.ports import IJobStore
+
+
+def require_jobs_enabled(config: AppConfig = Depends(get_config)) -> None:
+    """Reject job requests on instances that do not serve jobs.
+
+    Raises:
+        HTTPException: 503 if jobs are disabled in the configuration
+    """
+    if not config.jobs.enabled:
+        raise HTTPException(status_code=503, detail="Jobs are not served by this instance")
+
+
+router = APIRouter(
+    prefix="/api/v1", tags=["jobs"], dependencies=[Depends(require_jobs_enabled)])
+
+MAX_RESULTS_PAGE_SIZE = 1000
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(
+    request: BatchAnonymizeRequest,
+    http_request: Request,
+    store: IJobStore = Depends(get_job_store)
+) -> JobResponse:
+    """Queue a batch of documents for background anonymization.
+
+    The documents are written to the durable job queue and processed by
+    the job workers; poll GET /api/v1/jobs/{job_id} for progress.
+
+    Args:
+        request: Batch of documents to anonymize
+        http_request: Raw request (to wake the job workers)
+        store: Injected job store
+
+    Returns:
+        JobResponse of the created job (202 Accepted)
+    """
+    job = await store.create_job(
+        [(doc.document_id, doc.text) for doc in request.documents],
+        tenant_id=current_tenant()
+    )
+
+    runner = getattr(http_request.app.state, "job_runner", None)
+    if runner is not None:
+        runner.notify()
+
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    store: IJobStore = Depends(get_job_store)
+) -> JobResponse:
+    """Get status and progress of a job.
+
+    Args:
+        job_id: Job identifier
+        store: Injected job store
+
+    Returns:
+        JobResponse with progress counters
+
+    Raises:
+        HTTPException: 404 if the job does not exist or belongs to another tenant
+    """
+    job = await _get_own_job(store, job_id)
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/results", response_model=JobResultsResponse)
+async def get_job_results(
+    job_id: str,
+    cursor: int = Query(0, ge=0, description="Smallest document index to return"),
+    limit: int = Query(100, ge=1, le=MAX_RESULTS_PAGE_SIZE, description="Page size"),
+    store: IJobStore = Depends(get_job_store)
+) -> JobResultsResponse:
+    """Get a page of the documents of a job, in document order.
+
+    Pages cover every document index, so none is skipped when documents
+    finish out of order. Each document has its status; its result is set
+    once it is finished. While the job runs, re-request unfinished
+    documents from their index.
+
+    Args:
+        job_id: Job identifier
+        cursor: Smallest document index to return
+        limit: Maximum number of results
+        store: Injected job store
+
+    Returns:
+        JobResultsResponse with the page and the cursor of the next page
+
+    Raises:
+        HTTPException: 404 if the job does not exist or belongs to another tenant
+    """
+    job = await _get_own_job(store, job_id)
+
+    items = await store.get_results(job_id, cursor, limit)
+    next_cursor = (
+        items[-1].index + 1 if items and items[-1].index + 1 < job.total else None)
+
+    return JobResultsResponse(
+        job_id=job_id,
+        results=[
+            JobResultItem(
+                index=item.index,
+                document_id=item.document_id,
+                status=item.status,
+                result=_stored_response(item) if item.result is not None else None
+            )
+            for item in items
+        ],
+        next_cursor=next_cursor
+    )
+
+
+@router.delete("/jobs/{job_id}", status_code=204, response_class=Response)
+async def delete_job(
+    job_id: str,
+    store: IJobStore = Depends(get_job_store)
+) -> Response:
+    """Delete a job with its documents and results.
+
+    Results hold the mappings of original personal data; delete a job once
+    its results were fetched rather than waiting for jobs.retention_seconds.
+    Documents of the job that are being processed finish, but their
+    results are discarded.
+
+    Args:
+        job_id: Job identifier
+        store: Injected job store
+
+    Returns:
+        Empty 204 response
+
+    Raises:
+        HTTPException: 404 if the job does not exist or belongs to another tenant
+    """
+    await _get_own_job(store, job_id)
+    await store.delete_job(job_id)
+    return Response(status_code=204)
+
+
+async def _get_own_job(store: IJobStore, job_id: str) -> Job:
+    """Load a job of the calling tenant.
+
+    Jobs of other tenants are reported as missing rather than forbidden,
+    so job identifiers cannot be probed across tenants.
+
+    Raises:
+        HTTPException: 404 if the job does not exist or belongs to another tenant
+    """
+    job = await store.get_job(job_id)
+    if job is None or job.tenant_id != current_tenant():
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+async def process_job_item(item: JobItem) -> Tuple[Dict[str, Any], bool]:
+    """Anonymize one queued job document (job worker handler).
+
+    Args:
+        item: Claimed job document
+
+    Returns:
+        Tuple of (serialized AnonymizeResponse, success flag)
+    """
+    response, ok = await process_document(
+        AnonymizeRequest(text=item.text, document_id=item.document_id),
+        get_orchestrator(),
+        get_config()
+    )
+    return response.model_dump(mode="json"), ok
+
+
+def failed_job_result(item: JobItem, error: Exception) -> Dict[str, Any]:
+    """Result stored for a job document whose processing raised (job worker error handler).
+
+    Args:
+        item: Claimed job document
+        error: Exception raised while processing it
+
+    Returns:
+        Serialized AnonymizeResponse with success=false
+    """
+    return failed_response(
+        item.document_id, f"Anonymization failed: {error}", get_config()
+    ).model_dump(mode="json")
+
+
+def _stored_response(item: JobItem) -> AnonymizeResponse:
+    """Rebuild the response of a finished job document.
+
+    Results that are not a valid AnonymizeResponse (such as ``{"error":
+    ...}`` records written by older versions) are reported as failed.
+    """
+    try:
+        return AnonymizeResponse.model_validate(item.result)
+    except ValidationError:
+        reason = (item.result or {}).get("error") or "Stored result is not readable"
+        return failed_response(item.document_id, reason, get_config())
+
+
+def _job_response(job: Job) -> JobResponse:
+    """Convert a job entity into its API representation.
+
+    Args:
+        job: Job entity
+
+    Returns:
+        JobResponse
+    """
+    return JobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        total=job.total,
+        completed=job.completed,
+        failed=job.failed,
+        progress=round(job.progress, 4),
+        created_at=job.created_at,
+        updated_at=job.updated_at
+    )
@@ -0,0 +1,33 @@
+"""Prometheus metrics router."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from ..dependencies import get_config
+from ....application.config import AppConfig
+from ....application.metrics import REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(config: AppConfig = Depends(get_config)) -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint.
+
+    Exposes latency histograms (HTTP requests, documents, agents, LLM
+    calls), counters (iterations, parse retries, validation failures,
+    skipped entities, cache lookups, provider errors, tokens) and gauges
+    (in-flight requests and LLM calls, LLM queue depth).
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+
+    Raises:
+        HTTPException: 404 if metrics are disabled
+    """
+    if not config.metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -4,12 +4,16 @@ from .requests import AnonymizeRequest, BatchAnonymizeRequest
 from .responses import (
     AnonymizeResponse,
     BatchAnonymizeResponse,
+    JobResponse,
+    JobResultItem,
+    JobResultsResponse,
     HealthResponse,
     ConfigResponse,
     ErrorResponse,
     ValidationIssueResponse,
     ValidationResponse,
-    RiskAssessmentResponse
+    RiskAssessmentResponse,
+    UsageResponse
 )
 
 __all__ = [
@@ -17,10 +21,14 @@ __all__ = [
     "BatchAnonymizeRequest",
     "AnonymizeResponse",
     "BatchAnonymizeResponse",
+    "JobResponse",
+    "JobResultItem",
+    "JobResultsResponse",
     "HealthResponse",
     "ConfigResponse",
     "ErrorResponse",
     "ValidationIssueResponse",
     "ValidationResponse",
     "RiskAssessmentResponse",
+    "UsageResponse",
 ]
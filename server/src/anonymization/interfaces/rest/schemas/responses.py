@@ -29,6 +29,35 @@ class RiskAssessmentResponse(BaseModel):
     confidence: float
     reasoning: str
     assessment_date: datetime
+    dimension_scores: Dict[str, int] = Field(default_factory=dict)
+
+
+class LLMUsageTotalsResponse(BaseModel):
+    """Summed LLM usage of a group of calls."""
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    latency_ms: float
+    avg_time_to_first_token_ms: Optional[float] = None
+
+
+class LLMCallUsageResponse(BaseModel):
+    """Usage of one LLM call."""
+    model: str
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    latency_ms: float
+    time_to_first_token_ms: Optional[float] = None
+    agent: Optional[str] = None
+    iteration: Optional[int] = None
+
+
+class UsageResponse(BaseModel):
+    """LLM usage of a request: totals, per agent, per iteration and per call."""
+    totals: LLMUsageTotalsResponse
+    by_agent: Dict[str, LLMUsageTotalsResponse] = Field(default_factory=dict)
+    by_iteration: Dict[int, LLMUsageTotalsResponse] = Field(default_factory=dict)
+    calls: List[LLMCallUsageResponse] = Field(default_factory=list)
 
 
 class AnonymizeResponse(BaseModel):
@@ -65,6 +94,14 @@ class AnonymizeResponse(BaseModel):
         default="",
         description="Error message if success=false, shown in UI error box"
     )
+    timings: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Milliseconds spent per stage, summed over retries (with ?timings=true)"
+    )
+    usage: Optional[UsageResponse] = Field(
+        default=None,
+        description="LLM tokens and latency of this document (no calls for cached results)"
+    )
 
 
 class BatchAnonymizeResponse(BaseModel):
@@ -85,6 +122,61 @@ class BatchAnonymizeResponse(BaseModel):
     failed: int = Field(description="Number of failed anonymizations")
 
 
+class JobResponse(BaseModel):
+    """Status and progress of an asynchronous job.
+
+    Example:
+        {
+            "job_id": "4f1c...",
+            "status": "running",
+            "total": 10000,
+            "completed": 2500,
+            "failed": 3,
+            "progress": 0.2503,
+            ...
+        }
+    """
+
+    job_id: str = Field(description="Job identifier")
+    status: str = Field(description="Job status (pending|running|completed)")
+    total: int = Field(description="Number of documents in the job")
+    completed: int = Field(description="Documents processed successfully")
+    failed: int = Field(description="Documents whose processing failed")
+    progress: float = Field(description="Fraction of documents processed (0.0-1.0)")
+    created_at: datetime = Field(description="UTC timestamp of job creation")
+    updated_at: datetime = Field(description="UTC timestamp of last progress update")
+
+
+class JobResultItem(BaseModel):
+    """Status and, once finished, result of one document of a job."""
+
+    index: int = Field(description="Position of the document in the job")
+    document_id: Optional[str] = Field(default=None, description="Document identifier")
+    status: str = Field(description="pending, running, done or failed")
+    result: Optional[AnonymizeResponse] = Field(
+        default=None,
+        description="Anonymization result (null until the document is finished)"
+    )
+
+
+class JobResultsResponse(BaseModel):
+    """Page of job documents.
+
+    Every document index is listed, in order, with its status; results
+    are set for finished documents. Pass next_cursor as the cursor of the
+    following request; it is null on the page holding the last document.
+    Documents still pending or running are fetched again later by
+    requesting from their index.
+    """
+
+    job_id: str = Field(description="Job identifier")
+    results: List[JobResultItem] = Field(description="Documents of this page")
+    next_cursor: Optional[int] = Field(
+        default=None,
+        description="Cursor for the next page (null if this page ends the job)"
+    )
+
+
 class HealthResponse(BaseModel):
     """Health check response.
 
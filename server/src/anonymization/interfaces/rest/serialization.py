@@ -0,0 +1,56 @@
+"""Low-overhead JSON serialization for API responses."""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - "speedups" extra not installed
+    orjson = None
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize plain JSON data, using orjson when it is installed.
+
+    orjson comes with the "speedups" extra, which the container image
+    installs; without it the standard library encoder is used.
+
+    Args:
+        data: JSON-serializable data (dicts, lists, scalars)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response that serializes pydantic models directly.
+
+    Returning a Response from an endpoint makes FastAPI skip its own
+    response_model validation and jsonable_encoder pass; the model is
+    serialized once by pydantic's compiled serializer instead. Plain data
+    goes through ``dumps``. Endpoints keep ``response_model`` for the
+    OpenAPI schema.
+
+    Example:
+        >>> return ModelJSONResponse(AnonymizeResponse.model_construct(...))
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content.
+
+        Args:
+            content: Pydantic model or plain JSON data
+
+        Returns:
+            UTF-8 encoded JSON body
+        """
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return dumps(content)
@@ -0,0 +1,106 @@
+"""Tenant identification for API requests."""
+
+import re
+from typing import Dict, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .serialization import ModelJSONResponse
+from ...application.config import TenancyConfig
+from ...application.tenancy import DEFAULT_TENANT, tenant_scope
+
+_TENANT_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+class TenantResolver:
+    """Maps request headers to a tenant.
+
+    A known API key wins; otherwise the tenant header is used, and
+    requests without either belong to the default tenant. The header only
+    names tenants that have no API key: a tenant owning a key must present
+    it, so the header cannot be used to act as (or read the jobs of) a
+    keyed tenant.
+
+    Example:
+        >>> resolver = TenantResolver(config.tenancy)
+        >>> tenant, error = resolver.resolve({"x-tenant-id": "team-a"})
+    """
+
+    def __init__(self, config: TenancyConfig) -> None:
+        """Initialize the resolver.
+
+        Args:
+            config: Tenancy configuration
+        """
+        self.header = config.header.lower()
+        self.api_key_header = config.api_key_header.lower()
+        self.api_keys = dict(config.api_keys)
+        self.keyed_tenants = set(config.api_keys.values())
+        self.known_tenants = set(config.tenants) | set(config.api_keys.values()) | {DEFAULT_TENANT}
+        self.allow_unknown_tenants = config.allow_unknown_tenants
+
+    def resolve(self, headers: Dict[str, str]) -> Tuple[Optional[str], Optional[Tuple[int, str]]]:
+        """Determine the tenant of a request.
+
+        Args:
+            headers: Request headers with lower-case names
+
+        Returns:
+            Tuple of (tenant, None) or (None, (status code, error message))
+        """
+        api_key = headers.get(self.api_key_header)
+        if api_key is not None:
+            tenant = self.api_keys.get(api_key)
+            if tenant is None:
+                return None, (401, "Invalid API key")
+            return tenant, None
+
+        tenant = headers.get(self.header)
+        if tenant is None:
+            tenant = DEFAULT_TENANT
+        elif not _TENANT_PATTERN.match(tenant):
+            return None, (400, f"Invalid tenant identifier in {self.header}")
+        if tenant in self.keyed_tenants:
+            return None, (401, f"Tenant {tenant} requires an API key")
+        if not self.allow_unknown_tenants and tenant not in self.known_tenants:
+            return None, (403, f"Unknown tenant: {tenant}")
+        return tenant, None
+
+
+class TenantMiddleware:
+    """ASGI middleware running each API request on behalf of its tenant.
+
+    The resolver is read from ``app.state.tenant_resolver`` (set by the
+    lifespan handler); without one, requests run as the default tenant.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/") -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            path_prefix: Paths whose requests are attributed to tenants
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Resolve the tenant and run the request in its scope."""
+        resolver: Optional[TenantResolver] = getattr(
+            scope["app"].state, "tenant_resolver", None) if scope["type"] == "http" else None
+        if resolver is None or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+        tenant, error = resolver.resolve(headers)
+        if error is not None:
+            status_code, detail = error
+            await ModelJSONResponse({"detail": detail}, status_code=status_code)(scope, receive, send)
+            return
+
+        with tenant_scope(tenant):
+            await self.app(scope, receive, send)
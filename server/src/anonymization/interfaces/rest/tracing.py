@@ -0,0 +1,78 @@
+"""Per-request tracing and the Server-Timing header."""
+
+from typing import Dict
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...application.tracing import DEFAULT_MAX_SPANS, trace_scope
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a trace for every API request.
+
+    Stage spans recorded while the request runs (orchestrator iterations,
+    agents, parsing, replacements, LLM queueing and round trips) are
+    summed per stage into a ``Server-Timing`` header, which browsers show
+    in their network panel. The header reflects the stages finished when
+    the response starts, so streamed responses report only what ran
+    before their first byte. Finished traces go to the exporter in
+    ``app.state.trace_exporter``, if one is configured. A trace keeps at
+    most ``app.state.trace_max_spans`` spans, so uploads and streams of
+    any size trace in bounded memory.
+
+    Tracing is skipped when the lifespan set ``app.state.tracing_enabled``
+    to False.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/") -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            path_prefix: Paths that are traced
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Trace a request."""
+        state = scope["app"].state
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith(self.path_prefix)
+            or not getattr(state, "tracing_enabled", True)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        with trace_scope(
+            f"{scope['method']} {scope['path']}",
+            max_spans=getattr(state, "trace_max_spans", DEFAULT_MAX_SPANS),
+            **{"http.method": scope["method"], "http.target": scope["path"]}
+        ) as trace:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    trace.root.attributes["http.status_code"] = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(trace.timings()))
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        exporter = getattr(state, "trace_exporter", None)
+        if exporter is not None:
+            await exporter.export(trace)
+
+
+def server_timing(timings: Dict[str, float]) -> str:
+    """Format stage timings as a Server-Timing header value.
+
+    Args:
+        timings: Stage name to milliseconds
+
+    Returns:
+        Header value such as ``agent1;dur=812.4, total;dur=1203.9``
+    """
+    return ", ".join(f"{name};dur={ms:.1f}" for name, ms in timings.items())
@@ -0,0 +1,654 @@
+#!/usr/bin/env python3
+"""Tests for the REST API endpoints.
+
+Tests:
+1. Batch endpoint processes documents concurrently, in input order
+2. Batch endpoint isolates per-document failures
+3. Batch endpoint streams NDJSON results followed by a summary
+4. Job endpoints create jobs and report progress; instances without jobs answer 503
+5. SSE endpoint streams per-stage progress events
+6. Upload endpoint anonymizes CSV and JSONL files in input order
+7. Admission control rejects excess requests with 429, Retry-After and CORS
+   headers, and counts the rejections in /metrics
+8. Metrics endpoint exposes request, agent and pipeline metrics
+9. Stage timings are returned in Server-Timing and on request in the body;
+   a large upload keeps a bounded number of spans
+10. Debug profiling endpoints require the admin token; X-Profile stores a request profile
+11. Readiness reports the cached LLM probe and fails while the provider is unhealthy
+12. Readiness stays 503 until warm-up finished; a failed warm-up is reported
+13. Job documents whose processing raised page as failed responses
+14. The tenant header cannot act as a tenant that owns an API key
+15. Constructed responses serialize to the same JSON as validated ones
+"""
+
+import asyncio
+import json
+from datetime import datetime, UTC
+
+import httpx
+import pytest
+
+# Import the application
+import sys
+sys.path.insert(0, 'src')
+sys.path.insert(0, 'benchmarks')
+
+from bench_serialization import legacy_path, make_result
+from fastapi.utils import create_response_field
+
+from anonymization.application.config import (
+    AppConfig,
+    LLMConfig,
+    AgentConfig,
+    OrchestrationConfig,
+    ProfilingConfig,
+    TenancyConfig
+)
+from anonymization.application.llm_health import LLMHealthMonitor
+from anonymization.application.metrics import ADMISSION_REJECTIONS
+from anonymization.application.orchestrator import AnonymizationOrchestrator
+from anonymization.domain.models import (
+    AnonymizationMapping,
+    RiskAssessment,
+    ValidationResult
+)
+from anonymization.infrastructure.persistence import SQLiteJobStore
+from anonymization.interfaces.rest.admission import AdmissionController
+from anonymization.interfaces.rest.dependencies import (
+    get_config,
+    get_job_store,
+    get_orchestrator
+)
+from anonymization.interfaces.rest import lifecycle
+from anonymization.interfaces.rest.lifecycle import warm_up, warmup_state
+from anonymization.interfaces.rest.main import app
+from anonymization.interfaces.rest.profiling import ProfilingService
+from anonymization.interfaces.rest import serialization
+from anonymization.interfaces.rest.routers.anonymization import build_response
+from anonymization.interfaces.rest.routers.jobs import failed_job_result
+from anonymization.interfaces.rest.schemas import AnonymizeRequest, AnonymizeResponse
+from anonymization.interfaces.rest.serialization import ModelJSONResponse
+from anonymization.interfaces.rest.tenancy import TenantResolver
+
+
+class SlowAgents:
+    """Agents that sleep per call and fail on documents containing 'FAIL'."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def anonymize(self, text: str) -> AnonymizationMapping:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if "FAIL" in text:
+            raise RuntimeError("backend exploded")
+        return AnonymizationMapping(
+            original_text=text,
+            anonymized_text=text.replace("John", "[NAME_1]"),
+            mappings={"John": "[NAME_1]"}
+        )
+
+    async def validate(self, anonymized_text: str) -> ValidationResult:
+        return ValidationResult(passed=True, reasoning="ok", confidence=1.0)
+
+    async def assess_risk(self, anonymized_text, mappings) -> RiskAssessment:
+        return RiskAssessment(
+            overall_score=5,
+            risk_level="NEGLIGIBLE",
+            gdpr_compliant=True,
+            confidence=1.0,
+            reasoning="ok",
+            assessment_date=datetime.now(UTC)
+        )
+
+
+def make_config(batch_concurrency: int = 4) -> AppConfig:
+    """Build a minimal configuration."""
+    return AppConfig(
+        llm=LLMConfig(provider="ollama", model="test-model"),
+        agent1=AgentConfig(name="ANON-EXEC"),
+        agent2=AgentConfig(name="DIRECT-CHECK"),
+        agent3=AgentConfig(name="RISK-ASSESS"),
+        orchestration=OrchestrationConfig(batch_concurrency=batch_concurrency)
+    )
+
+
+@pytest.fixture
+def agents():
+    """Install slow fake agents into the application."""
+    fake = SlowAgents()
+    app.dependency_overrides[get_config] = lambda: make_config(batch_concurrency=4)
+    app.dependency_overrides[get_orchestrator] = lambda: AnonymizationOrchestrator(
+        fake, fake, fake)
+    yield fake
+    app.dependency_overrides.clear()
+
+
+def client() -> httpx.AsyncClient:
+    """Create an in-process client for the application."""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestBatchEndpoint:
+    """Test /api/v1/anonymize/batch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_in_order(self, agents):
+        """Documents run concurrently up to the limit and keep input order."""
+        documents = [{"text": f"John {i}", "document_id": f"d{i}"} for i in range(8)]
+
+        async with client() as c:
+            response = await c.post("/api/v1/anonymize/batch", json={"documents": documents})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert [r["document_id"] for r in body["results"]] == [f"d{i}" for i in range(8)]
+        assert body["successful"] == 8
+        assert agents.max_running == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated(self, agents):
+        """A failing document is reported without affecting the others."""
+        documents = [
+            {"text": "John ok", "document_id": "ok"},
+            {"text": "John FAIL", "document_id": "bad"},
+        ]
+
+        async with client() as c:
+            response = await c.post("/api/v1/anonymize/batch", json={"documents": documents})
+
+        body = response.json()
+        assert body["successful"] == 1
+        assert body["failed"] == 1
+        assert body["results"][0]["success"] is True
+        assert body["results"][1]["success"] is False
+        assert "backend exploded" in body["results"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_stream(self, agents):
+        """NDJSON mode emits one line per document and a trailing summary."""
+        documents = [{"text": f"John {i}", "document_id": f"d{i}"} for i in range(5)]
+        documents[2]["text"] = "John FAIL"
+
+        async with client() as c:
+            response = await c.post(
+                "/api/v1/anonymize/batch",
+                json={"documents": documents},
+                headers={"Accept": "application/x-ndjson"}
+            )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert len(lines) == 6
+        assert sorted(line["index"] for line in lines[:-1]) == list(range(5))
+        assert lines[-1] == {"type": "summary", "total": 5, "successful": 4, "failed": 1}
+
+
+class TestStreamEndpoint:
+    """Test /api/v1/anonymize/stream."""
+
+    @pytest.mark.asyncio
+    async def test_stage_events(self, agents):
+        """Each stage is emitted as an event, followed by the full result."""
+        async with client() as c:
+            response = await c.post("/api/v1/anonymize/stream", json={"text": "Hi John"})
+
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        events = [
+            (frame.split("\n")[0][len("event: "):], json.loads(frame.split("\n")[1][len("data: "):]))
+            for frame in frames
+        ]
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [name for name, _ in events] == [
+            "entities", "anonymized_text", "validation", "risk_assessment", "result"
+        ]
+        assert events[0][1]["mappings"] == {"John": "[NAME_1]"}
+        assert events[1][1] == {"iteration": 1, "anonymized_text": "Hi [NAME_1]"}
+        assert events[-1][1]["success"] is True
+
+
+class TestUploadEndpoint:
+    """Test /api/v1/anonymize/upload."""
+
+    @pytest.mark.asyncio
+    async def test_csv_upload(self, agents):
+        """CSV rows come back in order with the text column anonymized."""
+        body = 'id,text\n1,"John\nwrote"\n2,\n3,Hi John\n'
+
+        async with client() as c:
+            response = await c.post(
+                "/api/v1/anonymize/upload?id_field=id",
+                content=body,
+                headers={"Content-Type": "text/csv"}
+            )
+
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.text == (
+            "id,text,anonymization_success,risk_level\n"
+            '1,"[NAME_1]\nwrote",true,NEGLIGIBLE\n'
+            "2,,,\n"
+            "3,Hi [NAME_1],true,NEGLIGIBLE\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_multipart_jsonl_upload(self, agents):
+        """A JSONL file sent as multipart is detected by its file name."""
+        lines = "\n".join(json.dumps({"text": f"John {i}", "n": i}) for i in range(6))
+
+        async with client() as c:
+            response = await c.post(
+                "/api/v1/anonymize/upload",
+                files={"file": ("export.jsonl", lines.encode(), "application/octet-stream")}
+            )
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [record["n"] for record in records] == list(range(6))
+        assert records[0]["text"] == "[NAME_1] 0"
+        assert records[0]["anonymization"]["success"] is True
+
+
+class TestAdmissionControl:
+    """Test load shedding on LLM-bound routes."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self, agents):
+        """Requests beyond max_in_flight get 429 with a Retry-After hint."""
+        controller = AdmissionController(max_in_flight=2, retry_after_min_seconds=1)
+        app.state.admission_controller = controller
+        rejections = ADMISSION_REJECTIONS.value(reason="in_flight")
+        try:
+            async with client() as c:
+                responses = await asyncio.gather(*(
+                    c.post("/api/v1/anonymize", json={"text": f"John {i}"},
+                           headers={"Origin": "https://ui.example"})
+                    for i in range(4)
+                ))
+                health = await c.get("/health")
+                metrics_text = (await c.get("/metrics")).text
+        finally:
+            del app.state.admission_controller
+
+        codes = sorted(r.status_code for r in responses)
+        assert codes == [200, 200, 429, 429]
+        rejected = next(r for r in responses if r.status_code == 429)
+        assert int(rejected.headers["Retry-After"]) >= 1
+        # CORS wraps admission, so a cross-origin UI can read the 429
+        assert rejected.headers["access-control-allow-origin"] == "*"
+        assert health.status_code == 200
+        assert controller.stats()["rejected_in_flight"] == 2
+        assert ADMISSION_REJECTIONS.value(reason="in_flight") == rejections + 2
+        assert any(
+            line.startswith('anonymizer_admission_rejections_total{reason="in_flight"} ')
+            for line in metrics_text.splitlines()
+        )
+        assert controller.in_flight == 0
+
+    def test_retry_after_tracks_backlog(self):
+        """Retry-After grows with the backlog and the average duration."""
+        controller = AdmissionController(
+            max_in_flight=1, max_queue_depth=2, queue_depth_probe=lambda: 12)
+        controller.in_flight = 1
+        controller.release(1.0)
+
+        admitted, retry_after = controller.try_acquire()
+        assert admitted is False
+        assert retry_after == 10
+        assert controller.rejected_queue_depth == 1
+
+
+class TestMetricsEndpoint:
+    """Test /metrics."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_metrics(self, agents):
+        """A processed request shows up in the HTTP and agent histograms."""
+        async with client() as c:
+            await c.post("/api/v1/anonymize", json={"text": "Hi John"})
+            response = await c.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        lines = response.text.splitlines()
+        assert "# TYPE anonymizer_http_request_duration_seconds histogram" in lines
+        assert any(
+            line.startswith('anonymizer_http_request_duration_seconds_count'
+                            '{route="/api/v1/anonymize",method="POST",status="200"}')
+            for line in lines
+        )
+        for agent in ("agent1", "agent2", "agent3"):
+            assert any(
+                line.startswith(f'anonymizer_agent_duration_seconds_count{{agent="{agent}"}}')
+                for line in lines
+            )
+        assert any(line.startswith("anonymizer_orchestrator_iterations_total ") for line in lines)
+
+
+class TestTracing:
+    """Test per-request stage timings."""
+
+    @pytest.mark.asyncio
+    async def test_server_timing(self, agents):
+        """Every API response has Server-Timing; ?timings=true adds the body field."""
+        async with client() as c:
+            plain = await c.post("/api/v1/anonymize", json={"text": "Hi John"})
+            timed = await c.post("/api/v1/anonymize?timings=true", json={"text": "Hi John"})
+
+        stages = [entry.split(";")[0] for entry in plain.headers["server-timing"].split(", ")]
+        assert stages == ["orchestrator.iteration", "agent1", "agent2", "agent3", "total"]
+        assert plain.json()["timings"] is None
+        assert plain.json()["usage"]["totals"]["calls"] == 0
+        timings = timed.json()["timings"]
+        assert set(timings) == set(stages)
+        assert timings["agent1"] >= 50
+
+    @pytest.mark.asyncio
+    async def test_large_upload_spans_are_bounded(self, agents):
+        """A trace keeps max_spans spans however many documents an upload has."""
+        class CollectingExporter:
+            def __init__(self) -> None:
+                self.traces = []
+
+            async def export(self, trace) -> None:
+                self.traces.append(trace)
+
+        agents.delay = 0
+        exporter = CollectingExporter()
+        app.state.trace_exporter = exporter
+        app.state.trace_max_spans = 32
+        lines = "\n".join(json.dumps({"text": f"John {i}"}) for i in range(500))
+        try:
+            async with client() as c:
+                response = await c.post(
+                    "/api/v1/anonymize/upload",
+                    content=lines,
+                    headers={"Content-Type": "application/x-ndjson"}
+                )
+        finally:
+            del app.state.trace_exporter
+            del app.state.trace_max_spans
+
+        assert len(response.text.splitlines()) == 500
+        [trace] = exporter.traces
+        assert len(trace.spans) == 32
+        # Four stages per document, every one of them timed
+        assert trace.dropped_spans == 4 * 500 - 31
+        otlp_root = trace.to_otlp("test")["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert {"key": "dropped_spans", "value": {"intValue": str(trace.dropped_spans)}} in (
+            otlp_root["attributes"])
+
+
+class TestProfiling:
+    """Test the admin profiling endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_sampling_and_request_profiles(self, agents):
+        """Profiles need the admin token; X-Profile returns a retrievable summary."""
+        admin = {"X-Admin-Token": "secret"}
+        async with client() as c:
+            disabled = await c.get("/api/v1/debug/profile?seconds=0.05")
+            app.state.profiling = ProfilingService(ProfilingConfig(enabled=True), "secret")
+            try:
+                unauthorized = await c.get("/api/v1/debug/profile?seconds=0.05")
+                sampled = await c.get("/api/v1/debug/profile?seconds=0.05", headers=admin)
+                speedscope = await c.get(
+                    "/api/v1/debug/profile?seconds=0.05&format=speedscope", headers=admin)
+                unprofiled = await c.post(
+                    "/api/v1/anonymize", json={"text": "Hi John"}, headers={"X-Profile": "1"})
+                profiled = await c.post(
+                    "/api/v1/anonymize", json={"text": "Hi John"}, headers={"X-Profile": "1", **admin})
+                profile = await c.get(
+                    f"/api/v1/debug/profiles/{profiled.headers['x-profile-id']}", headers=admin)
+            finally:
+                del app.state.profiling
+
+        assert disabled.status_code == 404
+        assert unauthorized.status_code == 401
+        assert sampled.status_code == 200
+        assert sampled.headers["content-type"].startswith("text/plain")
+        assert int(sampled.headers["x-profile-samples"]) > 0
+        assert speedscope.json()["profiles"]
+        assert "x-profile-id" not in unprofiled.headers
+        body = profile.json()
+        assert body["status"] == "complete"
+        assert body["status_code"] == 200
+        assert body["path"] == "/api/v1/anonymize"
+        assert "anonymize_document" in body["summary"]
+
+
+class TestReadiness:
+    """Test the readiness probe."""
+
+    @pytest.mark.asyncio
+    async def test_llm_health(self, agents, monkeypatch):
+        """Readiness follows the cached probe status without probing itself."""
+        monkeypatch.setattr(warmup_state, "ready", True)
+        probes = []
+
+        async def probe() -> None:
+            probes.append(1)
+            if len(probes) > 1:
+                raise ConnectionError("ollama down")
+
+        monitor = LLMHealthMonitor(probe, failure_threshold=1)
+        app.state.llm_health = monitor
+        try:
+            async with client() as c:
+                unknown = await c.get("/health/ready")
+                await monitor.check()
+                healthy = await c.get("/health/ready")
+                await monitor.check()
+                unhealthy = await c.get("/health/ready")
+        finally:
+            del app.state.llm_health
+
+        assert unknown.status_code == 503
+        assert unknown.json()["details"]["llm"]["status"] == "unknown"
+        assert healthy.status_code == 200
+        assert healthy.json()["status"] == "ready"
+        assert healthy.json()["details"]["llm"]["latency_ms"] is not None
+        assert unhealthy.status_code == 503
+        assert unhealthy.json()["status"] == "llm_unavailable"
+        assert "ollama down" in unhealthy.json()["details"]["llm"]["error"]
+        assert len(probes) == 2
+
+
+    @pytest.mark.asyncio
+    async def test_warm_up(self, agents, monkeypatch):
+        """Readiness waits for a slow warm-up and reports a failed one without blocking."""
+        released = asyncio.Event()
+
+        class WarmingProvider:
+            def __init__(self, error: Exception = None) -> None:
+                self.error = error
+
+            async def warm_up(self) -> None:
+                await released.wait()
+                if self.error is not None:
+                    raise self.error
+
+        for field, value in (("ready", False), ("error", None), ("duration_seconds", None)):
+            monkeypatch.setattr(warmup_state, field, value)
+        monkeypatch.setattr(lifecycle, "get_llm_provider", lambda: WarmingProvider())
+
+        async with client() as c:
+            task = asyncio.create_task(warm_up(warmup_state))
+            await asyncio.sleep(0)
+            warming = await c.get("/health/ready")
+            released.set()
+            await task
+            ready = await c.get("/health/ready")
+
+            monkeypatch.setattr(warmup_state, "ready", False)
+            monkeypatch.setattr(
+                lifecycle, "get_llm_provider",
+                lambda: WarmingProvider(ConnectionError("ollama unreachable")))
+            await warm_up(warmup_state)
+            failed = await c.get("/health/ready")
+
+        assert warming.status_code == 503
+        assert warming.json()["status"] == "warming_up"
+        assert warming.json()["details"]["warmup"]["complete"] is False
+        assert ready.status_code == 200
+        assert ready.json()["details"]["warmup"]["error"] is None
+        assert ready.json()["details"]["warmup"]["duration_seconds"] > 0
+        # The provider is retried lazily, so a failed warm-up does not block traffic
+        assert failed.status_code == 200
+        assert failed.json()["details"]["warmup"]["error"] == "ollama unreachable"
+
+
+class TestJobEndpoints:
+    """Test /api/v1/jobs."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_poll_job(self, tmp_path):
+        """A created job is accepted, pollable and pages its results."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        app.dependency_overrides[get_job_store] = lambda: store
+        try:
+            async with client() as c:
+                response = await c.post("/api/v1/jobs", json={
+                    "documents": [{"text": "John 1"}, {"text": "John 2"}]
+                })
+                assert response.status_code == 202
+                job_id = response.json()["job_id"]
+
+                item = await store.claim_next()
+                await store.complete_item(item, _stored_result(item.text), True)
+
+                status = (await c.get(f"/api/v1/jobs/{job_id}")).json()
+                page = (await c.get(f"/api/v1/jobs/{job_id}/results?limit=1")).json()
+                last = (await c.get(f"/api/v1/jobs/{job_id}/results?cursor=1")).json()
+                missing = await c.get("/api/v1/jobs/unknown")
+                deleted = await c.delete(f"/api/v1/jobs/{job_id}")
+                gone = await c.get(f"/api/v1/jobs/{job_id}")
+
+                config = make_config()
+                config.jobs.enabled = False
+                app.dependency_overrides[get_config] = lambda: config
+                disabled = await c.post("/api/v1/jobs", json={"documents": [{"text": "x"}]})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert status["status"] == "running"
+        assert status["progress"] == 0.5
+        assert page["results"][0]["result"]["anonymized_text"] == "John 1"
+        assert page["next_cursor"] == 1
+        assert last["results"][0]["status"] == "pending"
+        assert last["results"][0]["result"] is None
+        assert last["next_cursor"] is None
+        assert missing.status_code == 404
+        assert deleted.status_code == 204
+        assert gone.status_code == 404
+        assert disabled.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_failed_documents(self, agents, tmp_path):
+        """Worker errors are stored as failed responses; legacy error records still page."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        app.dependency_overrides[get_job_store] = lambda: store
+        try:
+            async with client() as c:
+                job_id = (await c.post("/api/v1/jobs", json={
+                    "documents": [{"text": "John 1", "document_id": "a"}, {"text": "John 2"}]
+                })).json()["job_id"]
+                first = await store.claim_next()
+                await store.complete_item(
+                    first, failed_job_result(first, RuntimeError("boom")), False)
+                second = await store.claim_next()
+                await store.complete_item(second, {"error": "old worker error"}, False)
+                response = await c.get(f"/api/v1/jobs/{job_id}/results")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        results = [item["result"] for item in response.json()["results"]]
+        assert [result["success"] for result in results] == [False, False]
+        assert results[0]["document_id"] == "a"
+        assert results[0]["error"] == "Anonymization failed: boom"
+        assert results[1]["error"] == "old worker error"
+
+
+class TestTenancy:
+    """Test tenant identification."""
+
+    @pytest.mark.asyncio
+    async def test_header_cannot_impersonate_keyed_tenant(self, tmp_path):
+        """A job of a keyed tenant is only readable with the tenant's key."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        app.dependency_overrides[get_job_store] = lambda: store
+        app.state.tenant_resolver = TenantResolver(TenancyConfig(api_keys={"key-a": "team-a"}))
+        try:
+            async with client() as c:
+                created = await c.post(
+                    "/api/v1/jobs", json={"documents": [{"text": "John 1"}]},
+                    headers={"X-API-Key": "key-a"})
+                job_id = created.json()["job_id"]
+                spoofed = await c.get(
+                    f"/api/v1/jobs/{job_id}/results", headers={"X-Tenant-ID": "team-a"})
+                spoofed_create = await c.post(
+                    "/api/v1/jobs", json={"documents": [{"text": "John 2"}]},
+                    headers={"X-Tenant-ID": "team-a"})
+                other = await c.get(
+                    f"/api/v1/jobs/{job_id}/results", headers={"X-Tenant-ID": "team-b"})
+                owner = await c.get(
+                    f"/api/v1/jobs/{job_id}/results", headers={"X-API-Key": "key-a"})
+        finally:
+            del app.state.tenant_resolver
+            app.dependency_overrides.clear()
+
+        assert created.status_code == 202
+        assert spoofed.status_code == 401
+        assert spoofed_create.status_code == 401
+        assert other.status_code == 404
+        assert owner.status_code == 200
+
+
+def _stored_result(text: str) -> dict:
+    """Build a serialized AnonymizeResponse as a job worker would."""
+    return {
+        "anonymized_text": text,
+        "mappings": {},
+        "validation": {"passed": True, "issues": [], "reasoning": "ok", "confidence": 1.0},
+        "risk_assessment": {
+            "overall_score": 5,
+            "risk_level": "NEGLIGIBLE",
+            "gdpr_compliant": True,
+            "confidence": 1.0,
+            "reasoning": "ok",
+            "assessment_date": datetime.now(UTC).isoformat()
+        },
+        "iterations": 1,
+        "success": True,
+        "llm_provider": "ollama",
+        "llm_model": "test-model"
+    }
+
+
+class TestSerialization:
+    """Test the response construction and serialization fast path."""
+
+    @pytest.mark.asyncio
+    async def test_constructed_response_matches_validated(self, monkeypatch):
+        """model_construct plus ModelJSONResponse equals the validated FastAPI path."""
+        config = make_config()
+        request = AnonymizeRequest(text="Contact John", document_id="doc-1")
+        result = make_result(mappings=20)
+        assert result.validation.issues and result.risk_assessment.dimension_scores
+
+        fast = ModelJSONResponse(build_response(request, result, config)).body
+        field = create_response_field(name="response", type_=AnonymizeResponse)
+        legacy = await legacy_path(request, result, config, field)
+        # Compared as bytes, so type drift (e.g. 3 vs 3.0) is caught too
+        assert fast == legacy
+
+        data = json.loads(legacy)
+        encoded = serialization.dumps(data)
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert json.loads(serialization.dumps(data)) == json.loads(encoded) == data
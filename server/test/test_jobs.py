@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Tests for the asynchronous job queue.
+
+Tests:
+1. Job store tracks progress and pages all documents with their status
+2. Claims are leases: only expired leases are requeued, only the owner stores results
+3. Documents of different tenants are claimed round-robin
+4. Job runner drains the queue with its workers
+5. Deleted and expired finished jobs are removed with their results
+"""
+
+import asyncio
+
+import pytest
+
+# Import the job components
+import sys
+sys.path.insert(0, 'src')
+
+from anonymization.application.job_runner import JobRunner
+from anonymization.infrastructure.persistence import SQLiteJobStore
+
+
+DOCUMENTS = [(f"doc-{i}", f"Contact John {i}") for i in range(5)]
+
+
+class TestSQLiteJobStore:
+    """Test the SQLite job store."""
+
+    @pytest.mark.asyncio
+    async def test_progress_and_paged_results(self, tmp_path):
+        """Completed documents update progress and are paged by index."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        job = await store.create_job(DOCUMENTS)
+        assert job.status == "pending"
+        assert job.total == 5
+
+        for _ in range(3):
+            item = await store.claim_next()
+            await store.complete_item(item, {"index": item.index}, success=item.index != 1)
+
+        job = await store.get_job(job.job_id)
+        assert job.status == "running"
+        assert (job.completed, job.failed) == (2, 1)
+
+        page = await store.get_results(job.job_id, cursor=0, limit=2)
+        assert [item.index for item in page] == [0, 1]
+        assert page[1].status == "failed"
+        page = await store.get_results(job.job_id, cursor=2, limit=2)
+        assert [item.result for item in page] == [{"index": 2}, None]
+        assert [item.status for item in page] == ["done", "pending"]
+        assert page[1].text is None
+
+    @pytest.mark.asyncio
+    async def test_leases(self, tmp_path):
+        """A live claim is left alone; an expired one is requeued and reclaimed."""
+        path = str(tmp_path / "jobs.db")
+        crashed = SQLiteJobStore(path, lease_seconds=0.05)
+        job = await crashed.create_job(DOCUMENTS[:2])
+        claimed = await crashed.claim_next()
+
+        other = SQLiteJobStore(path)
+        assert other.worker_id != crashed.worker_id
+        assert await other.requeue_expired() == 0
+        await other.complete_item(claimed, {"stolen": True}, success=True)
+        assert (await other.get_job(job.job_id)).completed == 0
+
+        await asyncio.sleep(0.1)
+        assert await other.requeue_expired() == 1
+        item = await other.claim_next()
+        assert (item.job_id, item.index, item.text) == (job.job_id, claimed.index, claimed.text)
+        await crashed.complete_item(claimed, {"late": True}, success=True)
+        await other.complete_item(item, {"index": item.index}, success=True)
+        [result] = await other.get_results(job.job_id, cursor=claimed.index, limit=1)
+        assert result.result == {"index": claimed.index}
+
+        await other.claim_next()
+        assert await other.renew_leases() == 1
+        assert await other.release_claims() == 1
+        assert (await other.claim_next()).index == 1
+
+
+    @pytest.mark.asyncio
+    async def test_tenants_claimed_round_robin(self, tmp_path):
+        """A large job of one tenant does not hold back another tenant's job."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        big = await store.create_job(DOCUMENTS, tenant_id="team-a")
+        small = await store.create_job(DOCUMENTS[:2], tenant_id="team-b")
+        assert (big.tenant_id, small.tenant_id) == ("team-a", "team-b")
+
+        claimed = [await store.claim_next() for _ in range(4)]
+        assert [item.tenant_id for item in claimed] == ["team-a", "team-b", "team-a", "team-b"]
+        assert [item.index for item in claimed] == [0, 0, 1, 1]
+
+
+    @pytest.mark.asyncio
+    async def test_delete_and_purge(self, tmp_path):
+        """Jobs can be deleted; only finished jobs are purged after the retention period."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+        finished = await store.create_job(DOCUMENTS[:1])
+        unfinished = await store.create_job(DOCUMENTS[:2])
+        deleted = await store.create_job(DOCUMENTS[:1])
+        for _ in range(2):
+            item = await store.claim_next()
+            await store.complete_item(item, {"index": item.index}, success=True)
+
+        assert await store.delete_job(deleted.job_id)
+        assert not await store.delete_job(deleted.job_id)
+        assert await store.purge_finished(older_than_seconds=3600) == 0
+        assert await store.purge_finished(older_than_seconds=1e-6) == 1
+
+        assert await store.get_job(finished.job_id) is None
+        assert await store.get_results(finished.job_id, cursor=0, limit=10) == []
+        assert (await store.get_job(unfinished.job_id)).completed == 1
+
+
+class TestJobRunner:
+    """Test the background job workers."""
+
+    @pytest.mark.asyncio
+    async def test_runner_completes_job(self, tmp_path):
+        """Workers process every document and the job completes."""
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+
+        async def handler(item):
+            await asyncio.sleep(0.01)
+            if "3" in item.text:
+                raise RuntimeError("boom")
+            return {"text": item.text.upper()}, True
+
+        runner = JobRunner(store, handler, workers=2, poll_interval_seconds=0.05)
+        await runner.start()
+        job = await store.create_job(DOCUMENTS)
+        runner.notify()
+
+        for _ in range(100):
+            job = await store.get_job(job.job_id)
+            if job.status == "completed":
+                break
+            await asyncio.sleep(0.02)
+        await runner.stop()
+
+        assert job.status == "completed"
+        assert (job.completed, job.failed) == (4, 1)
+        results = await store.get_results(job.job_id, cursor=0, limit=10)
+        assert results[0].result == {"text": "CONTACT JOHN 0"}
+        assert results[3].result == {"error": "boom"}
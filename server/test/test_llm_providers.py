@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""Tests for LLM provider wrappers.
+
+Tests:
+1. Hedged provider sends a duplicate for slow calls and takes the winner
+2. Hedged provider respects the hedge budget and the scheduler's concurrency limit
+3. Fallback chain opens circuits and shifts traffic to healthy backends
+4. Circuit breaker half-opens after the cooldown
+5. Call scheduler limits concurrent calls
+6. Call scheduler serves priority classes in order, with aging
+7. Call scheduler shares slots between tenants by weight and enforces caps
+8. Fake adapter answers agent prompts deterministically
+9. Orchestrator over the fake adapter anonymizes a document end to end
+10. Recorded cassettes replay the same answers per prompt occurrence, also when interrupted
+11. LLM usage is aggregated per agent and iteration of a document
+12. Health monitor marks the provider unhealthy after consecutive failed probes
+13. Billed Claude probes are recorded as usage and run on the longer interval
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# Import the provider wrappers
+import sys
+sys.path.insert(0, 'src')
+
+from anonymization.application.config import AppConfig
+from anonymization.application.llm_health import LLMHealthMonitor
+from anonymization.application.metrics import LLM_HEDGES
+from anonymization.application.orchestrator import AnonymizationOrchestrator
+from anonymization.application.priority import Priority, priority_scope
+from anonymization.application.tenancy import tenant_scope
+from anonymization.application.usage import usage_scope
+from anonymization.domain.exceptions import LLMProviderUnavailableError
+from anonymization.domain.models import Document
+from anonymization.infrastructure.adapters.llm import (
+    CircuitBreaker,
+    CassetteMissError,
+    CircuitState,
+    FakeLLMAdapter,
+    HedgedLLMProvider,
+    LLMCallScheduler,
+    RecordingLLMProvider,
+    ReplayLLMProvider,
+    create_provider_chain
+)
+from anonymization.infrastructure.adapters.llm.claude_adapter import ClaudeAdapter
+from anonymization.infrastructure.agents import (
+    Agent1Implementation,
+    Agent2Implementation,
+    Agent3Implementation
+)
+from anonymization.interfaces.rest.lifecycle import _probe_interval, _probe_llm_provider
+
+
+class ScriptedProvider:
+    """Provider whose calls take scripted durations."""
+
+    def __init__(self, name: str, delays: list) -> None:
+        self.name = name
+        self.delays = list(delays)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, prompt: str) -> str:
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self.name
+
+
+class TestHedgedProvider:
+    """Test request hedging."""
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        """A call slower than the learned percentile is hedged to the secondary."""
+        primary = ScriptedProvider("primary", [0.001] * 5 + [1.0])
+        secondary = ScriptedProvider("secondary", [0.001])
+        provider = HedgedLLMProvider(
+            primary, secondary,
+            min_delay_seconds=0.0, budget_ratio=1.0, min_samples=5)
+
+        for _ in range(5):
+            assert await provider.generate("p") == "primary"
+
+        assert await provider.generate("p") == "secondary"
+        await asyncio.sleep(0)
+        assert provider.stats()["hedges"] == 1
+        assert provider.stats()["hedge_wins"] == 1
+        assert primary.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_hedges(self):
+        """Hedges stop once the budget is spent."""
+        primary = ScriptedProvider("primary", [0.001] * 20 + [0.05])
+        provider = HedgedLLMProvider(
+            primary, percentile=0.5, min_delay_seconds=0.0,
+            budget_ratio=0.1, min_samples=5)
+
+        for _ in range(30):
+            await provider.generate("p")
+
+        stats = provider.stats()
+        assert 0 < stats["hedges"] <= 0.1 * stats["calls"]
+        assert stats["budget_exhausted"] > 0
+
+    @pytest.mark.asyncio
+    async def test_hedges_count_against_scheduler(self):
+        """A hedge takes a free scheduler slot, is skipped without one and is metered."""
+        primary = ScriptedProvider("primary", [0.001] * 5 + [0.2])
+        secondary = ScriptedProvider("secondary", [0.001])
+        hedged = HedgedLLMProvider(
+            primary, secondary, min_delay_seconds=0.0, budget_ratio=1.0, min_samples=5)
+        scheduler = LLMCallScheduler(hedged, max_concurrency=1)
+        hedged.scheduler = scheduler
+        sent = LLM_HEDGES.value(outcome="sent")
+        skipped = LLM_HEDGES.value(outcome="no_capacity")
+
+        for _ in range(5):
+            await scheduler.generate("p")
+        # The slow call holds the only slot, so it cannot be hedged
+        assert await scheduler.generate("p") == "primary"
+        assert hedged.stats()["no_capacity"] == 1
+        assert LLM_HEDGES.value(outcome="no_capacity") == skipped + 1
+
+        scheduler.max_concurrency = 2
+        primary.delays = [1.0]
+        assert await scheduler.generate("p") == "secondary"
+        await asyncio.sleep(0)
+        assert LLM_HEDGES.value(outcome="sent") == sent + 1
+        assert scheduler.in_flight == 0
+
+
+class FailingProvider:
+    """Provider that always fails."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        raise ConnectionError("backend down")
+
+    async def probe(self) -> None:
+        raise ConnectionError("backend down")
+
+
+class TestFallbackChain:
+    """Test the provider fallback chain and circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_failures_open_circuit_and_shift_traffic(self):
+        """After enough failures the primary is skipped entirely."""
+        primary = FailingProvider()
+        secondary = ScriptedProvider("secondary", [0.0])
+        chain = create_provider_chain(
+            [("primary", primary), ("secondary", secondary)],
+            {"min_calls": 3, "window_size": 3, "cooldown_seconds": 60})
+
+        for _ in range(5):
+            assert await chain.generate("p") == "secondary"
+
+        assert primary.calls == 3
+        assert chain.stats()["backends"][0]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_all_backends_down(self):
+        """An exhausted chain raises LLMProviderUnavailableError."""
+        chain = create_provider_chain([("primary", FailingProvider())], {})
+
+        with pytest.raises(LLMProviderUnavailableError):
+            await chain.generate("p")
+
+    def test_breaker_half_opens_after_cooldown(self):
+        """An open breaker allows a trial call after the cooldown and closes on success."""
+        breaker = CircuitBreaker(
+            "b", min_calls=1, cooldown_seconds=0.01, slow_call_threshold_seconds=1.0)
+        breaker.record_success(latency_seconds=5.0)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success(latency_seconds=0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestLLMCallScheduler:
+    """Test the concurrency-limiting call scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """No more than max_concurrency calls reach the provider at once."""
+        running = 0
+        peak = 0
+
+        class Tracking:
+            async def generate(self, prompt: str) -> str:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return prompt
+
+        scheduler = LLMCallScheduler(Tracking(), max_concurrency=2)
+        results = await asyncio.gather(*(scheduler.generate(str(i)) for i in range(6)))
+
+        assert results == [str(i) for i in range(6)]
+        assert peak == 2
+        assert scheduler.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order_and_aging(self):
+        """Interactive calls overtake queued batch calls unless those aged."""
+        order = []
+        gate = asyncio.Event()
+
+        class Recording:
+            async def generate(self, prompt: str) -> str:
+                if prompt == "blocker":
+                    await gate.wait()
+                order.append(prompt)
+                return prompt
+
+        async def call(scheduler, prompt, priority):
+            with priority_scope(priority):
+                return await scheduler.generate(prompt)
+
+        for aging_seconds, expected in ((60.0, ["interactive", "batch"]), (0.01, ["batch", "interactive"])):
+            order.clear()
+            gate.clear()
+            scheduler = LLMCallScheduler(Recording(), max_concurrency=1, aging_seconds=aging_seconds)
+            blocker = asyncio.create_task(call(scheduler, "blocker", Priority.INTERACTIVE))
+            await asyncio.sleep(0)
+            batch = asyncio.create_task(call(scheduler, "batch", Priority.BATCH))
+            await asyncio.sleep(0.05)
+            interactive = asyncio.create_task(call(scheduler, "interactive", Priority.INTERACTIVE))
+            await asyncio.sleep(0)
+
+            assert scheduler.stats()["priorities"]["batch"]["queue_depth"] == 1
+            gate.set()
+            await asyncio.gather(blocker, batch, interactive)
+            assert order[1:] == expected
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_tenants_and_caps(self):
+        """Queued calls are served 2:1 by weight; a capped tenant never exceeds its cap."""
+        order = []
+        running = {"a": 0, "b": 0, "capped": 0}
+        peak_capped = 0
+        gate = asyncio.Event()
+
+        class Recording:
+            async def generate(self, prompt: str) -> str:
+                nonlocal peak_capped
+                tenant = prompt.split("-")[0]
+                running[tenant] += 1
+                peak_capped = max(peak_capped, running["capped"])
+                await gate.wait()
+                order.append(tenant)
+                running[tenant] -= 1
+                return prompt
+
+        async def call(scheduler, tenant, index):
+            with tenant_scope(tenant):
+                return await scheduler.generate(f"{tenant}-{index}")
+
+        scheduler = LLMCallScheduler(
+            Recording(),
+            max_concurrency=1,
+            tenant_weights={"a": 2.0},
+            tenant_max_concurrency={"capped": 1}
+        )
+        blocker = asyncio.create_task(call(scheduler, "b", "blocker"))
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(call(scheduler, tenant, i))
+                 for i in range(4) for tenant in ("a", "b")]
+        await asyncio.sleep(0)
+
+        assert scheduler.stats()["tenants"]["a"]["queue_depth"] == 4
+        gate.set()
+        await asyncio.gather(blocker, *tasks)
+        # After the blocker, tenant a (weight 2) gets two slots per slot of b
+        assert order[1:7] == ["a", "a", "b", "a", "a", "b"]
+        assert scheduler.stats()["tenants"]["a"]["completed"] == 4
+
+        gate.clear()
+        scheduler = LLMCallScheduler(Recording(), max_concurrency=4, tenant_max_concurrency={"capped": 1})
+        tasks = [asyncio.create_task(call(scheduler, "capped", i)) for i in range(3)]
+        tasks.append(asyncio.create_task(call(scheduler, "a", 0)))
+        await asyncio.sleep(0)
+
+        assert scheduler.stats()["in_flight"] == 2
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert peak_capped == 1
+
+
+class TestFakeLLMAdapter:
+    """Test the deterministic fake adapter."""
+
+    TEXT = "John Smith called from 555-123-4567. Write to john.smith@example.com or visit 12 Baker Street."
+
+    @pytest.mark.asyncio
+    async def test_deterministic_answers(self):
+        """Same seed gives the same answers; entities are found in the text."""
+        prompt = f"<TEXT_TO_ANALYZE>{self.TEXT}</TEXT_TO_ANALYZE>"
+        first = FakeLLMAdapter(malformed_rate=0.3, truncation_rate=0.3, seed=7)
+        second = FakeLLMAdapter(malformed_rate=0.3, truncation_rate=0.3, seed=7)
+
+        answers = [await first.generate(prompt) for _ in range(5)]
+        assert answers == [await second.generate(prompt) for _ in range(5)]
+
+        clean = await FakeLLMAdapter().generate(prompt)
+        for value in ("John Smith", "555-123-4567", "john.smith@example.com", "12 Baker Street"):
+            assert value in clean
+
+        with pytest.raises(ValueError):
+            FakeLLMAdapter(malformed_rate=1.5)
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_end_to_end(self):
+        """The agents parse the fake answers and the document passes validation."""
+        provider = FakeLLMAdapter()
+        orchestrator = AnonymizationOrchestrator(
+            agent1=Agent1Implementation(provider),
+            agent2=Agent2Implementation(provider),
+            agent3=Agent3Implementation()
+        )
+
+        result = await orchestrator.anonymize_document(Document(content=self.TEXT))
+
+        assert result.validation.passed
+        assert "John Smith" not in result.anonymizationMapping.anonymized_text
+        assert "john.smith@example.com" not in result.anonymizationMapping.anonymized_text
+        assert provider.calls == 2
+
+
+class TestUsage:
+    """Test LLM usage reporting."""
+
+    @pytest.mark.asyncio
+    async def test_usage_per_agent_and_iteration(self):
+        """Every call is attributed to its agent and iteration and summed."""
+        provider = FakeLLMAdapter(model="fake-7b", miss_rate=1.0)
+        orchestrator = AnonymizationOrchestrator(
+            agent1=Agent1Implementation(provider),
+            agent2=Agent2Implementation(provider),
+            agent3=Agent3Implementation(),
+            max_iterations=2
+        )
+
+        result = await orchestrator.anonymize_document(
+            Document(content=TestFakeLLMAdapter.TEXT))
+
+        usage = result.usage
+        assert result.iterations == 2
+        assert usage["totals"]["calls"] == 4
+        assert usage["by_agent"]["agent1"]["calls"] == usage["by_agent"]["agent2"]["calls"] == 2
+        assert sorted(usage["by_iteration"]) == [1, 2]
+        assert [(call["agent"], call["iteration"]) for call in usage["calls"]] == [
+            ("agent1", 1), ("agent2", 1), ("agent1", 2), ("agent2", 2)]
+        assert usage["calls"][0]["model"] == "fake-7b"
+        assert usage["totals"]["input_tokens"] == sum(
+            call["input_tokens"] for call in usage["calls"]) > 0
+
+
+class TestLLMHealth:
+    """Test background LLM health probing."""
+
+    @pytest.mark.asyncio
+    async def test_failure_threshold(self):
+        """One failure is tolerated, two in a row mark the provider unhealthy."""
+        outcomes = [None, ConnectionError("down"), None, ConnectionError("down"),
+                    ConnectionError("down"), None]
+
+        async def probe() -> None:
+            error = outcomes.pop(0)
+            if error is not None:
+                raise error
+
+        monitor = LLMHealthMonitor(probe, failure_threshold=2)
+        assert monitor.stats()["status"] == "unknown"
+        assert [await monitor.check() for _ in range(6)] == [
+            True, True, True, True, False, True]
+
+        stats = monitor.stats()
+        assert stats["status"] == "healthy"
+        assert stats["probes"] == 6
+        assert stats["failures"] == 3
+        assert stats["latency_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_and_fallback_chain(self):
+        """Timeouts count as failures; a chain is healthy while any backend is."""
+        async def hang() -> None:
+            await asyncio.sleep(10)
+
+        monitor = LLMHealthMonitor(hang, timeout_seconds=0.01, failure_threshold=1)
+        assert not await monitor.check()
+        assert monitor.stats()["error"] == "TimeoutError"
+
+        chain = create_provider_chain(
+            [("primary", FailingProvider()), ("secondary", ScriptedProvider("secondary", [0.0]))],
+            {})
+        await chain.probe()
+        chain = create_provider_chain([("primary", FailingProvider())], {})
+        with pytest.raises(LLMProviderUnavailableError):
+            await chain.probe()
+
+    @pytest.mark.asyncio
+    async def test_billed_probe(self, monkeypatch):
+        """The Claude probe is recorded as usage and probed less often."""
+        class StubMessages:
+            async def create(self, **kwargs):
+                return SimpleNamespace(
+                    model=kwargs["model"],
+                    usage=SimpleNamespace(input_tokens=8, output_tokens=1))
+
+        class StubClaudeAdapter(ClaudeAdapter):
+            def _initialize_client(self) -> None:
+                self.client = SimpleNamespace(messages=StubMessages())
+
+        monkeypatch.setattr("anonymization.interfaces.rest.lifecycle.get_llm_provider",
+                            lambda: StubClaudeAdapter(model="claude-test"))
+        with usage_scope() as usage:
+            await _probe_llm_provider()
+        [call] = usage.summary()["calls"]
+        assert call["agent"] == "readiness_probe"
+        assert call["model"] == "claude-test"
+        assert (call["input_tokens"], call["output_tokens"]) == (8, 1)
+
+        agents = {
+            "agent1": {"name": "ANON-EXEC"},
+            "agent2": {"name": "DIRECT-CHECK"},
+            "agent3": {"name": "RISK-ASSESS"},
+            "orchestration": {},
+        }
+        config = AppConfig(llm={"provider": "ollama", "model": "m1"}, **agents)
+        assert _probe_interval(config) == config.readiness.probe_interval_seconds
+        config = AppConfig(
+            llm={"provider": "ollama", "model": "m1",
+                 "fallbacks": [{"provider": "claude", "model": "claude-test"}]},
+            **agents)
+        assert _probe_interval(config) == config.readiness.billed_probe_interval_seconds
+
+
+class TestCassette:
+    """Test recording and replay of LLM calls."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_replay(self, tmp_path):
+        """Replay returns the recorded answer of each occurrence; misses fall back or raise."""
+        path = tmp_path / "run.jsonl.gz"
+        recorder = RecordingLLMProvider(FakeLLMAdapter(malformed_rate=0.5, seed=3), path)
+        prompts = ["<TEXT_TO_ANALYZE>John Smith</TEXT_TO_ANALYZE>"] * 3 + ["other"]
+        recorded = [await recorder.generate(prompt) for prompt in prompts]
+        await recorder.close()
+
+        replay = ReplayLLMProvider(path)
+        assert [await replay.generate(prompt) for prompt in prompts] == recorded
+        # Occurrences beyond the recording repeat the last answer
+        assert await replay.generate(prompts[0]) == recorded[2]
+
+        with pytest.raises(CassetteMissError):
+            await replay.generate("never recorded")
+        fallback = ReplayLLMProvider(path, fallback=ScriptedProvider("live", [0]))
+        assert await fallback.generate("never recorded") == "live"
+        assert fallback.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interrupted_gzip_recording(self, tmp_path):
+        """A gzip cassette that was never closed replays its flushed calls."""
+        path = tmp_path / "interrupted.jsonl.gz"
+        recorder = RecordingLLMProvider(FakeLLMAdapter(seed=1), path)
+        recorded = [await recorder.generate(prompt) for prompt in ("first", "second")]
+
+        replay = ReplayLLMProvider(path)
+        assert [await replay.generate("first"), await replay.generate("second")] == recorded
+        await recorder.close()
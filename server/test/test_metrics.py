@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the Prometheus metrics registry.
+
+Tests:
+1. Histograms render cumulative buckets, sum and count per label set
+2. Counters reject decrements and mismatched labels; labels are escaped
+3. Refresh hooks update gauges at render time and failures are tolerated
+"""
+
+import pytest
+
+# Import the metrics registry
+import sys
+sys.path.insert(0, 'src')
+
+from anonymization.application.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Test metric families and the text exposition."""
+
+    def test_histogram_exposition(self):
+        """Buckets are cumulative and end with +Inf, followed by sum and count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", ("agent",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value, agent="agent1")
+
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP latency_seconds Latency", "# TYPE latency_seconds histogram"]
+        assert lines[2:] == [
+            'latency_seconds_bucket{agent="agent1",le="0.1"} 1',
+            'latency_seconds_bucket{agent="agent1",le="1"} 3',
+            'latency_seconds_bucket{agent="agent1",le="+Inf"} 4',
+            'latency_seconds_sum{agent="agent1"} 4.05',
+            'latency_seconds_count{agent="agent1"} 4',
+        ]
+
+    def test_counter_validation_and_escaping(self):
+        """Counters only go up, need their declared labels and escape values."""
+        registry = MetricsRegistry()
+        counter = registry.counter("errors_total", "Errors", ("error",))
+        counter.inc(error='Bad "quote"\n')
+        counter.inc(2, error='Bad "quote"\n')
+
+        with pytest.raises(ValueError):
+            counter.inc(-1, error="x")
+        with pytest.raises(ValueError):
+            counter.inc(backend="x")
+        with pytest.raises(ValueError):
+            registry.counter("errors_total", "Duplicate")
+
+        assert 'errors_total{error="Bad \\"quote\\"\\n"} 3' in registry.render()
+
+    def test_refresh_hooks(self):
+        """Gauges set by hooks reflect state at scrape time."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("queue_depth", "Queue depth")
+        state = {"depth": 3}
+
+        def broken() -> None:
+            raise RuntimeError("probe failed")
+
+        registry.add_refresh_hook(broken)
+        registry.add_refresh_hook(lambda: gauge.set(state["depth"]))
+        assert "queue_depth 3" in registry.render()
+
+        state["depth"] = 0
+        assert "queue_depth 0" in registry.render()
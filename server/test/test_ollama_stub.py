@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Tests for the Ollama stub server used in load tests.
+
+Tests:
+1. OllamaAdapter talks to the stub over HTTP, the pipeline succeeds and usage is reported
+2. Stub errors and a full queue surface as Ollama response errors
+3. The readiness probe finds the configured model in the stub's model list
+"""
+
+import httpx
+import pytest
+
+# Import the stub and the adapter
+import sys
+sys.path.insert(0, 'src')
+sys.path.insert(0, 'benchmarks')
+
+ollama = pytest.importorskip("ollama")
+
+from ollama_stub import StubSettings, create_app
+
+from anonymization.application.orchestrator import AnonymizationOrchestrator
+from anonymization.domain.models import Document
+from anonymization.infrastructure.adapters.llm.ollama_adapter import OllamaAdapter
+from anonymization.infrastructure.agents import (
+    Agent1Implementation,
+    Agent2Implementation,
+    Agent3Implementation
+)
+
+
+def stub_adapter(settings: StubSettings, model: str = "stub") -> OllamaAdapter:
+    """OllamaAdapter whose HTTP client is routed to an in-process stub."""
+    adapter = OllamaAdapter(model=model, base_url="http://stub")
+    adapter.client = ollama.AsyncClient(
+        host="http://stub",
+        transport=httpx.ASGITransport(app=create_app(settings))
+    )
+    return adapter
+
+
+class TestOllamaStub:
+    """Test the stub through the real Ollama adapter."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_over_stub(self):
+        """Agent prompts are answered with parseable entity and validation JSON."""
+        adapter = stub_adapter(StubSettings())
+        orchestrator = AnonymizationOrchestrator(
+            agent1=Agent1Implementation(adapter),
+            agent2=Agent2Implementation(adapter),
+            agent3=Agent3Implementation()
+        )
+
+        result = await orchestrator.anonymize_document(
+            Document(content="Contact Maria Garcia at maria.garcia@example.com."))
+
+        assert result.validation.passed
+        assert "maria.garcia@example.com" not in result.anonymizationMapping.anonymized_text
+        call = result.usage["calls"][0]
+        assert call["model"] == "stub"
+        assert call["input_tokens"] > 0 and call["output_tokens"] > 0
+        assert call["time_to_first_token_ms"] is not None
+        await adapter.warm_up()
+
+    @pytest.mark.asyncio
+    async def test_errors_and_throttling(self):
+        """Simulated failures reach the adapter as Ollama errors with status codes."""
+        with pytest.raises(ollama.ResponseError) as failed:
+            await stub_adapter(StubSettings(error_rate=1.0)).generate("prompt")
+        assert failed.value.status_code == 500
+
+        with pytest.raises(ollama.ResponseError) as busy:
+            await stub_adapter(StubSettings(max_queue=0)).generate("prompt")
+        assert busy.value.status_code == 503
+        assert "server busy" in busy.value.error
+
+    @pytest.mark.asyncio
+    async def test_probe_finds_model(self):
+        """A requested or --model name is listed; --model rejects other names."""
+        adapter = stub_adapter(StubSettings(), model="qwen3:14b")
+        with pytest.raises(LookupError):
+            await adapter.probe()
+        await adapter.warm_up()
+        await adapter.probe()
+
+        await stub_adapter(StubSettings(model="qwen3:14b"), model="qwen3:14b").probe()
+        with pytest.raises(ollama.ResponseError) as missing:
+            await stub_adapter(StubSettings(model="qwen3:14b")).generate("prompt")
+        assert missing.value.status_code == 404
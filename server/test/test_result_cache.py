@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Tests for the whole-result cache.
+
+Tests:
+1. Repeat documents are served from cache without calling the agents
+2. Memory tier evicts least recently used entries by byte size
+3. Disk tier survives a new cache instance and purges only its own stale directories
+4. Config fingerprint changes with model, prompt version, fallbacks and cassette replay
+"""
+
+from datetime import datetime, UTC
+
+import pytest
+
+# Import the cache and orchestrator
+import sys
+sys.path.insert(0, 'src')
+
+from anonymization.application.config import (
+    AppConfig,
+    LLMConfig,
+    AgentConfig,
+    OrchestrationConfig,
+    CassetteConfig,
+    LLMBackendConfig
+)
+from anonymization.application.orchestrator import AnonymizationOrchestrator
+from anonymization.application.result_cache import ResultCache, compute_config_fingerprint
+from anonymization.domain.models import (
+    AnonymizationMapping,
+    Document,
+    RiskAssessment,
+    ValidationResult
+)
+
+
+class CountingAgents:
+    """Minimal agents that count how often they are called."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def anonymize(self, text: str) -> AnonymizationMapping:
+        self.calls += 1
+        return AnonymizationMapping(
+            original_text=text,
+            anonymized_text=text.replace("John", "[NAME_1]"),
+            mappings={"John": "[NAME_1]"}
+        )
+
+    async def validate(self, anonymized_text: str) -> ValidationResult:
+        return ValidationResult(passed=True, reasoning="ok", confidence=1.0)
+
+    async def assess_risk(self, anonymized_text, mappings) -> RiskAssessment:
+        return RiskAssessment(
+            overall_score=5,
+            risk_level="NEGLIGIBLE",
+            gdpr_compliant=True,
+            confidence=1.0,
+            reasoning="ok",
+            assessment_date=datetime.now(UTC)
+        )
+
+
+def make_config(model: str = "m1", prompt_version: str = "v1") -> AppConfig:
+    """Build a minimal configuration."""
+    return AppConfig(
+        llm=LLMConfig(provider="ollama", model=model),
+        agent1=AgentConfig(name="ANON-EXEC", prompt_version=prompt_version),
+        agent2=AgentConfig(name="DIRECT-CHECK"),
+        agent3=AgentConfig(name="RISK-ASSESS"),
+        orchestration=OrchestrationConfig()
+    )
+
+
+class TestResultCache:
+    """Test result caching behavior."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_document_skips_agents(self):
+        """Second call with the same content is served from cache."""
+        agents = CountingAgents()
+        cache = ResultCache(fingerprint="fp")
+        orchestrator = AnonymizationOrchestrator(
+            agents, agents, agents, result_cache=cache)
+
+        first = await orchestrator.anonymize_document(
+            Document(content="Contact John", document_id="a"))
+        second = await orchestrator.anonymize_document(
+            Document(content="Contact John", document_id="b"))
+
+        assert agents.calls == 1
+        assert second.anonymizationMapping == first.anonymizationMapping
+        assert second.document.document_id == "b"
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_evicts_by_size(self):
+        """Entries beyond the byte budget are evicted oldest first."""
+        agents = CountingAgents()
+        probe = ResultCache(fingerprint="fp")
+        orchestrator = AnonymizationOrchestrator(
+            agents, agents, agents, result_cache=probe)
+        await orchestrator.anonymize_document(Document(content="Contact John 1"))
+        entry_size = probe.stats()["memory_bytes"]
+
+        cache = ResultCache(fingerprint="fp", max_memory_bytes=entry_size * 2 + 1)
+        orchestrator.result_cache = cache
+        for i in range(1, 4):
+            await orchestrator.anonymize_document(Document(content=f"Contact John {i}"))
+
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+        assert await cache.get(Document(content="Contact John 1")) is None
+        assert await cache.get(Document(content="Contact John 3")) is not None
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_and_stale_purge(self, tmp_path):
+        """Disk entries are reused by new instances and purged on fingerprint change."""
+        agents = CountingAgents()
+        orchestrator = AnonymizationOrchestrator(
+            agents, agents, agents,
+            result_cache=ResultCache(fingerprint="a" * 64, disk_path=tmp_path))
+        await orchestrator.anonymize_document(Document(content="Contact John"))
+
+        reloaded = ResultCache(fingerprint="a" * 64, disk_path=tmp_path)
+        result = await reloaded.get(Document(content="Contact John"))
+        assert result is not None
+        assert result.anonymizationMapping.anonymized_text == "Contact [NAME_1]"
+        assert reloaded.stats()["disk_hits"] == 1
+
+        (tmp_path / "jobs").mkdir()
+        unmarked = tmp_path / ("c" * 16)
+        unmarked.mkdir()
+        ResultCache(fingerprint="b" * 64, disk_path=tmp_path)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["b" * 16, "c" * 16, "jobs"]
+
+    def test_fingerprint_tracks_model_and_prompts(self):
+        """Changing model or prompt version changes the fingerprint."""
+        base = compute_config_fingerprint(make_config())
+        assert base == compute_config_fingerprint(make_config())
+        assert base != compute_config_fingerprint(make_config(model="m2"))
+        assert base != compute_config_fingerprint(make_config(prompt_version="v2"))
+
+        with_fallback = make_config()
+        with_fallback.llm.fallbacks = [LLMBackendConfig(provider="claude", model="c1")]
+        assert base != compute_config_fingerprint(with_fallback)
+
+        replayed = make_config()
+        replayed.llm.cassette = CassetteConfig(mode="replay", path="run.jsonl.gz")
+        assert base != compute_config_fingerprint(replayed)
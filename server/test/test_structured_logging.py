@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for structured, queued and redacting logging.
+
+Tests:
+1. Payloads are redacted by default, truncated and sampled otherwise
+2. Queued records keep payload arguments unformatted and render as JSON
+3. A full queue drops records instead of blocking
+4. Agent 1 does not log document values at DEBUG level
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+
+# Import the logging components
+import sys
+sys.path.insert(0, 'src')
+
+from anonymization.application.metrics import LOG_RECORDS_DROPPED
+from anonymization.application.tracing import trace_scope
+from anonymization.infrastructure.agents import Agent1Implementation
+from anonymization.infrastructure.telemetry import (
+    JsonFormatter,
+    LogPayload,
+    NonBlockingQueueHandler,
+    payload,
+    set_payload_policy
+)
+
+
+class FakeLLM:
+    """LLM returning one fixed entity list."""
+
+    async def generate(self, prompt: str) -> str:
+        return '[{"type": "NAME", "value": "Maria Garcia"}]'
+
+
+@pytest.fixture(autouse=True)
+def default_policy():
+    """Restore the default payload policy after each test."""
+    yield
+    set_payload_policy()
+
+
+class TestStructuredLogging:
+    """Test payload redaction, JSON records and the non-blocking queue."""
+
+    def test_payload_policy(self):
+        """Redaction hides values; without it large payloads are cut or sampled out."""
+        assert str(payload("Maria Garcia")) == "<redacted 12 chars>"
+
+        set_payload_policy(redact=False, max_chars=5)
+        assert str(payload("Maria")) == "Maria"
+        assert str(payload("Maria Garcia")) == "Maria... <7 more chars>"
+
+        set_payload_policy(redact=False, max_chars=5, sample_rate=0.0)
+        assert str(payload("Maria Garcia")) == "<12 chars, not sampled>"
+
+    def test_queued_json_records(self):
+        """Payload arguments travel unformatted; mutable arguments are formatted early."""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        logger = logging.getLogger("anonymization.test.queue")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        try:
+            with trace_scope("request") as trace:
+                logger.info("response %s", payload("Maria Garcia"), extra={"chars": 12})
+            items = ["Maria"]
+            logger.info("items %s", items)
+            items.append("Garcia")
+            logger.debug("never %s", payload("x"))
+        finally:
+            logger.removeHandler(handler)
+
+        first, second = handler.queue.get_nowait(), handler.queue.get_nowait()
+        assert handler.queue.empty()
+        assert isinstance(first.args[0], LogPayload)
+        entry = json.loads(JsonFormatter().format(first))
+        assert entry["message"] == "response <redacted 12 chars>"
+        assert entry["trace_id"] == trace.trace_id
+        assert entry["chars"] == 12
+        assert json.loads(JsonFormatter().format(second))["message"] == "items ['Maria']"
+
+    def test_full_queue_drops(self):
+        """Records beyond the queue size are dropped and counted."""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        before = LOG_RECORDS_DROPPED.value()
+        for _ in range(3):
+            handler.handle(logging.makeLogRecord({"msg": "event"}))
+        assert handler.queue.qsize() == 1
+        assert LOG_RECORDS_DROPPED.value() == before + 2
+
+    @pytest.mark.asyncio
+    async def test_agent1_redacts(self, caplog):
+        """Prompts and responses are logged without the document's values."""
+        agent = Agent1Implementation(FakeLLM())
+        with caplog.at_level(logging.DEBUG, logger="anonymization"):
+            result = await agent.anonymize("Maria Garcia knows a Secret.")
+
+        assert result.anonymized_text == "[NAME_1] knows a Secret."
+        assert "Agent 1 LLM response" in caplog.text
+        assert "Maria" not in caplog.text
+        assert "Secret" not in caplog.text
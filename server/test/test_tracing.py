@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for per-request tracing.
+
+Tests:
+1. Spans nest through awaits and spawned tasks, and sum per stage
+2. Spans outside a trace are no-ops; failed stages record the error
+3. Traces export as OTLP JSON lines
+4. The stack sampler finds busy code and renders collapsed and speedscope output
+5. The event loop monitor measures lag, logs blocking stacks and flags blocking I/O
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+# Import the tracing components
+import sys
+sys.path.insert(0, 'src')
+
+from anonymization.application.tracing import current_trace, span, trace_scope
+from anonymization.infrastructure.telemetry import (
+    EventLoopMonitor,
+    OtlpJsonFileExporter,
+    StackSampler
+)
+
+
+class TestTracing:
+    """Test spans and traces."""
+
+    @pytest.mark.asyncio
+    async def test_nesting_and_timings(self):
+        """Child spans point to their parent, including in spawned tasks."""
+        async def call_llm():
+            with span("llm.generate", backend="fake"):
+                await asyncio.sleep(0.01)
+
+        with trace_scope("POST /api/v1/anonymize") as trace:
+            with span("agent1") as agent:
+                await asyncio.gather(call_llm(), call_llm())
+            with span("agent2"):
+                await call_llm()
+
+        names = [recorded.name for recorded in trace.spans]
+        assert names.count("llm.generate") == 3
+        llm_spans = [recorded for recorded in trace.spans if recorded.name == "llm.generate"]
+        assert [recorded.parent_id for recorded in llm_spans[:2]] == [agent.span_id] * 2
+        assert llm_spans[2].parent_id != agent.span_id
+
+        timings = trace.timings()
+        assert list(timings) == ["agent1", "llm.generate", "agent2", "total"]
+        assert timings["llm.generate"] >= 30
+        assert timings["total"] >= timings["agent1"] + timings["agent2"]
+        assert current_trace() is None
+
+    def test_noop_and_errors(self):
+        """No trace means no spans; an exception marks the span as failed."""
+        with span("agent1") as recorded:
+            assert recorded is None
+
+        with trace_scope("request") as trace:
+            with pytest.raises(ValueError):
+                with span("agent1.parse"):
+                    raise ValueError("bad json")
+
+        assert trace.spans[1].error == "ValueError"
+        assert trace.spans[1].end_ns is not None
+
+    @pytest.mark.asyncio
+    async def test_otlp_file_export(self, tmp_path):
+        """Each trace is one OTLP/JSON ExportTraceServiceRequest line."""
+        exporter = OtlpJsonFileExporter(str(tmp_path / "traces" / "out.jsonl"), service_name="test")
+        for _ in range(2):
+            with trace_scope("request") as trace:
+                with span("agent3", iteration=1):
+                    pass
+            await exporter.export(trace)
+
+        lines = (tmp_path / "traces" / "out.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        request = json.loads(lines[1])
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0] == {
+            "key": "service.name", "value": {"stringValue": "test"}}
+        root, child = resource_spans["scopeSpans"][0]["spans"]
+        assert root["traceId"] == child["traceId"] == trace.trace_id
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["attributes"] == [{"key": "iteration", "value": {"intValue": "1"}}]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+
+
+def busy_loop(stop: threading.Event) -> None:
+    """Burn CPU until stopped."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestStackSampler:
+    """Test the sampling profiler."""
+
+    def test_collapsed_and_speedscope(self):
+        """A busy thread dominates the samples and appears in both formats."""
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop,), name="busy")
+        sampler = StackSampler(interval_seconds=0.005)
+        worker.start()
+        sampler.start()
+        time.sleep(0.2)
+        sampler.stop()
+        stop.set()
+        worker.join()
+
+        assert sampler.samples > 5
+        busy_lines = [line for line in sampler.collapsed().splitlines() if line.startswith("busy;")]
+        assert busy_lines and all("busy_loop (" in line for line in busy_lines)
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in busy_lines) >= sampler.samples - 1
+
+        document = json.loads(json.dumps(sampler.speedscope()))
+        assert document["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+        profile = next(p for p in document["profiles"] if p["name"] == "busy")
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        names = {document["shared"]["frames"][i]["name"] for stack in profile["samples"] for i in stack}
+        assert "busy_loop" in names
+
+
+def block_loop(seconds: float) -> None:
+    """Block the calling thread, standing in for a blocking call in a coroutine."""
+    time.sleep(seconds)
+
+
+class TestEventLoopMonitor:
+    """Test event loop lag and blocking-call detection."""
+
+    @pytest.mark.asyncio
+    async def test_stall_is_logged_with_stack(self, caplog):
+        """Blocking the loop records lag and logs the blocking function."""
+        monitor = EventLoopMonitor(interval_seconds=0.01, stall_threshold_seconds=0.05)
+        monitor.start()
+        try:
+            with caplog.at_level(logging.WARNING, logger="anonymization"):
+                await asyncio.sleep(0.03)
+                block_loop(0.2)
+                await asyncio.sleep(0.03)
+        finally:
+            await monitor.stop()
+
+        stats = monitor.stats()
+        assert stats["stalls"] == 1
+        assert stats["max_lag_ms"] >= 100
+        assert "Event loop blocked" in caplog.text
+        assert "block_loop" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_debug_flags_blocking_io(self, caplog, tmp_path):
+        """In debug mode blocking I/O in a coroutine is counted and logged once per site."""
+        monitor = EventLoopMonitor(stall_threshold_seconds=10.0, debug=True)
+        monitor.start()
+        try:
+            with caplog.at_level(logging.WARNING, logger="anonymization"):
+                for _ in range(2):
+                    (tmp_path / "note.txt").write_text("blocking")
+                await asyncio.to_thread((tmp_path / "other.txt").write_text, "threaded")
+        finally:
+            await monitor.stop()
+
+        assert monitor.stats()["sync_io_calls"] == 2
+        assert caplog.text.count("Blocking open call") == 1
+        assert "test_debug_flags_blocking_io" in caplog.text